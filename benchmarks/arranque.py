@@ -0,0 +1,86 @@
+"""
+Mide el tiempo de importación de cada página en un proceso nuevo.
+
+    python benchmarks/arranque.py --repeticiones 5 -o arranque.json
+    python benchmarks/arranque.py --limite principal=0.05
+
+Cada medición arranca un intérprete limpio, importa streamlit (lo que ya paga
+cualquier página) y luego el módulo de la página. Se reporta la mediana del
+tiempo propio de la página. Con --limite el script termina con código 1 si
+alguna página supera su límite, para detectar regresiones en CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from paginas import PAGINAS  # noqa: E402
+
+MEDICION = """
+import time, sys
+t0 = time.perf_counter()
+import streamlit
+t1 = time.perf_counter()
+import {modulo}
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1, len(sys.modules))
+"""
+
+
+def medir(modulo, repeticiones):
+    base, propio, modulos = [], [], 0
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-c", MEDICION.format(modulo=modulo)],
+            cwd=RAIZ, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        base.append(float(salida[0]))
+        propio.append(float(salida[1]))
+        modulos = int(salida[2])
+    return {
+        "modulo": modulo,
+        "streamlit_s": statistics.median(base),
+        "pagina_s": statistics.median(propio),
+        "pagina_min_s": min(propio),
+        "modulos_cargados": modulos,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("-o", "--salida", help="Archivo JSON de resultados (por defecto, la salida estándar).")
+    parser.add_argument("--limite", action="append", default=[], metavar="PAGINA=SEGUNDOS",
+                        help="Tiempo máximo de importación de una página (por su módulo, p. ej. principal=0.05).")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    for nombre, (modulo, _) in PAGINAS.items():
+        resultados[nombre] = medir(modulo, args.repeticiones)
+
+    texto = json.dumps({"python": sys.version.split()[0], "paginas": resultados}, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    else:
+        print(texto)
+
+    excedidos = []
+    for limite in args.limite:
+        pagina, segundos = limite.split("=")
+        for r in resultados.values():
+            if r["modulo"].rsplit(".", 1)[-1] == pagina and r["pagina_s"] > float(segundos):
+                excedidos.append(f"{pagina}: {r['pagina_s']:.3f} s > {segundos} s")
+    for mensaje in excedidos:
+        print(f"Regresión de arranque: {mensaje}", file=sys.stderr)
+    return 1 if excedidos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
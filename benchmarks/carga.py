@@ -0,0 +1,292 @@
+"""
+Prueba de carga de la aplicación completa con usuarios simultáneos.
+
+    python benchmarks/carga.py --usuarios 1,4,16,32 --visitas 2 --filas 5000 -o carga.json
+
+Cada usuario simulado abre una sesión de Streamlit sin navegador (AppTest) y
+recorre todas las páginas como lo haría una persona: la portada, Visualización
+con un archivo de aumentos generado con data_example/gen_data.py (cambiando la
+agrupación de los gráficos), Gráficos Interactivos (guarda un registro y simula
+escenarios), Vacaciones y Liquidacion (llena y envía cada formulario). Las
+tasas salen de un BCV de prueba local.
+
+Cada cantidad de usuarios corre en un proceso nuevo, como un pod recién
+iniciado. Se reporta:
+
+- latencia de cada ejecución del script (p50/p95/p99, en total y por paso),
+- memoria: incremento de la memoria residente del proceso por sesión viva,
+  medido con todas las sesiones del nivel abiertas (incluye las cachés que
+  llenan, igual que en producción),
+- rendimiento: ejecuciones y visitas completas por segundo,
+- errores: excepciones mostradas por la aplicación.
+
+Como AppTest no puede subir archivos, `st.file_uploader` se reemplaza en este
+proceso por uno que devuelve el CSV asignado a la sesión; el resto de la
+página corre igual. AppTest tampoco está pensado para sesiones en paralelo:
+en cada ejecución crea y borra el Runtime del proceso, parcha la
+configuración y compila de nuevo el script. `preparar_apptest` fija esas
+piezas una sola vez, como las tiene el servidor real (probado con Streamlit 1.65).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.join(RAIZ, "data_example"))
+
+from calculadora.fuentes import ServidorBCVPrueba  # noqa: E402
+
+# Clave de session_state con la ruta del CSV que "sube" la sesión
+CLAVE_ARCHIVO = "_carga_archivo"
+
+
+def memoria_mb():
+    """Memoria residente actual del proceso en MB (en Linux; si no, el pico)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except OSError:
+        import resource
+
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / 1024 ** 2 if sys.platform == "darwin" else pico / 1024
+
+
+def percentiles(valores):
+    import numpy as np
+
+    if not valores:
+        return {}
+    p50, p95, p99 = np.percentile(valores, [50, 95, 99])
+    return {"ejecuciones": len(valores), "p50_ms": p50 * 1000, "p95_ms": p95 * 1000,
+            "p99_ms": p99 * 1000, "max_ms": max(valores) * 1000}
+
+
+def reemplazar_file_uploader():
+    """Hace que `st.file_uploader` devuelva el archivo de la sesión en lugar de esperar una subida."""
+    import streamlit as st
+
+    from paginas.comun import ArchivoEjemplo
+
+    def file_uploader(label, *args, key=None, **kwargs):
+        ruta = st.session_state.get(CLAVE_ARCHIVO)
+        # Solo se "sube" el CSV de aumentos; el historial de tasas (con key) queda vacío
+        if key is not None or ruta is None:
+            return None
+        with open(ruta, "rb") as f:
+            return ArchivoEjemplo(f.read(), os.path.basename(ruta))
+
+    st.file_uploader = file_uploader
+
+
+def preparar_apptest():
+    """Runtime, configuración y caché de scripts compartidos por todas las sesiones del proceso."""
+    from contextlib import nullcontext
+    from unittest.mock import MagicMock
+
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.testing.v1 import app_test
+    from streamlit.testing.v1.util import patch_config_options
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = app_test.DataframeSourceManager()
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    # AppTest asigna y borra `Runtime._instance` en cada ejecución: se le da una subclase para que no toque el real
+    app_test.Runtime = type("RuntimeCarga", (Runtime,), {})
+    script_cache = app_test.ScriptCache()
+    app_test.ScriptCache = lambda: script_cache
+    # Se guarda la referencia: si el contexto se recolecta, el parche se deshace
+    preparar_apptest.configuracion = patch_config_options({"global.appTest": True})
+    preparar_apptest.configuracion.__enter__()
+    app_test.patch_config_options = lambda opciones: nullcontext()
+
+
+def boton(at, etiqueta):
+    return next(b for b in at.button if b.label == etiqueta)
+
+
+def visita(at, azar, archivo):
+    """Pasos de una visita: (nombre, función que prepara los widgets antes de ejecutar)."""
+    def ir(pagina):
+        return lambda: at.sidebar.selectbox[0].set_value(pagina)
+
+    def agrupar():
+        # Si el selector no está (la página falló o cambió) lanza KeyError: el paso se
+        # cuenta como error y no se mide como una ejecución más
+        selector = at.selectbox(key="agrupar_graficos")
+        selector.set_value(selector.options[-1])
+
+    def guardar_registro():
+        at.text_input(key="form_nombre").input(f"Empleado {azar.randint(1, 500)}")
+        at.number_input(key="form_salario").set_value(float(azar.randint(2_000, 20_000)))
+        at.number_input(key="form_bono").set_value(float(azar.randint(0, 2_000)))
+        at.number_input(key="form_aumento").set_value(float(azar.randint(1, 30)))
+        boton(at, "Guardar Datos").click()
+
+    def simular():
+        at.number_input(key="sim_escenarios").set_value(azar.choice([50, 200, 500]))
+        at.button(key="sim_boton").click()
+
+    def vacaciones():
+        at.number_input(key="salario_mensual").set_value(float(azar.randint(2_000, 20_000)))
+        boton(at, "Calcular Vacaciones").click()
+
+    def liquidacion():
+        at.number_input(key="liq_salario_base").set_value(float(azar.randint(2_000, 20_000)))
+        at.number_input(key="liq_bono_promedio").set_value(float(azar.randint(0, 2_000)))
+        at.number_input(key="liq_vacaciones_pendientes").set_value(azar.randint(0, 30))
+        boton(at, "Calcular Liquidación").click()
+
+    at.session_state[CLAVE_ARCHIVO] = archivo
+    return [
+        ("Principal", lambda: None),
+        ("Visualización", ir("Visualización")),
+        ("Visualización/agrupar", agrupar),
+        ("Gráficos Interactivos", ir("Gráficos Interactivos")),
+        ("Gráficos Interactivos/guardar", guardar_registro),
+        ("Gráficos Interactivos/simular", simular),
+        ("Vacaciones", ir("Vacaciones")),
+        ("Vacaciones/calcular", vacaciones),
+        ("Liquidacion", ir("Liquidacion")),
+        ("Liquidacion/calcular", liquidacion),
+    ]
+
+
+def nivel(usuarios, visitas, archivos, semilla, timeout):
+    """
+    Corre `usuarios` hilos que hacen `visitas` visitas cada uno, en el proceso
+    actual. Devuelve latencias, memoria, rendimiento y errores del nivel.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(RAIZ)
+    preparar_apptest()
+    reemplazar_file_uploader()
+    script = os.path.join(RAIZ, "app.py")
+
+    def sesion(azar, latencias, errores):
+        at = AppTest.from_file(script, default_timeout=timeout)
+        for paso, preparar in visita(at, azar, azar.choice(archivos)):
+            try:
+                preparar()
+                inicio = time.perf_counter()
+                at.run()
+                latencias.append((paso, time.perf_counter() - inicio))
+                if at.exception:
+                    errores.append(f"{paso}: {at.exception[0].message}")
+            except Exception as e:  # noqa: BLE001 - se reporta y la visita sigue
+                errores.append(f"{paso}: {type(e).__name__}: {e}")
+        return at
+
+    # Visita previa: importa las páginas y llena las cachés del proceso, como el primer usuario de un pod
+    sesion(random.Random(semilla), [], [])
+    base = memoria_mb()
+
+    latencias, errores, sesiones = [], [], []
+    barrera = threading.Barrier(usuarios + 1)
+
+    def usuario(i):
+        azar = random.Random(semilla * 1000 + i + 1)
+        barrera.wait()
+        for _ in range(visitas):
+            sesiones.append(sesion(azar, latencias, errores))
+
+    hilos = [threading.Thread(target=usuario, args=(i,)) for i in range(usuarios)]
+    for hilo in hilos:
+        hilo.start()
+    barrera.wait()
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+    # Todas las sesiones del nivel siguen abiertas: la diferencia es lo que ocupan
+    memoria = memoria_mb()
+
+    pasos = {}
+    for paso, duracion in latencias:
+        pasos.setdefault(paso, []).append(duracion)
+    return {
+        "usuarios": usuarios,
+        "visitas": len(sesiones),
+        "segundos": segundos,
+        "ejecuciones_por_s": len(latencias) / segundos,
+        "visitas_por_s": len(sesiones) / segundos,
+        "latencia": percentiles([d for _, d in latencias]),
+        "pasos": {paso: percentiles(valores) for paso, valores in pasos.items()},
+        "memoria_base_mb": base,
+        "memoria_final_mb": memoria,
+        "memoria_por_sesion_mb": (memoria - base) / max(len(sesiones), 1),
+        "errores": len(errores),
+        "primeros_errores": errores[:5],
+    }
+
+
+def generar_archivos(directorio, cantidad, filas, semilla):
+    from gen_data import generar_aumentos
+
+    rutas = []
+    for i in range(cantidad):
+        ruta = os.path.join(directorio, f"aumentos_{i}.csv")
+        generar_aumentos(filas, max(filas // 10, 1), semilla=semilla + i).to_csv(ruta, index=False)
+        rutas.append(ruta)
+    return rutas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", default="1,4,16,32", help="Usuarios simultáneos por nivel, separados por coma.")
+    parser.add_argument("--visitas", type=int, default=2, help="Visitas completas que hace cada usuario.")
+    parser.add_argument("--filas", type=int, default=5_000, help="Filas de cada archivo de aumentos subido.")
+    parser.add_argument("--archivos", type=int, default=4,
+                        help="Archivos distintos que se reparten entre las sesiones (iguales comparten la caché).")
+    parser.add_argument("--timeout", type=float, default=120, help="Segundos máximos por ejecución del script.")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("-o", "--salida", help="Archivo JSON de resultados (por defecto, la salida estándar).")
+    args = parser.parse_args(argv)
+
+    resultados = []
+    with tempfile.TemporaryDirectory() as directorio, ServidorBCVPrueba() as bcv:
+        archivos = generar_archivos(directorio, args.archivos, args.filas, args.semilla)
+        # Los procesos de cada nivel heredan la configuración: tasas del BCV local y cachés en la carpeta temporal
+        os.environ.update({
+            "CALCULADORA_FUENTE_TASAS": bcv.url,
+            "CALCULADORA_RESPALDO_TASAS": os.path.join(directorio, "tasas.json"),
+            "CALCULADORA_HISTORIAL_TASAS": os.path.join(directorio, "historial.sqlite"),
+            "CALCULADORA_CACHE_DIR": os.path.join(directorio, "cache"),
+        })
+        contexto = multiprocessing.get_context("spawn")
+        for usuarios in [int(u) for u in args.usuarios.split(",") if u]:
+            peticiones = bcv.peticiones
+            with contexto.Pool(1) as pool:
+                r = pool.apply(nivel, (usuarios, args.visitas, archivos, args.semilla, args.timeout))
+            r["consultas_bcv"] = bcv.peticiones - peticiones
+            resultados.append(r)
+            lat = r["latencia"]
+            print(f"{usuarios:>4} usuarios  p50 {lat['p50_ms']:8.0f} ms  p95 {lat['p95_ms']:8.0f} ms  "
+                  f"p99 {lat['p99_ms']:8.0f} ms  {r['ejecuciones_por_s']:6.1f} ejec/s  "
+                  f"{r['memoria_por_sesion_mb']:6.1f} MB/sesión  {r['errores']} errores", file=sys.stderr)
+
+    texto = json.dumps({"python": sys.version.split()[0], "filas": args.filas, "resultados": resultados},
+                       indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    else:
+        print(texto)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Prueba de carga de los recursos compartidos entre sesiones.
+
+    python benchmarks/compartido.py --usuarios 1,2,4,8,16,32 --replicas 2 -o compartido.json
+
+Cada sesión simulada hace lo mismo que una visita a Visualización: pide las
+tasas (a un BCV de prueba local), procesa el mismo archivo de aumentos
+(validación, columnas derivadas y gráficos) y lee la imagen de la portada.
+Para cada cantidad de usuarios concurrentes se compara:
+
+- sin_compartir: cada sesión consulta al BCV y procesa el archivo por su cuenta,
+- compartido: las sesiones de una réplica comparten el proveedor de tasas, la
+  caché de cargas y la imagen, y las réplicas comparten la tasa por un servidor
+  compatible con Redis (`ServidorRedisPrueba`).
+
+Se reporta el tiempo de CPU del proceso por sesión, el tiempo total y las
+consultas al BCV. Con recursos compartidos la CPU por sesión debe bajar a
+medida que crecen los usuarios, porque el trabajo se hace una vez por réplica.
+"""
+import argparse
+import functools
+import io
+import json
+import os
+import sys
+import threading
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.join(RAIZ, "data_example"))
+
+import pandas as pd  # noqa: E402
+
+from gen_data import generar_aumentos  # noqa: E402
+from calculadora.cache_cargas import CacheCargas, clave_carga  # noqa: E402
+from calculadora.compartido import BackendRedis, CacheCompartida, FuenteCompartida, ServidorRedisPrueba  # noqa: E402
+from calculadora.esquema import validar  # noqa: E402
+from calculadora.fuentes import FuenteBCV, ServidorBCVPrueba  # noqa: E402
+from calculadora.ingesta import enriquecer  # noqa: E402
+from calculadora.tasas import ProveedorTasas  # noqa: E402
+from paginas.principal import RUTA_IMAGEN  # noqa: E402
+from paginas.visualizacion import graficos_visualizacion  # noqa: E402
+
+
+def leer_imagen():
+    with open(os.path.join(RAIZ, RUTA_IMAGEN), "rb") as f:
+        return f.read()
+
+
+def procesar(contenido, dolar, euro):
+    datos = enriquecer(validar(pd.read_csv(io.BytesIO(contenido))).validos, dolar, euro)
+    return {"datos": datos, "graficos": graficos_visualizacion(datos)}
+
+
+class Replica:
+    """Recursos de un proceso del servidor; sin compartir se crean de nuevo en cada sesión."""
+
+    def __init__(self, url_bcv, compartir, cache_tasas=None):
+        self.url_bcv = url_bcv
+        self.compartir = compartir
+        self.cache_tasas = cache_tasas
+        self.proveedor = self._proveedor() if compartir else None
+        self.cache = CacheCargas(directorio=None) if compartir else None
+        self.imagen = functools.lru_cache(maxsize=1)(leer_imagen) if compartir else leer_imagen
+
+    def _proveedor(self):
+        fuente = FuenteBCV(url=self.url_bcv)
+        if self.cache_tasas is not None:
+            fuente = FuenteCompartida(fuente, self.cache_tasas, 600)
+        return ProveedorTasas(obtener=fuente, ttl=600, ruta_respaldo=None)
+
+    def sesion(self, contenido):
+        dolar, euro = (self.proveedor or self._proveedor()).obtener()
+        if self.cache is None:
+            procesar(contenido, dolar, euro)
+        else:
+            self.cache.obtener_o_calcular(clave_carga(contenido, dolar, euro),
+                                          lambda: procesar(contenido, dolar, euro))
+        self.imagen()
+
+
+def ronda(usuarios, replicas, contenido, bcv, url_redis, compartir):
+    """Ejecuta `usuarios` sesiones a la vez repartidas entre las réplicas, con cachés vacías."""
+    cache_tasas = None
+    if compartir:
+        backend = BackendRedis(url_redis)
+        backend.borrar(FuenteCompartida.CLAVE)
+        cache_tasas = CacheCompartida(backend)
+    grupo = [Replica(bcv.url, compartir, cache_tasas) for _ in range(replicas)]
+    barrera = threading.Barrier(usuarios + 1)
+
+    def usuario(i):
+        barrera.wait()
+        grupo[i % replicas].sesion(contenido)
+
+    hilos = [threading.Thread(target=usuario, args=(i,)) for i in range(usuarios)]
+    for hilo in hilos:
+        hilo.start()
+    peticiones = bcv.peticiones
+    cpu = time.process_time()
+    inicio = time.perf_counter()
+    barrera.wait()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+    cpu = time.process_time() - cpu
+    return {
+        "modo": "compartido" if compartir else "sin_compartir",
+        "usuarios": usuarios,
+        "replicas": replicas,
+        "segundos": segundos,
+        "cpu_s": cpu,
+        "cpu_por_sesion_ms": cpu / usuarios * 1000,
+        "consultas_bcv": bcv.peticiones - peticiones,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", default="1,2,4,8,16,32", help="Usuarios concurrentes, separados por coma.")
+    parser.add_argument("--replicas", type=int, default=2, help="Réplicas simuladas que comparten la tasa.")
+    parser.add_argument("--filas", type=int, default=5_000, help="Filas del archivo que procesa cada sesión.")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("-o", "--salida", help="Archivo JSON de resultados (por defecto, la salida estándar).")
+    args = parser.parse_args(argv)
+
+    contenido = generar_aumentos(args.filas, max(args.filas // 10, 1), semilla=args.semilla).to_csv(index=False).encode("utf-8")
+    resultados = []
+    with ServidorBCVPrueba() as bcv, ServidorRedisPrueba() as redis:
+        # Una ronda previa para que los imports y cachés de las librerías no cuenten en la primera medición
+        ronda(1, 1, contenido, bcv, redis.url, False)
+        for usuarios in [int(u) for u in args.usuarios.split(",") if u]:
+            for compartir in (False, True):
+                r = ronda(usuarios, min(args.replicas, usuarios), contenido, bcv, redis.url, compartir)
+                resultados.append(r)
+                print(f"{r['modo']:>14} {usuarios:>4} usuarios {r['cpu_por_sesion_ms']:10.1f} ms CPU/sesión "
+                      f"{r['segundos']:8.2f} s {r['consultas_bcv']:>4} consultas BCV", file=sys.stderr)
+
+    texto = json.dumps({"python": sys.version.split()[0], "filas": args.filas, "resultados": resultados},
+                       indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    else:
+        print(texto)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Benchmarks de los cálculos y de la generación de gráficos.
+
+    python benchmarks/suite.py -o resultados.json
+    python benchmarks/suite.py --tamanos 1000,100000 --repeticiones 3
+
+Para cada tamaño se genera una nómina sintética con data_example/gen_data.py y se
+mide cada etapa: lectura del CSV, validación del esquema (con 1% de filas
+inválidas), columnas derivadas, conversión con el historial
+de tasas, lectura por bloques, gráficos, exportación a HTML, calendario de
+vacaciones, liquidación/vacaciones por lotes, simulación de escenarios y
+proyección de liquidaciones por escenario (en serie y con --procesos procesos,
+para ver cuánto escala el reparto en el pool). El resultado es un JSON con el tiempo, las filas por segundo y el pico de memoria
+(tracemalloc) de cada etapa, para poder comparar entre versiones.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.join(RAIZ, "data_example"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from gen_data import generar_aumentos  # noqa: E402
+from calculadora.esquema import validar  # noqa: E402
+from calculadora.historial_tasas import HistorialTasas, tasas_por_fecha  # noqa: E402
+from calculadora.ingesta import enriquecer, ingerir_csv  # noqa: E402
+from calculadora.motor import (  # noqa: E402
+    calcular_liquidacion, calcular_liquidacion_lote, calcular_vacaciones_lote, calcular_vacaciones_pago,
+)
+from calculadora.calendario import construir_calendarios  # noqa: E402
+from calculadora.escenarios import Escenario, proyectar_liquidaciones  # noqa: E402
+from calculadora.simulacion import generar_trayectorias, simular_bandas  # noqa: E402
+
+
+TAMANOS = [1_000, 100_000, 1_000_000, 10_000_000]
+DOLAR, EURO = 36.5, 39.8
+
+
+def medir(funcion, repeticiones, memoria):
+    """Mejor tiempo de `repeticiones` ejecuciones y, opcionalmente, el pico de memoria de una más."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        funcion()
+        pico = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        tracemalloc.stop()
+    return min(tiempos), pico
+
+
+def historial_sintetico(desde='2023-01-01', hasta='2025-12-31'):
+    """Historial en memoria con una tasa diaria creciente."""
+    fechas = pd.date_range(desde, hasta)
+    historial = HistorialTasas(":memory:")
+    historial.importar(pd.DataFrame({
+        "fecha": fechas,
+        "dolar": np.linspace(20, 60, len(fechas)),
+        "euro": np.linspace(22, 66, len(fechas)),
+    }))
+    return historial
+
+
+def nomina_sintetica(filas, semilla):
+    """Fechas de ingreso/egreso y montos para los cálculos de liquidación."""
+    rng = np.random.default_rng(semilla)
+    ingreso = np.datetime64('2000-01-01') + rng.integers(0, 9000, filas).astype('timedelta64[D]')
+    egreso = ingreso + rng.integers(0, 5000, filas).astype('timedelta64[D]')
+    return {
+        "ingreso": ingreso,
+        "egreso": egreso,
+        "base": rng.uniform(100, 5000, filas),
+        "bono": rng.uniform(0, 500, filas),
+        "pendientes": rng.integers(0, 30, filas),
+        "adelanto": rng.uniform(0, 100, filas),
+    }
+
+
+def aumentos_con_errores(df, semilla, proporcion=0.01):
+    """Copia de los aumentos como texto (igual que al leer un CSV sucio) con una proporción de valores inválidos."""
+    rng = np.random.default_rng(semilla)
+    sucio = df.astype({"Empleado": "object", "Salario_Actual": "object", "Fecha_Aumento": "str"})
+    for columna, valor in (("Salario_Actual", "n/d"), ("Fecha_Aumento", "2025-02-30"), ("Empleado", " ")):
+        sucio.loc[rng.random(len(sucio)) < proporcion / 3, columna] = valor
+    return sucio.drop(columns=["Monto_Aumento"])
+
+
+def verificar_motor(filas=2_000, semilla=0):
+    """Comprueba que las versiones escalar y por lotes del motor den el mismo resultado."""
+    nomina = nomina_sintetica(filas, semilla)
+    hoy = date(2026, 1, 1)
+    lote_liq = calcular_liquidacion_lote(nomina["ingreso"], nomina["egreso"], nomina["base"], nomina["bono"],
+                                         nomina["pendientes"], nomina["adelanto"])
+    lote_vac = calcular_vacaciones_lote(nomina["base"], nomina["ingreso"], hoy=hoy)
+    for i in range(filas):
+        ingreso = nomina["ingreso"][i].astype(date)
+        egreso = nomina["egreso"][i].astype(date)
+        liq = calcular_liquidacion(ingreso, egreso, nomina["base"][i], nomina["bono"][i],
+                                   int(nomina["pendientes"][i]), nomina["adelanto"][i])
+        if not all(np.isclose(liq[c], lote_liq.at[i, c]) for c in liq):
+            return False
+        vac = calcular_vacaciones_pago(nomina["base"][i], ingreso, hoy=hoy)
+        esperado = lote_vac.loc[i, ["antiguedad_anos", "dias_vacaciones", "monto_bono", "pago_total"]]
+        if not np.allclose(vac, esperado.astype(float)):
+            return False
+    return True
+
+
+def casos(filas, args, historial):
+    """Etapas a medir para un tamaño: lista de (nombre, función, filas procesadas)."""
+    df = generar_aumentos(filas, max(min(filas // 4, args.empleados), 1), args.desde, args.hasta, args.semilla)
+    csv = df.to_csv(index=False).encode("utf-8")
+    sin_fechas = df.drop(columns=["Fecha_Aumento"])
+    nomina = nomina_sintetica(filas, args.semilla)
+    sucio = aumentos_con_errores(df, args.semilla)
+
+    lista = [
+        ("lectura_csv", lambda: pd.read_csv(io.BytesIO(csv)), filas),
+        ("validacion_esquema", lambda: validar(sucio), filas),
+        ("columnas_derivadas", lambda: enriquecer(sin_fechas.copy(), DOLAR, EURO), filas),
+        ("conversion_tasas", lambda: tasas_por_fecha(df["Fecha_Aumento"], historial, DOLAR, EURO), filas),
+        ("ingesta_por_bloques", lambda: ingerir_csv(io.BytesIO(csv), DOLAR, EURO, historial), filas),
+        ("liquidacion_lote", lambda: calcular_liquidacion_lote(
+            nomina["ingreso"], nomina["egreso"], nomina["base"], nomina["bono"],
+            nomina["pendientes"], nomina["adelanto"]), filas),
+        ("vacaciones_lote", lambda: calcular_vacaciones_lote(nomina["base"], nomina["ingreso"]), filas),
+    ]
+
+    if filas <= args.max_filas_graficos:
+        from paginas.visualizacion import graficos_visualizacion
+
+        enriquecido = enriquecer(df.copy(), DOLAR, EURO, historial)
+        figuras = graficos_visualizacion(enriquecido)
+        lista += [
+            ("graficos", lambda: graficos_visualizacion(enriquecido), filas),
+            ("exportar_html", lambda: [f.to_html() for f in figuras[:2] if f is not None], filas),
+        ]
+    return lista
+
+
+def version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", default=",".join(map(str, TAMANOS)),
+                        help="Filas a generar, separadas por coma.")
+    parser.add_argument("--repeticiones", type=int, default=1)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--empleados", type=int, default=1_000,
+                        help="Máximo de empleados distintos (cada uno recibe varios aumentos).")
+    parser.add_argument("--desde", default='2024-03-01', help="Primera fecha de aumento de los datos generados.")
+    parser.add_argument("--hasta", default='2025-08-29', help="Última fecha de aumento de los datos generados.")
+    parser.add_argument("--max-filas-graficos", type=int, default=100_000,
+                        help="Los gráficos y su exportación solo se miden hasta este tamaño.")
+    parser.add_argument("--dias-calendario", type=int, default=5 * 365,
+                        help="Días del rango de vacaciones para medir el calendario.")
+    parser.add_argument("--filas-escenarios", type=int, default=500_000,
+                        help="Empleados de la nómina para la proyección de escenarios.")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1,
+                        help="Procesos para la proyección de escenarios en paralelo.")
+    parser.add_argument("--sin-memoria", action="store_true", help="No medir el pico de memoria.")
+    parser.add_argument("-o", "--salida", help="Archivo JSON de resultados (por defecto, la salida estándar).")
+    args = parser.parse_args(argv)
+
+    historial = historial_sintetico()
+    resultados = []
+
+    def registrar(caso, filas, funcion):
+        segundos, pico = medir(funcion, args.repeticiones, not args.sin_memoria)
+        resultados.append({
+            "caso": caso,
+            "filas": filas,
+            "segundos": segundos,
+            "filas_por_segundo": filas / segundos if segundos else None,
+            "memoria_pico_mb": pico,
+        })
+        print(f"{caso:>22} {filas:>12,} filas {segundos:10.4f} s", file=sys.stderr)
+
+    for filas in [int(t) for t in args.tamanos.split(",") if t]:
+        for caso, funcion, n in casos(filas, args, historial):
+            registrar(caso, n, funcion)
+
+    inicio = date(2025, 1, 1)
+    fin = inicio + timedelta(days=args.dias_calendario - 1)
+    registrar("calendario", args.dias_calendario, lambda: construir_calendarios(inicio, fin))
+
+    # 50 escenarios × 12 meses × 20k empleados
+    salarios = np.random.default_rng(args.semilla).uniform(100, 5000, 20_000)
+    trayectorias = generar_trayectorias(50, 12, semilla=args.semilla)
+    registrar("simulacion", 50 * 12 * len(salarios), lambda: simular_bandas(salarios, DOLAR, trayectorias))
+
+    # Liquidación de la nómina al cierre de cada mes de 2025, en serie y repartida en procesos
+    datos = nomina_sintetica(args.filas_escenarios, args.semilla)
+    nomina = pd.DataFrame({"Fecha_Ingreso": datos["ingreso"], "Salario_Base": datos["base"],
+                           "Bono_Promedio": datos["bono"], "Adelanto": datos["adelanto"]})
+    escenarios = [Escenario(f"2025-{mes:02d}", (pd.Timestamp(2025, mes, 1) + pd.offsets.MonthEnd()).date())
+                  for mes in range(1, 13)]
+    filas_escenarios = len(nomina) * len(escenarios)
+    registrar("escenarios_serie", filas_escenarios, lambda: proyectar_liquidaciones(nomina, escenarios, procesos=1))
+    registrar(f"escenarios_{args.procesos}_procesos", filas_escenarios,
+              lambda: proyectar_liquidaciones(nomina, escenarios, procesos=args.procesos))
+
+    informe = {
+        "version": version(),
+        "fecha": date.today().isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "motor_consistente": verificar_motor(),
+        # Tiempo en serie / tiempo con --procesos procesos
+        "escalado_escenarios": resultados[-2]["segundos"] / resultados[-1]["segundos"],
+        "resultados": resultados,
+    }
+    texto = json.dumps(informe, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    else:
+        print(texto)
+    return 0 if informe["motor_consistente"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
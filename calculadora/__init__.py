@@ -0,0 +1 @@
+"""Lógica de cálculo de la calculadora salarial, independiente de Streamlit."""
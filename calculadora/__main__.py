@@ -0,0 +1,6 @@
+import sys
+
+from calculadora.cli import main
+
+
+sys.exit(main())
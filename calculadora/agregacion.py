@@ -0,0 +1,128 @@
+"""
+Reducción de datos antes de graficar.
+
+Con miles de empleados, mandar cada fila a Plotly produce megabytes de JSON y
+un gráfico que el navegador no puede dibujar. Estas funciones dejan los datos
+en un tamaño razonable: los N empleados principales más un grupo "Otros",
+agrupación por bandas salariales o por cualquier columna (p. ej. Departamento),
+y reducción de series de tiempo con LTTB (Largest-Triangle-Three-Buckets), que
+conserva la forma de la curva con pocos puntos.
+"""
+import numpy as np
+import pandas as pd
+
+
+MAX_BARRAS = 30
+MAX_SERIES = 20
+MAX_PUNTOS_SERIE = 500
+# A partir de esta cantidad de puntos las líneas se dibujan con WebGL (Scattergl)
+UMBRAL_WEBGL = 5_000
+ETIQUETA_OTROS = "Otros"
+
+
+class Reduccion:
+    """Datos listos para graficar y cuántas filas entraron frente a cuántos puntos salen."""
+
+    def __init__(self, datos, filas_entrada, puntos):
+        self.datos = datos
+        self.filas_entrada = filas_entrada
+        self.puntos = puntos
+
+    @property
+    def webgl(self):
+        return self.puntos > UMBRAL_WEBGL
+
+    def descripcion(self):
+        return f"Se graficaron {self.puntos:,} puntos a partir de {self.filas_entrada:,} filas."
+
+
+def top_n_con_otros(df, grupo, valores, n=MAX_BARRAS, orden=None):
+    """
+    Promedio de `valores` por `grupo`, conservando los `n` grupos con mayor
+    `orden` (por defecto el primer valor) y reuniendo el resto en "Otros".
+    """
+    orden = orden or valores[0]
+    agregado = df.groupby(grupo, observed=True)[valores].agg(["sum", "count"])
+    promedio = pd.DataFrame({v: agregado[(v, "sum")] / agregado[(v, "count")] for v in valores})
+
+    if len(promedio) > n:
+        principales = promedio[orden].nlargest(n).index
+        resto = agregado.drop(index=principales)
+        otros = pd.DataFrame(
+            {v: [resto[(v, "sum")].sum() / resto[(v, "count")].sum()] for v in valores},
+            index=pd.Index([f"{ETIQUETA_OTROS} ({len(resto)})"], name=grupo),
+        )
+        promedio = pd.concat([promedio.loc[principales], otros])
+
+    return promedio.rename_axis(grupo).reset_index()
+
+
+def por_bandas(df, columna, valores, bandas=10):
+    """Promedio de `valores` por bandas de `columna` (bandas de igual ancho o límites explícitos)."""
+    banda = pd.cut(df[columna], bins=bandas)
+    agrupado = df.groupby(banda, observed=True)[valores].mean()
+    agrupado.index = [f"{i.left:,.0f} - {i.right:,.0f}" for i in agrupado.index]
+    return agrupado.rename_axis(f"Banda {columna}").reset_index()
+
+
+def lttb(x, y, umbral):
+    """
+    Índices de los puntos elegidos por Largest-Triangle-Three-Buckets.
+    `x` debe estar ordenado y ser numérico (las fechas se pasan como int64).
+    """
+    n = len(x)
+    if umbral >= n or umbral < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    # Límites de los cubos: el primero y el último punto quedan fijos
+    limites = np.linspace(1, n - 1, umbral - 1).astype("int64")
+    elegidos = np.empty(umbral, dtype="int64")
+    elegidos[0] = 0
+    elegidos[-1] = n - 1
+
+    anterior = 0
+    for i in range(umbral - 2):
+        inicio, fin = limites[i], limites[i + 1]
+        # Promedio del cubo siguiente (o el último punto)
+        sig_inicio, sig_fin = fin, limites[i + 2] if i + 2 < len(limites) else n
+        px_sig = x[sig_inicio:sig_fin].mean() if sig_fin > sig_inicio else x[-1]
+        py_sig = y[sig_inicio:sig_fin].mean() if sig_fin > sig_inicio else y[-1]
+
+        areas = np.abs(
+            (x[anterior] - px_sig) * (y[inicio:fin] - y[anterior])
+            - (x[anterior] - x[inicio:fin]) * (py_sig - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(areas)) if fin > inicio else inicio
+        elegidos[i + 1] = anterior
+    return elegidos
+
+
+def reducir_series(df, x, y, serie=None, max_series=MAX_SERIES, max_puntos=MAX_PUNTOS_SERIE, ordenado=False):
+    """
+    Prepara un gráfico de líneas: conserva las `max_series` series con mayor `y`
+    promedio, reúne el resto en "Otros" (promedio por fecha) y reduce cada serie
+    a `max_puntos` con LTTB. Con `ordenado=True` se asume que cada serie ya viene
+    ordenada por `x` y no se vuelve a ordenar. Devuelve una Reduccion.
+    """
+    filas = len(df)
+    datos = df[[x, y] + ([serie] if serie else [])].dropna(subset=[x, y])
+
+    if serie and datos[serie].nunique() > max_series:
+        principales = datos.groupby(serie, observed=True)[y].mean().nlargest(max_series).index
+        es_principal = datos[serie].isin(principales)
+        otros = datos[~es_principal].groupby(x, as_index=False)[y].mean()
+        otros[serie] = f"{ETIQUETA_OTROS} ({datos.loc[~es_principal, serie].nunique()})"
+        datos = pd.concat([datos[es_principal].astype({serie: str}), otros], ignore_index=True)
+
+    partes = []
+    grupos = datos.groupby(serie, observed=True, sort=False) if serie else [(None, datos)]
+    for _, grupo in grupos:
+        # El grupo "Otros" sale de un groupby por `x`, así que también queda ordenado
+        grupo = grupo if ordenado else grupo.sort_values(x, kind="stable")
+        eje = grupo[x].to_numpy()
+        eje = eje.astype("datetime64[ns]").astype("int64") if np.issubdtype(eje.dtype, np.datetime64) else eje
+        partes.append(grupo.iloc[lttb(eje, grupo[y].to_numpy(), max_puntos)])
+    datos = pd.concat(partes, ignore_index=True) if partes else datos
+    return Reduccion(datos, filas, len(datos))
@@ -0,0 +1,109 @@
+"""
+Antigüedad y días de beneficio compartidos por vacaciones y liquidación.
+
+La antigüedad se cuenta en años calendario exactos: un año se cumple en el
+aniversario de la fecha de ingreso, no cada 365 días, así que los años
+bisiestos no adelantan el aniversario. Quien ingresó un 29 de febrero cumple
+el año el 1 de marzo en los años no bisiestos.
+
+Los días de vacaciones, de bono vacacional y de prestaciones por año de
+antigüedad se precalculan en tablas al importar el módulo; los cálculos solo
+indexan la tabla con el arreglo de años. Todo acepta fechas sueltas o arreglos
+(columnas de una nómina) y devuelve arreglos de NumPy.
+"""
+import numpy as np
+import pandas as pd
+
+
+DIAS_MES = 30                 # días del mes para el salario diario
+DIAS_ANO_COMERCIAL = 360      # días del año para las fracciones anuales
+DIAS_VACACIONES_BASE = 15
+DIAS_BONO_VACACIONAL = 15
+DIAS_PRESTACIONES_ANO = 30
+FACTOR_SALARIO_INTEGRAL = 1.15
+# Último año de antigüedad de las tablas; años mayores usan esta fila
+MAX_ANOS = 100
+
+_ANOS = np.arange(MAX_ANOS + 1)
+# 15 días base + 1 día por cada año de antigüedad completo
+TABLA_DIAS_VACACIONES = DIAS_VACACIONES_BASE + _ANOS
+TABLA_DIAS_BONO = np.full(MAX_ANOS + 1, DIAS_BONO_VACACIONAL)
+# Días de prestaciones acumulados por los años completos (la fracción se suma aparte)
+TABLA_DIAS_PRESTACIONES = DIAS_PRESTACIONES_ANO * _ANOS
+for _tabla in (TABLA_DIAS_VACACIONES, TABLA_DIAS_BONO, TABLA_DIAS_PRESTACIONES):
+    _tabla.flags.writeable = False
+
+
+def dias(fechas):
+    """Convierte fechas (date, str, datetime64, Series) a un arreglo datetime64[D]."""
+    if isinstance(fechas, np.ndarray) and np.issubdtype(fechas.dtype, np.datetime64):
+        return fechas.astype("datetime64[D]", copy=False)
+    return np.asarray(pd.to_datetime(fechas), dtype="datetime64[D]")
+
+
+def _civil(dias_epoca):
+    """(año, mes, día) de días desde 1970-01-01, solo con aritmética entera (algoritmo de H. Hinnant)."""
+    z = dias_epoca + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    dia = doy - (153 * mp + 2) // 5 + 1
+    mes = np.where(mp < 10, mp + 3, mp - 9)
+    return yoe + era * 400 + (mes <= 2), mes, dia
+
+
+def _dias_epoca(ano, mes, dia):
+    """Inversa de `_civil`; un día fuera del mes (29 de febrero en año no bisiesto) pasa al mes siguiente."""
+    ano = ano - (mes <= 2)
+    era = ano // 400
+    yoe = ano - era * 400
+    doy = (153 * np.where(mes > 2, mes - 3, mes + 9) + 2) // 5 + dia - 1
+    return era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 719468
+
+
+def antiguedad(fechas_ingreso, fechas_corte):
+    """
+    Años calendario completos entre el ingreso y la fecha de corte, y días
+    transcurridos desde el último aniversario. Si el corte es anterior al
+    ingreso los años son negativos.
+    """
+    ingreso = dias(fechas_ingreso).astype("int64")
+    corte = dias(fechas_corte).astype("int64")
+    # Se trabaja con enteros: convertir datetime64 entre unidades es mucho más lento
+    ano_ingreso, mes_ingreso, dia_ingreso = _civil(ingreso)
+    ano_corte, mes_corte, dia_corte = _civil(corte)
+    # Se resta un año si en el año del corte aún no llega el mes y día del ingreso
+    anos = ano_corte - ano_ingreso - (mes_corte * 32 + dia_corte < mes_ingreso * 32 + dia_ingreso)
+    # El aniversario cae en el mismo mes y día del ingreso; un 29 de febrero pasa al 1 de marzo
+    aniversario = _dias_epoca(ano_ingreso + anos, mes_ingreso, dia_ingreso)
+    return anos, corte - aniversario
+
+
+def _fila(anos):
+    return np.clip(anos, 0, MAX_ANOS)
+
+
+def dias_vacaciones(anos):
+    """Días de vacaciones que corresponden a cada antigüedad en años."""
+    return TABLA_DIAS_VACACIONES[_fila(anos)]
+
+
+def dias_bono_vacacional(anos):
+    """Días de bono vacacional que corresponden a cada antigüedad en años."""
+    return TABLA_DIAS_BONO[_fila(anos)]
+
+
+def dias_prestaciones(anos, dias_restantes=0):
+    """Días de prestaciones acumulados: los de los años completos más la fracción en días."""
+    return TABLA_DIAS_PRESTACIONES[_fila(anos)] + np.maximum(dias_restantes, 0)
+
+
+def salario_diario(salario_mensual):
+    return np.asarray(salario_mensual, dtype="float64") / DIAS_MES
+
+
+def salario_integral(salario_base, bono_promedio=0.0):
+    """Salario mensual integral: salario base más bonos, por el factor de incidencia."""
+    return (np.asarray(salario_base, dtype="float64") + bono_promedio) * FACTOR_SALARIO_INTEGRAL
@@ -0,0 +1,255 @@
+"""
+Caché de archivos cargados, indexada por el hash de su contenido.
+
+Guarda el DataFrame ya enriquecido (y los objetos derivados, como los gráficos)
+para que volver a ejecutar la página con el mismo archivo y las mismas tasas sea
+una simple consulta. La memoria se limita por bytes, no por cantidad de entradas
+(los DataFrames y arreglos por su memoria, los gráficos por los arreglos de sus trazas):
+al pasarse del límite, las entradas menos usadas se bajan a Parquet en disco
+(solo los DataFrames; el resto se vuelve a calcular a partir de ellos).
+"""
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+MAX_BYTES_MEMORIA = int(os.environ.get("CALCULADORA_CACHE_MB", "256")) * 1024 * 1024
+MAX_BYTES_DISCO = int(os.environ.get("CALCULADORA_CACHE_DISCO_MB", "1024")) * 1024 * 1024
+DIRECTORIO_CACHE = os.environ.get(
+    "CALCULADORA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "calculadora_cache")
+)
+
+
+def clave_carga(contenido, *parametros):
+    """Clave a partir del contenido del archivo y de los parámetros que afectan el resultado (tasas, etc.)."""
+    h = hashlib.sha256()
+    vista = memoryview(contenido)
+    for i in range(0, len(vista), 1 << 20):
+        h.update(vista[i:i + (1 << 20)])
+    for p in parametros:
+        h.update(b"\0" + repr(p).encode("utf-8"))
+    return h.hexdigest()
+
+
+# Propiedades de las trazas que llevan los datos graficados; el estilo y el diseño pesan poco
+_ARREGLOS_TRAZA = ("x", "y", "z", "text", "hovertext", "customdata", "ids", "labels", "values", "lat", "lon")
+
+
+def _tamano_figura(fig):
+    """Bytes de los arreglos de las trazas de una figura de Plotly, sin serializarla."""
+    total = sys.getsizeof(fig)
+    for traza in fig.data:
+        for nombre in _ARREGLOS_TRAZA:
+            valor = getattr(traza, nombre, None)
+            if valor is None or isinstance(valor, str):
+                continue
+            arreglo = np.asarray(valor)
+            if arreglo.dtype == object:
+                total += int(pd.Series(arreglo.ravel()).memory_usage(deep=True, index=False))
+            else:
+                total += arreglo.nbytes
+    return total
+
+
+def _tamano_valor(valor):
+    """Bytes aproximados de un objeto guardado en una entrada."""
+    if isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(deep=True).sum())
+    if isinstance(valor, (pd.Series, pd.Index)):
+        return int(valor.memory_usage(deep=True))
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if hasattr(valor, "to_plotly_json"):
+        return _tamano_figura(valor)
+    if isinstance(valor, (tuple, list)):
+        return sys.getsizeof(valor) + sum(_tamano_valor(v) for v in valor)
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(_tamano_valor(v) for v in list(valor.values()))
+    if hasattr(valor, "__dict__"):
+        # Resultados propios (ResultadoIngesta, Reduccion, HistorialSalarial): la suma de sus atributos
+        return sys.getsizeof(valor) + sum(_tamano_valor(v) for v in list(vars(valor).values()))
+    return sys.getsizeof(valor)
+
+
+def _tamano(valores):
+    """Bytes aproximados de una entrada (dict {nombre: objeto})."""
+    # Copia de los valores: otra sesión puede estar agregando gráficos a la misma entrada
+    return sum(_tamano_valor(v) for v in list(valores.values()))
+
+
+class CacheCargas:
+    """LRU limitada por bytes con desborde a Parquet en disco."""
+
+    def __init__(self, max_bytes=MAX_BYTES_MEMORIA, directorio=DIRECTORIO_CACHE, max_bytes_disco=MAX_BYTES_DISCO):
+        self.max_bytes = max_bytes
+        self.directorio = directorio
+        self.max_bytes_disco = max_bytes_disco
+        self._entradas = OrderedDict()  # clave -> (valores, tamano)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._en_curso = {}  # clave -> Lock del cálculo en curso
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, clave):
+        """Devuelve el dict guardado para `clave`, o None."""
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return self._entradas[clave][0]
+        valores = self._leer_disco(clave)
+        if valores is None:
+            with self._lock:
+                self.fallos += 1
+            return None
+        with self._lock:
+            self.aciertos_disco += 1
+        self.guardar(clave, valores)
+        return valores
+
+    def obtener_o_calcular(self, clave, calcular):
+        """
+        Entrada de `clave` o, si no está, el resultado de `calcular()` (que se
+        guarda). Si varias sesiones cargan el mismo archivo a la vez, solo una
+        lo procesa y las demás esperan su resultado.
+        """
+        valores = self.obtener(clave)
+        if valores is not None:
+            return valores
+        with self._lock:
+            candado = self._en_curso.setdefault(clave, threading.Lock())
+        try:
+            with candado:
+                with self._lock:
+                    entrada = self._entradas.get(clave)
+                if entrada is not None:
+                    valores = entrada[0]
+                else:
+                    valores = calcular()
+                    self.guardar(clave, valores)
+        finally:
+            # Si `calcular` falla (archivo inválido) la clave no queda bloqueada
+            with self._lock:
+                self._en_curso.pop(clave, None)
+        return valores
+
+    def guardar(self, clave, valores):
+        """Guarda un dict {nombre: objeto}. Los DataFrames pueden bajarse a disco al desalojar."""
+        tamano = _tamano(valores)
+        desalojadas = []
+        with self._lock:
+            if clave in self._entradas:
+                self._bytes -= self._entradas.pop(clave)[1]
+            self._entradas[clave] = (valores, tamano)
+            self._bytes += tamano
+            while self._bytes > self.max_bytes and len(self._entradas) > 1:
+                vieja, (vals, tam) = self._entradas.popitem(last=False)
+                self._bytes -= tam
+                self.desalojos += 1
+                desalojadas.append((vieja, vals))
+        for vieja, vals in desalojadas:
+            self._escribir_disco(vieja, vals)
+
+    def estadisticas(self):
+        with self._lock:
+            return {
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "aciertos": self.aciertos,
+                "aciertos_disco": self.aciertos_disco,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+            }
+
+    def limpiar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+        if self.directorio:
+            shutil.rmtree(self.directorio, ignore_errors=True)
+
+    # --- Desborde a disco ---
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave)
+
+    def _escribir_disco(self, clave, valores):
+        if not self.directorio:
+            return
+        tablas = {n: v for n, v in list(valores.items()) if isinstance(v, pd.DataFrame)}
+        if not tablas:
+            return
+        ruta = self._ruta(clave)
+        temporal = f"{ruta}.tmp{threading.get_ident()}"
+        try:
+            os.makedirs(temporal, exist_ok=True)
+            for nombre, df in tablas.items():
+                df.to_parquet(os.path.join(temporal, f"{nombre}.parquet"), compression="zstd")
+            shutil.rmtree(ruta, ignore_errors=True)
+            os.replace(temporal, ruta)
+        except (ImportError, OSError, ValueError, TypeError, NotImplementedError):
+            # Sin pyarrow, sin espacio en disco o con columnas que Parquet no admite (objetos
+            # de tipos mezclados, que pyarrow rechaza con ArrowInvalid o ArrowTypeError): la
+            # entrada simplemente se pierde
+            shutil.rmtree(temporal, ignore_errors=True)
+            return
+        self._recortar_disco()
+
+    def _leer_disco(self, clave):
+        if not self.directorio:
+            return None
+        ruta = self._ruta(clave)
+        if not os.path.isdir(ruta):
+            return None
+        try:
+            valores = {
+                archivo[:-len(".parquet")]: pd.read_parquet(os.path.join(ruta, archivo))
+                for archivo in os.listdir(ruta) if archivo.endswith(".parquet")
+            }
+            os.utime(ruta)
+            return valores or None
+        except (ImportError, OSError, ValueError):
+            return None
+
+    def _recortar_disco(self):
+        """Borra las entradas en disco más antiguas hasta quedar bajo el límite."""
+        entradas = []
+        for nombre in os.listdir(self.directorio):
+            ruta = os.path.join(self.directorio, nombre)
+            if not os.path.isdir(ruta) or ".tmp" in nombre:
+                continue
+            try:
+                tamano = sum(os.path.getsize(os.path.join(ruta, a)) for a in os.listdir(ruta))
+                entradas.append((os.path.getmtime(ruta), tamano, ruta))
+            except OSError:
+                continue  # otra sesión la borró mientras se recorría
+        total = sum(t for _, t, _ in entradas)
+        for _, tamano, ruta in sorted(entradas):
+            if total <= self.max_bytes_disco:
+                break
+            shutil.rmtree(ruta, ignore_errors=True)
+            total -= tamano
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def cache_global():
+    """Caché única del proceso, compartida por todas las sesiones."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CacheCargas()
+        return _cache
@@ -0,0 +1,127 @@
+"""
+Calendario visual de vacaciones y conteo de días hábiles.
+
+Las rejillas de todos los meses se arman de una vez con aritmética de
+datetime64: cada mes es una matriz de 6 semanas × 7 días, y los días de
+vacaciones salen de comparar esa matriz con el rango pedido, sin recorrer día
+por día en Python. La misma función acepta varios empleados a la vez.
+"""
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+
+# Días de la semana en español
+DIAS_SEMANA = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+
+# Feriados nacionales de fecha fija (mes, día)
+FERIADOS_FIJOS = [
+    (1, 1),    # Año Nuevo
+    (4, 19),   # Declaración de la Independencia
+    (5, 1),    # Día del Trabajador
+    (6, 24),   # Batalla de Carabobo
+    (7, 5),    # Día de la Independencia
+    (7, 24),   # Natalicio del Libertador
+    (10, 12),  # Día de la Resistencia Indígena
+    (12, 24),  # Nochebuena
+    (12, 25),  # Navidad
+    (12, 31),  # Fin de año
+]
+
+# Archivo CSV opcional con una columna 'fecha' de feriados adicionales (Carnaval, Semana Santa, etc.)
+RUTA_FERIADOS = os.environ.get("CALCULADORA_FERIADOS", "")
+
+# Etiquetas de cada día: índice 0 = celda vacía, 1..31 = día normal, 32..62 = día de vacaciones
+_ETIQUETAS = np.array([''] + [str(d) for d in range(1, 32)] + [f"**{d}**" for d in range(1, 32)], dtype=object)
+
+_feriados_archivo = None
+
+
+def feriados(desde, hasta, adicionales=None):
+    """Feriados entre dos años (inclusive) como arreglo datetime64[D] ordenado."""
+    anios = np.arange(desde, hasta + 1)
+    fijos = [
+        np.datetime64(f"{anio:04d}-{mes:02d}-{dia:02d}", "D")
+        for anio in anios for mes, dia in FERIADOS_FIJOS
+    ]
+    extra = _leer_feriados() if adicionales is None else np.asarray(adicionales, dtype="datetime64[D]")
+    return np.unique(np.concatenate([np.array(fijos, dtype="datetime64[D]"), extra]))
+
+
+def _leer_feriados():
+    global _feriados_archivo
+    if _feriados_archivo is None:
+        if RUTA_FERIADOS and os.path.exists(RUTA_FERIADOS):
+            _feriados_archivo = np.asarray(pd.to_datetime(pd.read_csv(RUTA_FERIADOS)["fecha"]), dtype="datetime64[D]")
+        else:
+            _feriados_archivo = np.array([], dtype="datetime64[D]")
+    return _feriados_archivo
+
+
+def dias_habiles(fechas_inicio, fechas_fin, lista_feriados=None):
+    """
+    Días hábiles (lunes a viernes, sin feriados) entre inicio y fin, ambos inclusive.
+    Acepta fechas sueltas o arreglos para calcular varios empleados a la vez.
+    """
+    inicio = np.asarray(fechas_inicio, dtype="datetime64[D]")
+    fin = np.asarray(fechas_fin, dtype="datetime64[D]")
+    if lista_feriados is None:
+        anios = np.concatenate([np.ravel(inicio), np.ravel(fin)]).astype("datetime64[Y]").astype(int) + 1970
+        lista_feriados = feriados(int(anios.min()), int(anios.max())) if anios.size else []
+    return np.busday_count(inicio, fin + np.timedelta64(1, "D"), holidays=lista_feriados)
+
+
+def _rejillas(meses, inicios, fines):
+    """
+    Rejillas de 6×7 etiquetas para cada mes de `meses` (datetime64[M]), marcando
+    los días entre `inicios` y `fines` (uno por mes). Devuelve las etiquetas y la
+    cantidad de semanas que ocupa cada mes.
+    """
+    primero = meses.astype("datetime64[D]")
+    siguiente = (meses + 1).astype("datetime64[D]")
+    # 1970-01-01 fue jueves: (días + 3) % 7 da 0 para lunes
+    dia_semana = (primero.astype("int64") + 3) % 7
+    dias_mes = (siguiente - primero).astype("int64")
+
+    celdas = primero[:, None] - dia_semana[:, None] + np.arange(42)
+    en_mes = (celdas >= primero[:, None]) & (celdas < siguiente[:, None])
+    de_vacaciones = (celdas >= inicios[:, None]) & (celdas <= fines[:, None])
+
+    numero = (celdas - primero[:, None]).astype("int64") + 1
+    indice = np.where(en_mes, numero + np.where(de_vacaciones, 31, 0), 0)
+    semanas = -(-(dia_semana + dias_mes) // 7)
+    return _ETIQUETAS[indice], semanas
+
+
+def construir_calendarios_lote(fechas_inicio, fechas_fin):
+    """
+    Calendarios de varios empleados a la vez.
+    Devuelve una lista (una por empleado) de listas de (nombre del mes, DataFrame).
+    """
+    inicios = np.atleast_1d(np.asarray(fechas_inicio, dtype="datetime64[D]"))
+    fines = np.atleast_1d(np.asarray(fechas_fin, dtype="datetime64[D]"))
+    mes_inicio = inicios.astype("datetime64[M]")
+    cantidad = np.maximum((fines.astype("datetime64[M]") - mes_inicio).astype("int64") + 1, 0)
+
+    # Todos los pares (empleado, mes) en un solo arreglo
+    empleado = np.repeat(np.arange(inicios.size), cantidad)
+    desplazamiento = np.arange(cantidad.sum()) - np.repeat(np.cumsum(cantidad) - cantidad, cantidad)
+    meses = mes_inicio[empleado] + desplazamiento
+    etiquetas, semanas = _rejillas(meses, inicios[empleado], fines[empleado])
+
+    calendarios = [[] for _ in range(inicios.size)]
+    for i in range(meses.size):
+        nombre = meses[i].astype(date).strftime('%B %Y')
+        tabla = pd.DataFrame(etiquetas[i, :semanas[i] * 7].reshape(-1, 7), columns=DIAS_SEMANA)
+        calendarios[empleado[i]].append((nombre, tabla))
+    return calendarios
+
+
+def construir_calendarios(fecha_inicio, fecha_fin):
+    """
+    Devuelve una lista de (nombre del mes, DataFrame) con una tabla por mes entre
+    fecha_inicio y fecha_fin, con los días de vacaciones resaltados en negritas.
+    """
+    return construir_calendarios_lote([fecha_inicio], [fecha_fin])[0]
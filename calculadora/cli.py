@@ -0,0 +1,276 @@
+"""
+Modo por lotes de la calculadora, sin Streamlit.
+
+    python -m calculadora batch --mode liquidacion nomina.csv -o liquidacion.parquet
+    python -m calculadora batch --mode escenarios nomina.csv -o escenarios.parquet \
+        --escenario cierre=2025-12-31 --escenario bonos=2025-12-31:1.2 --procesos 4
+    python -m calculadora reportes --mode liquidacion nomina.csv -o reportes.zip
+
+Lee el archivo por bloques, aplica el cálculo elegido y escribe cada bloque en
+el archivo de salida (CSV, CSV gzip, Parquet, Arrow IPC o JSONL), así que la memoria usada depende del
+tamaño del bloque y no del tamaño de la nómina. `reportes` escribe en cambio un
+ZIP con el reporte HTML de cada empleado.
+
+En el modo aumentos las filas con valores inválidos no detienen el proceso: se
+cuentan y, con --rechazados, se escriben en un reporte aparte con su línea y motivo.
+
+Columnas de entrada por modo:
+  aumentos     Empleado, Salario_Actual, Aumento_(%) o Monto_Aumento, [Fecha_Aumento]
+  vacaciones   Empleado, Salario_Mensual, Fecha_Ingreso
+  liquidacion  Empleado, Fecha_Ingreso, Fecha_Egreso, Salario_Base,
+               [Bono_Promedio], [Dias_Vacaciones_Pendientes], [Adelanto]
+  escenarios   Empleado, Fecha_Ingreso, Salario_Base, [Bono_Promedio],
+               [Dias_Vacaciones_Pendientes], [Adelanto]
+
+El modo escenarios proyecta la liquidación de toda la nómina con cada fecha de
+egreso hipotética de --escenario (y un factor opcional sobre los bonos),
+repartiendo el cálculo en --procesos procesos. La nómina se lee completa; el
+resultado, una fila por escenario y empleado, se escribe por bloques.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+
+MODOS = ("aumentos", "vacaciones", "liquidacion", "escenarios")
+FORMATOS = ("csv", "csv.gz", "parquet", "arrow", "jsonl")
+EXTENSIONES = {".csv": "csv", ".gz": "csv.gz", ".parquet": "parquet", ".pq": "parquet", ".arrow": "arrow",
+               ".feather": "arrow", ".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl"}
+
+COLUMNAS_VACACIONES = ["Empleado", "Salario_Mensual", "Fecha_Ingreso"]
+COLUMNAS_LIQUIDACION = ["Empleado", "Fecha_Ingreso", "Fecha_Egreso", "Salario_Base"]
+COLUMNAS_ESCENARIOS = ["Empleado", "Fecha_Ingreso", "Salario_Base"]
+
+
+def _error(mensaje):
+    print(f"Error: {mensaje}", file=sys.stderr)
+    return 2
+
+
+def _formato(ruta, formato):
+    """Formato indicado o, si no, el que corresponde a la extensión (CSV por defecto)."""
+    return formato or EXTENSIONES.get(os.path.splitext(ruta)[1].lower(), "csv")
+
+
+def _tasas(args):
+    """Tasas de la línea de comandos o del proveedor compartido; NaN si no hay."""
+    if args.dolar and args.euro:
+        return args.dolar, args.euro
+    from calculadora.tasas import proveedor_global
+
+    proveedor = proveedor_global()
+    dolar_rate, euro_rate = proveedor.obtener()
+    if not dolar_rate or not euro_rate:
+        print(f"Aviso: {proveedor.ultimo_error}. Las columnas en USD/EUR quedarán vacías.", file=sys.stderr)
+        return float("nan"), float("nan")
+    return dolar_rate, euro_rate
+
+
+def _bloques(args, columnas_requeridas, fechas, tipos):
+    import pandas as pd
+
+    columnas = pd.read_csv(args.entrada, nrows=0).columns
+    faltantes = [c for c in columnas_requeridas if c not in columnas]
+    if faltantes:
+        raise ValueError(f"Faltan las columnas {faltantes} en '{args.entrada}'.")
+    tipos = {c: t for c, t in tipos.items() if c in columnas}
+    return pd.read_csv(args.entrada, dtype=tipos, parse_dates=[f for f in fechas if f in columnas],
+                       chunksize=args.bloque)
+
+
+def procesar_aumentos(args, dolar_rate, euro_rate):
+    from calculadora.exportacion import EscritorDatos
+    from calculadora.historial_tasas import historial_global
+    from calculadora.ingesta import bloques_validados, enriquecer
+
+    try:
+        historial = historial_global()
+    except (sqlite3.Error, OSError) as e:
+        # Sin historial (HOME de solo lectura, base bloqueada o dañada) se usa la tasa actual en todas las filas
+        print(f"Aviso: no se pudo abrir el historial de tasas ({e}). Se usará la tasa actual.", file=sys.stderr)
+        historial = None
+    ruta_rechazados = getattr(args, "rechazados", None)
+    escritor = EscritorDatos(ruta_rechazados, _formato(ruta_rechazados, None)) if ruta_rechazados else None
+    rechazadas = 0
+    try:
+        for validos, rechazados in bloques_validados(args.entrada, tamano_bloque=args.bloque):
+            if len(rechazados):
+                rechazadas += len(rechazados)
+                if escritor is not None:
+                    escritor.escribir(rechazados)
+            yield enriquecer(validos, dolar_rate, euro_rate, historial)
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
+    if rechazadas and not args.silencioso:
+        destino = f" (ver '{ruta_rechazados}')" if ruta_rechazados else "; usa --rechazados para obtener el detalle"
+        print(f"Aviso: {rechazadas:,} filas con valores inválidos se omitieron{destino}.", file=sys.stderr)
+
+
+def procesar_vacaciones(args, dolar_rate, euro_rate):
+    from calculadora.motor import calcular_vacaciones_lote
+
+    tipos = {"Empleado": "string", "Salario_Mensual": "float64"}
+    for bloque in _bloques(args, COLUMNAS_VACACIONES, ["Fecha_Ingreso"], tipos):
+        resultado = calcular_vacaciones_lote(bloque["Salario_Mensual"], bloque["Fecha_Ingreso"], hoy=args.fecha)
+        resultado.index = bloque.index
+        resultado["pago_total_usd"] = resultado["pago_total"] / dolar_rate
+        resultado["pago_total_eur"] = resultado["pago_total"] / euro_rate
+        yield bloque.join(resultado)
+
+
+def procesar_liquidacion(args, dolar_rate, euro_rate):
+    from calculadora.motor import calcular_liquidacion_lote
+
+    tipos = {"Empleado": "string", "Salario_Base": "float64", "Bono_Promedio": "float64",
+             "Dias_Vacaciones_Pendientes": "float64", "Adelanto": "float64"}
+    for bloque in _bloques(args, COLUMNAS_LIQUIDACION, ["Fecha_Ingreso", "Fecha_Egreso"], tipos):
+        resultado = calcular_liquidacion_lote(
+            bloque["Fecha_Ingreso"], bloque["Fecha_Egreso"], bloque["Salario_Base"],
+            bloque["Bono_Promedio"].fillna(0).to_numpy() if "Bono_Promedio" in bloque else 0.0,
+            bloque["Dias_Vacaciones_Pendientes"].fillna(0).to_numpy() if "Dias_Vacaciones_Pendientes" in bloque else 0,
+            bloque["Adelanto"].fillna(0).to_numpy() if "Adelanto" in bloque else 0.0,
+        )
+        resultado.index = bloque.index
+        resultado["total_neto_usd"] = resultado["total_neto"] / dolar_rate
+        resultado["total_neto_eur"] = resultado["total_neto"] / euro_rate
+        yield bloque[["Empleado", "Fecha_Ingreso", "Fecha_Egreso", "Salario_Base"]].join(resultado)
+
+
+def procesar_escenarios(args, dolar_rate, euro_rate):
+    import pandas as pd
+
+    from calculadora.escenarios import proyectar_liquidaciones
+
+    if not args.escenario:
+        raise ValueError("El modo escenarios necesita al menos un --escenario NOMBRE=AAAA-MM-DD[:FACTOR_BONO].")
+    tipos = {"Empleado": "string", "Salario_Base": "float64", "Bono_Promedio": "float64",
+             "Dias_Vacaciones_Pendientes": "float64", "Adelanto": "float64"}
+    # La proyección necesita la nómina completa en memoria compartida; la salida se escribe por bloques
+    nomina = pd.concat(_bloques(args, COLUMNAS_ESCENARIOS, ["Fecha_Ingreso"], tipos), ignore_index=True)
+    resultado = proyectar_liquidaciones(nomina, args.escenario, procesos=args.procesos)
+    for inicio in range(0, len(resultado), args.bloque):
+        bloque = resultado.iloc[inicio:inicio + args.bloque].copy()
+        bloque["total_neto_usd"] = bloque["total_neto"] / dolar_rate
+        bloque["total_neto_eur"] = bloque["total_neto"] / euro_rate
+        yield bloque
+
+
+PROCESOS = {
+    "aumentos": procesar_aumentos,
+    "vacaciones": procesar_vacaciones,
+    "liquidacion": procesar_liquidacion,
+    "escenarios": procesar_escenarios,
+}
+
+
+def batch(args):
+    from calculadora.exportacion import EscritorDatos
+
+    formato = _formato(args.salida, args.formato)
+    if not os.path.exists(args.entrada):
+        return _error(f"No existe el archivo '{args.entrada}'.")
+
+    inicio = time.perf_counter()
+    dolar_rate, euro_rate = _tasas(args)
+    escritor = EscritorDatos(args.salida, formato)
+    try:
+        for bloque in PROCESOS[args.mode](args, dolar_rate, euro_rate):
+            escritor.escribir(bloque)
+    except ValueError as e:
+        return _error(str(e))
+    finally:
+        escritor.cerrar()
+
+    segundos = time.perf_counter() - inicio
+    if not args.silencioso:
+        print(f"{escritor.filas:,} filas escritas en '{args.salida}' ({formato}) en {segundos:.1f} s.", file=sys.stderr)
+    return 0
+
+
+REPORTES = {
+    "vacaciones": "reportes_vacaciones_lote",
+    "liquidacion": "reportes_liquidacion_lote",
+}
+
+
+def reportes(args):
+    from calculadora import reportes as modulo_reportes
+
+    if not os.path.exists(args.entrada):
+        return _error(f"No existe el archivo '{args.entrada}'.")
+
+    inicio = time.perf_counter()
+    dolar_rate, euro_rate = _tasas(args)
+    generar = getattr(modulo_reportes, REPORTES[args.mode])
+    try:
+        cantidad = modulo_reportes.escribir_zip(
+            generar(PROCESOS[args.mode](args, dolar_rate, euro_rate), dolar_rate, euro_rate), args.salida)
+    except ValueError as e:
+        return _error(str(e))
+
+    segundos = time.perf_counter() - inicio
+    if not args.silencioso:
+        print(f"{cantidad:,} reportes escritos en '{args.salida}' en {segundos:.1f} s.", file=sys.stderr)
+    return 0
+
+
+def _fecha(texto):
+    from datetime import date
+
+    try:
+        return date.fromisoformat(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Fecha inválida '{texto}', usa AAAA-MM-DD.")
+
+
+def _escenario(texto):
+    """NOMBRE=AAAA-MM-DD o NOMBRE=AAAA-MM-DD:FACTOR_BONO."""
+    from calculadora.escenarios import Escenario
+
+    nombre, _, resto = texto.partition("=")
+    fecha, _, factor = resto.partition(":")
+    try:
+        return Escenario(nombre, _fecha(fecha), float(factor) if factor else 1.0)
+    except (ValueError, argparse.ArgumentTypeError):
+        raise argparse.ArgumentTypeError(f"Escenario inválido '{texto}', usa NOMBRE=AAAA-MM-DD[:FACTOR_BONO].")
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m calculadora", description="Calculadora salarial por lotes.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    p_batch = subparsers.add_parser("batch", help="Procesa un archivo CSV completo.")
+    p_batch.add_argument("entrada", help="Archivo CSV de entrada.")
+    p_batch.add_argument("--mode", choices=MODOS, default="aumentos", help="Cálculo a aplicar.")
+    p_batch.add_argument("-o", "--salida", required=True, help="Archivo de salida (.csv, .csv.gz, .parquet, .arrow o .jsonl).")
+    p_batch.add_argument("--formato", choices=FORMATOS, help="Formato de salida; por defecto según la extensión.")
+    p_batch.add_argument("--bloque", type=int, default=100_000, help="Filas por bloque (limita la memoria).")
+    p_batch.add_argument("--dolar", type=float, help="Tasa del dólar; por defecto se consulta al BCV.")
+    p_batch.add_argument("--euro", type=float, help="Tasa del euro; por defecto se consulta al BCV.")
+    p_batch.add_argument("--fecha", type=_fecha, help="Fecha de corte para la antigüedad en vacaciones (hoy por defecto).")
+    p_batch.add_argument("--rechazados", help="Archivo donde escribir las filas inválidas con su motivo (modo aumentos).")
+    p_batch.add_argument("--escenario", type=_escenario, action="append", default=[],
+                         help="Escenario del modo escenarios: NOMBRE=AAAA-MM-DD[:FACTOR_BONO]. Se puede repetir.")
+    p_batch.add_argument("--procesos", type=int, help="Procesos del modo escenarios (por defecto, los núcleos disponibles).")
+    p_batch.add_argument("-q", "--silencioso", action="store_true", help="No mostrar el resumen final.")
+    p_batch.set_defaults(funcion=batch)
+
+    p_reportes = subparsers.add_parser("reportes", help="Genera un ZIP con el reporte HTML de cada empleado.")
+    p_reportes.add_argument("entrada", help="Archivo CSV de entrada.")
+    p_reportes.add_argument("--mode", choices=list(REPORTES), default="liquidacion", help="Tipo de reporte.")
+    p_reportes.add_argument("-o", "--salida", required=True, help="Archivo ZIP de salida.")
+    p_reportes.add_argument("--bloque", type=int, default=10_000, help="Filas por bloque (limita la memoria).")
+    p_reportes.add_argument("--dolar", type=float, help="Tasa del dólar; por defecto se consulta al BCV.")
+    p_reportes.add_argument("--euro", type=float, help="Tasa del euro; por defecto se consulta al BCV.")
+    p_reportes.add_argument("--fecha", type=_fecha, help="Fecha de corte para la antigüedad en vacaciones (hoy por defecto).")
+    p_reportes.add_argument("-q", "--silencioso", action="store_true", help="No mostrar el resumen final.")
+    p_reportes.set_defaults(funcion=reportes)
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    return args.funcion(args)
@@ -0,0 +1,445 @@
+"""
+Recursos compartidos entre sesiones y entre réplicas del servidor.
+
+Dentro de un proceso, las sesiones de Streamlit ya comparten las tasas
+(`ProveedorTasas`), los archivos cargados (`CacheCargas`) y el contenido
+estático (`st.cache_resource`). Con varias réplicas (pods de Kubernetes) cada
+una repetiría la consulta al BCV, así que ese trabajo puede pasar por un
+backend común configurado en CALCULADORA_COMPARTIDO. Solo las tasas se
+comparten entre réplicas: la imagen de la portada y los feriados son archivos
+del repositorio, iguales en todas, y se siguen leyendo una vez por proceso.
+
+Backends:
+
+- vacío o "memoria": solo el proceso actual (por defecto),
+- "disco" o "disco:/ruta": un directorio compartido (por ejemplo un volumen),
+- "redis://host:puerto/db": un servidor Redis o compatible ("rediss://" con TLS,
+  verificando el certificado del servidor).
+
+Los backends guardan bytes con un tiempo de vida y tienen la memoria acotada:
+la memoria y el disco por bytes totales (CALCULADORA_COMPARTIDO_MB) y Redis por
+su propia configuración, sin aceptar valores de más de ese tamaño. Los valores
+se guardan como JSON o bytes, nunca con pickle, porque otro proceso podría
+haberlos escrito.
+
+`ServidorRedisPrueba` es un servidor local mínimo compatible con Redis (GET,
+SET con EX, DEL, PING) para pruebas y mediciones sin un Redis real.
+"""
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import ssl
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from calculadora.fuentes import FuenteTasas
+
+
+BACKEND = os.environ.get("CALCULADORA_COMPARTIDO", "").strip()
+MAX_BYTES = int(os.environ.get("CALCULADORA_COMPARTIDO_MB", "64")) * 1024 * 1024
+DIRECTORIO = os.path.join(tempfile.gettempdir(), "calculadora_compartido")
+TIMEOUT_REDIS = 2.0
+
+
+class BackendMemoria:
+    """LRU en memoria del proceso, limitada por bytes."""
+
+    compartido = False
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entradas = OrderedDict()  # clave -> (datos, vence)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def obtener(self, clave):
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                return None
+            datos, vence = entrada
+            if vence is not None and time.time() >= vence:
+                self._quitar(clave)
+                return None
+            self._entradas.move_to_end(clave)
+            return datos
+
+    def guardar(self, clave, datos, ttl=None):
+        if len(datos) > self.max_bytes:
+            return
+        with self._lock:
+            self._quitar(clave)
+            self._entradas[clave] = (datos, time.time() + ttl if ttl else None)
+            self._bytes += len(datos)
+            while self._bytes > self.max_bytes:
+                self._quitar(next(iter(self._entradas)))
+
+    def borrar(self, clave):
+        with self._lock:
+            self._quitar(clave)
+
+    def _quitar(self, clave):
+        entrada = self._entradas.pop(clave, None)
+        if entrada is not None:
+            self._bytes -= len(entrada[0])
+
+
+class BackendDisco:
+    """
+    Un archivo por clave en un directorio que pueden montar varias réplicas.
+    El vencimiento va en la cabecera del archivo; al pasar el límite de bytes se
+    borran los archivos usados hace más tiempo.
+    """
+
+    compartido = True
+
+    def __init__(self, directorio=DIRECTORIO, max_bytes=MAX_BYTES):
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        os.makedirs(directorio, exist_ok=True)
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, hashlib.sha256(clave.encode("utf-8")).hexdigest())
+
+    def obtener(self, clave):
+        try:
+            with open(self._ruta(clave), "rb") as f:
+                vence = float(f.readline())
+                if vence and time.time() >= vence:
+                    return None
+                datos = f.read()
+            os.utime(self._ruta(clave))
+            return datos
+        except (OSError, ValueError):
+            return None
+
+    def guardar(self, clave, datos, ttl=None):
+        if len(datos) > self.max_bytes:
+            return
+        ruta = self._ruta(clave)
+        temporal = f"{ruta}.tmp{os.getpid()}_{threading.get_ident()}"
+        try:
+            with open(temporal, "wb") as f:
+                f.write(f"{time.time() + ttl if ttl else 0}\n".encode("ascii"))
+                f.write(datos)
+            os.replace(temporal, ruta)
+        except OSError:
+            return
+        self._recortar()
+
+    def borrar(self, clave):
+        try:
+            os.remove(self._ruta(clave))
+        except OSError:
+            pass
+
+    def _recortar(self):
+        entradas = []
+        for nombre in os.listdir(self.directorio):
+            ruta = os.path.join(self.directorio, nombre)
+            try:
+                entradas.append((os.path.getmtime(ruta), os.path.getsize(ruta), ruta))
+            except OSError:
+                continue  # otra réplica la borró mientras se recorría
+        total = sum(t for _, t, _ in entradas)
+        for _, tamano, ruta in sorted(entradas):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+            total -= tamano
+
+
+class ErrorRedis(Exception):
+    """Respuesta de error del servidor Redis."""
+
+
+class BackendRedis:
+    """
+    Cliente mínimo del protocolo de Redis (RESP) sobre un socket por hilo, sin
+    dependencias. Con "rediss://" la conexión va cifrada con TLS y se verifica
+    el certificado del servidor (`contexto_ssl` permite otra CA). Si el servidor
+    no responde, `obtener` devuelve None y `guardar` no hace nada: la
+    aplicación sigue funcionando sin compartir.
+    """
+
+    compartido = True
+
+    def __init__(self, url, max_bytes=MAX_BYTES, timeout=TIMEOUT_REDIS, contexto_ssl=None):
+        partes = urlparse(url)
+        if partes.scheme not in ("redis", "rediss"):
+            raise ValueError(f"URL de Redis inválida: '{url}'.")
+        self.host = partes.hostname or "localhost"
+        self.puerto = partes.port or 6379
+        self.db = int(partes.path.strip("/") or 0)
+        self.usuario = partes.username
+        self.clave_acceso = partes.password
+        self.contexto_ssl = None
+        if partes.scheme == "rediss":
+            self.contexto_ssl = contexto_ssl or ssl.create_default_context()
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        self.errores = 0
+
+    def _conexion(self):
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            sock = socket.create_connection((self.host, self.puerto), timeout=self.timeout)
+            if self.contexto_ssl is not None:
+                try:
+                    sock = self.contexto_ssl.wrap_socket(sock, server_hostname=self.host)
+                except OSError:
+                    sock.close()
+                    raise
+            conexion = self._local.conexion = (sock, sock.makefile("rb"))
+            if self.clave_acceso:
+                # Con usuario (ACL de Redis 6+) AUTH recibe usuario y clave
+                usuario = [self.usuario] if self.usuario else []
+                self._comando_en(conexion, "AUTH", *usuario, self.clave_acceso)
+            if self.db:
+                self._comando_en(conexion, "SELECT", str(self.db))
+        return conexion
+
+    def _comando_en(self, conexion, *partes):
+        sock, lector = conexion
+        mensaje = [f"*{len(partes)}\r\n".encode("ascii")]
+        for parte in partes:
+            datos = parte if isinstance(parte, bytes) else str(parte).encode("utf-8")
+            mensaje += [f"${len(datos)}\r\n".encode("ascii"), datos, b"\r\n"]
+        sock.sendall(b"".join(mensaje))
+        return _leer_respuesta(lector)
+
+    def comando(self, *partes):
+        """Envía un comando y devuelve la respuesta; la conexión se descarta si falla."""
+        try:
+            return self._comando_en(self._conexion(), *partes)
+        except (OSError, ErrorRedis):
+            self.errores += 1
+            conexion = getattr(self._local, "conexion", None)
+            self._local.conexion = None
+            if conexion is not None:
+                conexion[0].close()
+            return None
+
+    def obtener(self, clave):
+        return self.comando("GET", clave)
+
+    def guardar(self, clave, datos, ttl=None):
+        if len(datos) > self.max_bytes:
+            return
+        if ttl:
+            self.comando("SET", clave, datos, "EX", str(max(int(ttl), 1)))
+        else:
+            self.comando("SET", clave, datos)
+
+    def borrar(self, clave):
+        self.comando("DEL", clave)
+
+
+def _leer_respuesta(lector):
+    linea = lector.readline()
+    if not linea:
+        raise OSError("El servidor Redis cerró la conexión.")
+    tipo, resto = linea[:1], linea[1:-2]
+    if tipo == b"+":
+        return resto.decode("utf-8")
+    if tipo == b"-":
+        raise ErrorRedis(resto.decode("utf-8"))
+    if tipo == b":":
+        return int(resto)
+    if tipo == b"$":
+        largo = int(resto)
+        if largo < 0:
+            return None
+        datos = lector.read(largo + 2)
+        return datos[:-2]
+    if tipo == b"*":
+        cantidad = int(resto)
+        return None if cantidad < 0 else [_leer_respuesta(lector) for _ in range(cantidad)]
+    raise ErrorRedis(f"Respuesta desconocida del servidor: {linea!r}")
+
+
+def backend_desde_entorno(valor=BACKEND):
+    """Backend configurado en CALCULADORA_COMPARTIDO (ver el docstring del módulo)."""
+    if not valor or valor == "memoria":
+        return BackendMemoria()
+    if valor.startswith(("redis://", "rediss://")):
+        return BackendRedis(valor)
+    if valor == "disco":
+        return BackendDisco()
+    if valor.startswith("disco:"):
+        return BackendDisco(valor[len("disco:"):])
+    raise ValueError(f"Backend compartido desconocido: '{valor}'.")
+
+
+class CacheCompartida:
+    """
+    Valores JSON o bytes en un backend, calculados una sola vez por proceso:
+    si varias sesiones piden la misma clave vencida a la vez, una calcula y las
+    demás esperan su resultado.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._en_curso = {}   # clave -> Lock del cálculo en curso
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave, formato="json"):
+        datos = self.backend.obtener(clave)
+        if datos is None:
+            return None
+        return json.loads(datos) if formato == "json" else datos
+
+    def guardar(self, clave, valor, ttl=None, formato="json"):
+        datos = json.dumps(valor).encode("utf-8") if formato == "json" else valor
+        self.backend.guardar(clave, datos, ttl)
+
+    def obtener_o_calcular(self, clave, calcular, ttl=None, formato="json"):
+        """Valor guardado en `clave` o, si no hay, el resultado de `calcular()` (que se guarda)."""
+        valor = self.obtener(clave, formato)
+        if valor is not None:
+            with self._lock:
+                self.aciertos += 1
+            return valor
+        with self._lock:
+            candado = self._en_curso.setdefault(clave, threading.Lock())
+        try:
+            with candado:
+                # Otra sesión pudo haberlo calculado mientras se esperaba
+                valor = self.obtener(clave, formato)
+                if valor is None:
+                    valor = calcular()
+                    self.guardar(clave, valor, ttl, formato)
+                    with self._lock:
+                        self.fallos += 1
+                else:
+                    with self._lock:
+                        self.aciertos += 1
+        finally:
+            # Si `calcular` o el backend fallan (BCV caído) la clave no queda registrada
+            with self._lock:
+                self._en_curso.pop(clave, None)
+        return valor
+
+    def estadisticas(self):
+        with self._lock:
+            return {"aciertos": self.aciertos, "fallos": self.fallos,
+                    "backend": type(self.backend).__name__}
+
+
+class FuenteCompartida(FuenteTasas):
+    """
+    Envuelve otra fuente para que todas las réplicas compartan la misma
+    consulta: la tasa se guarda en el backend con su hora de obtención, y las
+    demás la toman de ahí hasta que vence en vez de consultar al BCV.
+    Devuelve (dolar, euro, obtenida).
+    """
+
+    nombre = "compartida"
+    CLAVE = "calculadora:tasas"
+
+    def __init__(self, fuente, cache, ttl):
+        self.fuente = fuente
+        self.cache = cache
+        self.ttl = ttl
+
+    def obtener(self):
+        def consultar():
+            dolar, euro = self.fuente()
+            return [dolar, euro, time.time()]
+
+        dolar, euro, obtenida = self.cache.obtener_o_calcular(self.CLAVE, consultar, self.ttl)
+        return dolar, euro, obtenida
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def compartido_global():
+    """Caché compartida del proceso, con el backend configurado en CALCULADORA_COMPARTIDO."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CacheCompartida(backend_desde_entorno())
+        return _cache
+
+
+# --- Servidor de prueba ---
+
+class ServidorRedisPrueba:
+    """
+    Servidor local que entiende el subconjunto de Redis que usa `BackendRedis`,
+    para pruebas y mediciones sin un Redis real.
+
+        with ServidorRedisPrueba() as servidor:
+            BackendRedis(servidor.url).guardar("clave", b"valor", ttl=60)
+    """
+
+    def __init__(self, puerto=0):
+        self.datos = {}      # clave -> (valor, vence)
+        self.comandos = 0
+        self._lock = threading.Lock()
+        servidor = self
+
+        class Manejador(socketserver.StreamRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        partes = _leer_respuesta(self.rfile)
+                    except (OSError, ErrorRedis, ValueError):
+                        return
+                    self.wfile.write(servidor._ejecutar(partes))
+
+        self._tcp = socketserver.ThreadingTCPServer(("127.0.0.1", puerto), Manejador)
+        self._tcp.daemon_threads = True
+
+    @property
+    def url(self):
+        host, puerto = self._tcp.server_address[:2]
+        return f"redis://{host}:{puerto}/0"
+
+    def _ejecutar(self, partes):
+        comando = partes[0].decode("utf-8").upper()
+        with self._lock:
+            self.comandos += 1
+            if comando == "PING":
+                return b"+PONG\r\n"
+            if comando in ("SELECT", "AUTH"):
+                return b"+OK\r\n"
+            if comando == "GET":
+                valor, vence = self.datos.get(partes[1], (None, None))
+                if valor is None or (vence is not None and time.time() >= vence):
+                    return b"$-1\r\n"
+                return b"$%d\r\n%s\r\n" % (len(valor), valor)
+            if comando == "SET":
+                vence = time.time() + int(partes[4]) if len(partes) >= 5 and partes[3].upper() == b"EX" else None
+                self.datos[partes[1]] = (partes[2], vence)
+                return b"+OK\r\n"
+            if comando == "DEL":
+                return b":%d\r\n" % (self.datos.pop(partes[1], None) is not None)
+        return f"-ERR comando no soportado '{comando}'\r\n".encode("utf-8")
+
+    def iniciar(self):
+        threading.Thread(target=self._tcp.serve_forever, daemon=True).start()
+        return self
+
+    def detener(self):
+        self._tcp.shutdown()
+        self._tcp.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
@@ -0,0 +1,158 @@
+"""
+Proyecciones de liquidación para toda la nómina en varios escenarios.
+
+Un escenario es una fecha de egreso hipotética y un factor sobre los bonos
+("¿y si todos salieran el 31/12 con un 20% más de bonos?"). El trabajo se divide
+en (partición de empleados × escenario) y se reparte en un pool de procesos.
+Las columnas de entrada y la matriz de resultados viven en memoria compartida:
+cada proceso lee su partición y escribe su resultado en su lugar, sin copiar
+DataFrames entre procesos, así que el orden del resultado no depende de qué
+proceso termine primero. Con procesos=1 se calcula todo en serie con el mismo
+código y se obtiene exactamente el mismo resultado.
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from calculadora.motor import CONCEPTOS_LIQUIDACION, calcular_liquidacion_lote
+
+
+Escenario = namedtuple("Escenario", ["nombre", "fecha_egreso", "factor_bono"], defaults=[1.0])
+
+# Columnas de entrada: (nombre, dtype)
+COLUMNAS = (
+    ("ingreso", "datetime64[D]"),
+    ("base", "float64"),
+    ("bono", "float64"),
+    ("pendientes", "float64"),
+    ("adelanto", "float64"),
+)
+TAMANO_PARTICION = 250_000
+
+
+def _columnas_nomina(nomina):
+    """Arreglos de entrada a partir de un DataFrame con las columnas del modo liquidación."""
+    n = len(nomina)
+
+    def opcional(nombre):
+        if nombre in nomina:
+            return nomina[nombre].fillna(0).to_numpy(dtype="float64")
+        return np.zeros(n)
+
+    return {
+        "ingreso": np.asarray(pd.to_datetime(nomina["Fecha_Ingreso"]), dtype="datetime64[D]"),
+        "base": nomina["Salario_Base"].to_numpy(dtype="float64"),
+        "bono": opcional("Bono_Promedio"),
+        "pendientes": opcional("Dias_Vacaciones_Pendientes"),
+        "adelanto": opcional("Adelanto"),
+    }
+
+
+def _calcular(entrada, salida, i_escenario, escenario, inicio, fin):
+    """Calcula una partición de un escenario y la escribe en `salida[i_escenario, :, inicio:fin]`."""
+    tramo = slice(inicio, fin)
+    resultado = calcular_liquidacion_lote(
+        entrada["ingreso"][tramo],
+        np.datetime64(escenario.fecha_egreso, "D"),
+        entrada["base"][tramo],
+        entrada["bono"][tramo] * escenario.factor_bono,
+        entrada["pendientes"][tramo],
+        entrada["adelanto"][tramo],
+    )
+    for j, concepto in enumerate(CONCEPTOS_LIQUIDACION):
+        salida[i_escenario, j, tramo] = resultado[concepto].to_numpy()
+
+
+def _adjuntar(nombres, n, forma_salida):
+    """Vistas NumPy sobre los bloques de memoria compartida (en el proceso trabajador)."""
+    bloques = {nombre: shared_memory.SharedMemory(name=shm) for nombre, shm in nombres.items()}
+    entrada = {
+        nombre: np.ndarray((n,), dtype=dtype, buffer=bloques[nombre].buf)
+        for nombre, dtype in COLUMNAS
+    }
+    salida = np.ndarray(forma_salida, dtype="float64", buffer=bloques["salida"].buf)
+    return bloques, entrada, salida
+
+
+def _trabajador(nombres, n, forma_salida, tareas):
+    bloques, entrada, salida = _adjuntar(nombres, n, forma_salida)
+    try:
+        for i_escenario, escenario, inicio, fin in tareas:
+            _calcular(entrada, salida, i_escenario, escenario, inicio, fin)
+    finally:
+        del entrada, salida
+        for bloque in bloques.values():
+            bloque.close()
+
+
+def _tareas(n, escenarios, tamano_particion):
+    return [
+        (i, escenario, inicio, min(inicio + tamano_particion, n))
+        for i, escenario in enumerate(escenarios)
+        for inicio in range(0, n, tamano_particion)
+    ]
+
+
+def proyectar_liquidaciones(nomina, escenarios, procesos=None, tamano_particion=TAMANO_PARTICION):
+    """
+    Calcula la liquidación de cada empleado de `nomina` en cada escenario.
+
+    `procesos` es el número de procesos del pool (por defecto, los núcleos
+    disponibles); con 1 se calcula en serie. Devuelve un DataFrame con una fila
+    por (escenario, empleado), en el orden de `escenarios` y de `nomina`.
+    """
+    escenarios = [e if isinstance(e, Escenario) else Escenario(*e) for e in escenarios]
+    entrada = _columnas_nomina(nomina)
+    n = len(nomina)
+    forma_salida = (len(escenarios), len(CONCEPTOS_LIQUIDACION), n)
+    tareas = _tareas(n, escenarios, tamano_particion)
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos <= 1 or len(tareas) <= 1:
+        salida = np.empty(forma_salida, dtype="float64")
+        for tarea in tareas:
+            _calcular(entrada, salida, *tarea)
+        return _armar_resultado(nomina, escenarios, salida)
+
+    bloques = {}
+    try:
+        # Se copian las columnas a memoria compartida una sola vez
+        for nombre, dtype in COLUMNAS:
+            arreglo = np.ascontiguousarray(entrada[nombre], dtype=dtype)
+            bloques[nombre] = shared_memory.SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+            np.ndarray(arreglo.shape, dtype=dtype, buffer=bloques[nombre].buf)[:] = arreglo
+        bloques["salida"] = shared_memory.SharedMemory(create=True, size=max(int(np.prod(forma_salida)) * 8, 1))
+        nombres = {nombre: bloque.name for nombre, bloque in bloques.items()}
+
+        # Se reparten las tareas intercaladas (una de cada `procesos`): la última partición de cada
+        # escenario es más corta, y así ningún proceso se queda con todas las cortas o todas las largas
+        lotes = [tareas[i::procesos] for i in range(min(procesos, len(tareas)))]
+        with ProcessPoolExecutor(max_workers=len(lotes), mp_context=get_context("spawn")) as pool:
+            for futuro in [pool.submit(_trabajador, nombres, n, forma_salida, lote) for lote in lotes]:
+                futuro.result()
+
+        salida = np.ndarray(forma_salida, dtype="float64", buffer=bloques["salida"].buf).copy()
+    finally:
+        for bloque in bloques.values():
+            bloque.close()
+            bloque.unlink()
+
+    return _armar_resultado(nomina, escenarios, salida)
+
+
+def _armar_resultado(nomina, escenarios, salida):
+    n = len(nomina)
+    resultado = pd.DataFrame({
+        "escenario": np.repeat([e.nombre for e in escenarios], n),
+        "fecha_egreso": np.repeat(np.array([e.fecha_egreso for e in escenarios], dtype="datetime64[D]"), n),
+        "factor_bono": np.repeat([e.factor_bono for e in escenarios], n),
+    })
+    if "Empleado" in nomina:
+        resultado.insert(1, "Empleado", np.tile(nomina["Empleado"].to_numpy(), len(escenarios)))
+    for j, concepto in enumerate(CONCEPTOS_LIQUIDACION):
+        resultado[concepto] = salida[:, j, :].reshape(-1)
+    return resultado
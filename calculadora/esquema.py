@@ -0,0 +1,132 @@
+"""
+Esquema de los archivos de aumentos: conversión y validación de las columnas.
+
+`validar` convierte cada columna en una sola pasada vectorizada
+(`pd.to_numeric` / `pd.to_datetime` con errors="coerce") y marca con máscaras
+booleanas las filas con valores inválidos. Esas filas no detienen la carga: se
+apartan en un reporte de rechazos con su número de línea y el motivo, y el
+resto sigue al cálculo. Si falta una de las columnas de aumento se deriva de la
+otra, así que los datos válidos siempre traen 'Aumento_(%)' y 'Monto_Aumento':
+
+    Monto_Aumento = Salario_Actual * Aumento_(%) / 100
+    Aumento_(%)   = Monto_Aumento / Salario_Actual * 100
+
+El costo es lineal en las filas: unas pocas pasadas por columna y ningún bucle
+de Python por fila.
+"""
+import warnings
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+COLUMNA_FILA = "Fila"
+COLUMNA_MOTIVO = "Motivo"
+AUMENTOS = ("Aumento_(%)", "Monto_Aumento")
+
+# `validos` sigue al cálculo; `rechazados` son las filas originales (como texto) con su Fila y Motivo
+ResultadoValidacion = namedtuple("ResultadoValidacion", ["validos", "rechazados"])
+
+
+def columnas_faltantes(columnas):
+    """Columnas obligatorias que no están en el archivo (una de las dos de aumento basta)."""
+    faltantes = [c for c in ("Empleado", "Salario_Actual") if c not in columnas]
+    if not any(c in columnas for c in AUMENTOS):
+        faltantes.append(" o ".join(AUMENTOS))
+    return faltantes
+
+
+def _numerica(serie):
+    """Columna como float64 (NaN donde el valor no es un número) y máscara de valores no numéricos."""
+    if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+        return serie.astype("float64"), np.zeros(len(serie), dtype=bool)
+    numeros = pd.to_numeric(serie, errors="coerce").astype("float64")
+    return numeros, (numeros.isna() & serie.notna()).to_numpy()
+
+
+def _vacios(serie):
+    """Máscara de valores ausentes o en blanco."""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Se revisan solo las categorías; el código -1 (ausente) toma el True agregado al final
+        en_blanco = np.append(serie.cat.categories.astype(str).str.strip() == "", True)
+        return en_blanco[serie.cat.codes.to_numpy()]
+    if not (pd.api.types.is_object_dtype(serie) or pd.api.types.is_string_dtype(serie)):
+        return serie.isna().to_numpy()
+    texto = serie.astype("string")
+    return (texto.isna() | texto.str.strip().eq("")).to_numpy(dtype=bool)
+
+
+def _fechas(serie):
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie
+    with warnings.catch_warnings():
+        # Sin formato reconocible pandas avisa que prueba fila por fila; el resultado es el mismo
+        warnings.simplefilter("ignore", UserWarning)
+        return pd.to_datetime(serie, errors="coerce")
+
+
+def _motivos(reglas, rechazadas):
+    """Texto con los motivos de cada fila rechazada, separados por "; "."""
+    motivos = np.full(len(rechazadas), "", dtype=object)
+    for mascara, texto in reglas:
+        aplica = mascara[rechazadas]
+        motivos[aplica] = motivos[aplica] + texto + "; "
+    return pd.Series(motivos).str[:-2].to_numpy()
+
+
+def validar(df, float32=False):
+    """
+    Convierte y valida un bloque de un archivo de aumentos. Devuelve
+    ResultadoValidacion con las filas válidas (montos numéricos, fechas como
+    datetime y ambas columnas de aumento) y las rechazadas con su motivo. La
+    Fila es la línea del CSV (la cabecera es la línea 1) según el índice del
+    bloque leído con `read_csv`. Lanza ValueError si faltan columnas obligatorias.
+    """
+    faltantes = columnas_faltantes(df.columns)
+    if faltantes:
+        raise ValueError(f"El archivo CSV no contiene las columnas necesarias: {', '.join(faltantes)}.")
+
+    validos = df.copy()
+    reglas = [(_vacios(df["Empleado"]), "Empleado vacío")]
+
+    salario, no_numerico = _numerica(df["Salario_Actual"])
+    reglas += [
+        (no_numerico, "Salario_Actual no numérico"),
+        ((salario.isna() & ~no_numerico).to_numpy(), "Salario_Actual vacío"),
+        ((salario <= 0).to_numpy(), "Salario_Actual debe ser mayor que cero"),
+    ]
+    validos["Salario_Actual"] = salario
+
+    aumentos = {}
+    for columna in AUMENTOS:
+        if columna in df.columns:
+            aumentos[columna], no_numerico = _numerica(df[columna])
+            reglas.append((no_numerico, f"{columna} no numérico"))
+    porcentaje = aumentos.get("Aumento_(%)", pd.Series(np.nan, index=df.index))
+    monto = aumentos.get("Monto_Aumento", pd.Series(np.nan, index=df.index))
+    # Cada columna de aumento se completa con la otra donde falte
+    validos["Aumento_(%)"] = porcentaje.fillna(monto / salario * 100)
+    validos["Monto_Aumento"] = monto.fillna(salario * porcentaje / 100)
+    reglas.append(((porcentaje.isna() & monto.isna()).to_numpy(), "sin Aumento_(%) ni Monto_Aumento"))
+
+    if "Fecha_Aumento" in df.columns:
+        fechas = _fechas(df["Fecha_Aumento"])
+        vacias = _vacios(df["Fecha_Aumento"])
+        reglas += [
+            (vacias, "Fecha_Aumento vacía"),
+            (fechas.isna().to_numpy() & ~vacias, "Fecha_Aumento inválida"),
+        ]
+        validos["Fecha_Aumento"] = fechas
+
+    rechazo = np.logical_or.reduce([mascara for mascara, _ in reglas])
+    if float32:
+        columnas = ["Salario_Actual", *AUMENTOS]
+        validos[columnas] = validos[columnas].astype("float32")
+    rechazadas = np.flatnonzero(rechazo)
+    # Los valores originales se guardan como texto: así el reporte conserva lo que venía en
+    # el archivo y tiene las mismas columnas y tipos en todos los bloques
+    rechazados = df.iloc[rechazadas].astype("string")
+    rechazados.insert(0, COLUMNA_FILA, np.asarray(df.index[rechazadas]) + 2)
+    rechazados[COLUMNA_MOTIVO] = _motivos(reglas, rechazadas)
+    return ResultadoValidacion(validos[~rechazo], rechazados)
@@ -0,0 +1,202 @@
+"""
+Exportación de gráficos y de sus datos para descargar.
+
+`fig.to_html()` serializa la figura completa e incrusta plotly.js (varios MB)
+cada vez que se llama. Aquí el HTML se genera solo cuando se pide la descarga
+y se guarda en caché con la clave de los datos de los que sale la figura (una
+figura igual no se vuelve a exportar). Por defecto plotly.js se incrusta, así el
+archivo se abre sin conexión; opcionalmente puede referenciarse por CDN o por un
+archivo local compartido. También se pueden descargar solo los datos del
+gráfico, en JSON o Parquet, que pesan mucho menos.
+
+Los datos completos (con Nuevo Salario y las columnas en USD/EUR) se escriben
+con `EscritorDatos` bloque por bloque en Parquet comprimido, Arrow IPC, CSV
+(opcionalmente gzip) o JSONL, a una ruta o a un archivo abierto. Para las
+descargas, `exportar_archivo` devuelve los bytes del archivo completo, que es lo
+que acepta `st.download_button`.
+"""
+import gzip
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from calculadora.instrumentacion import tramo
+
+
+# "incluir" (por defecto) para incrustar plotly.js, "cdn", o la ruta/URL de un plotly.min.js compartido
+PLOTLYJS = os.environ.get("CALCULADORA_PLOTLYJS", "incluir")
+MAX_EXPORTACIONES = 32
+MIME = {
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+    "csv": "text/csv",
+    "csv.gz": "application/gzip",
+}
+# Formatos de los datos completos: (nombre para mostrar, extensión)
+FORMATOS_DATOS = {
+    "csv": ("CSV", "csv"),
+    "csv.gz": ("CSV comprimido (gzip)", "csv.gz"),
+    "parquet": ("Parquet", "parquet"),
+    "arrow": ("Arrow IPC", "arrow"),
+    "jsonl": ("JSON por líneas", "jsonl"),
+}
+
+_exportaciones = OrderedDict()
+_candado = threading.Lock()
+
+
+def huella_figura(fig):
+    """Hash del contenido de la figura (datos y diseño). Serializa la figura completa."""
+    return hashlib.sha256(fig.to_json().encode("utf-8")).hexdigest()
+
+
+def _opcion_plotlyjs(plotlyjs):
+    plotlyjs = plotlyjs or PLOTLYJS
+    if plotlyjs == "incluir":
+        return True
+    return plotlyjs
+
+
+def html_figura(fig, clave=None, plotlyjs=None):
+    """
+    HTML de la figura como bytes. Se genera solo la primera vez para cada clave
+    y opción de plotly.js; las siguientes se sirve desde la caché. `clave` debe
+    identificar los datos y parámetros de los que sale la figura (por ejemplo, el
+    hash del archivo de `clave_carga`); sin ella se usa `huella_figura`.
+    """
+    opcion = _opcion_plotlyjs(plotlyjs)
+    clave = (clave if clave is not None else huella_figura(fig), str(opcion))
+    with _candado:
+        if clave in _exportaciones:
+            _exportaciones.move_to_end(clave)
+            return _exportaciones[clave]
+
+    with tramo("exportar_html"):
+        contenido = fig.to_html(include_plotlyjs=opcion, full_html=True).encode("utf-8")
+    with _candado:
+        _exportaciones[clave] = contenido
+        while len(_exportaciones) > MAX_EXPORTACIONES:
+            _exportaciones.popitem(last=False)
+    return contenido
+
+
+def datos_figura(fig):
+    """Datos graficados en formato largo: una fila por punto con su serie, x e y."""
+    partes = [
+        pd.DataFrame({"serie": traza.name, "x": traza.x, "y": traza.y})
+        for traza in fig.data
+        if traza.x is not None and traza.y is not None
+    ]
+    if not partes:
+        return pd.DataFrame(columns=["serie", "x", "y"])
+    return pd.concat(partes, ignore_index=True)
+
+
+def formato_datos():
+    """Parquet si pyarrow está instalado; si no, JSON."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "json"
+    return "parquet"
+
+
+def exportar_datos(df, formato="json"):
+    """Bytes del DataFrame en JSON (registros) o Parquet comprimido."""
+    if formato == "parquet":
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False, compression="zstd")
+        return buffer.getvalue()
+    return df.to_json(orient="records", date_format="iso", force_ascii=False).encode("utf-8")
+
+
+class EscritorDatos:
+    """
+    Escribe bloques de un DataFrame en `formato` sin acumularlos. `destino` es
+    una ruta o un archivo binario abierto (que no se cierra al terminar).
+    """
+
+    def __init__(self, destino, formato):
+        if formato not in FORMATOS_DATOS:
+            raise ValueError(f"Formato de exportación desconocido: '{formato}'.")
+        self.destino = destino
+        self.formato = formato
+        self.filas = 0
+        self._binario = None
+        self._propio = False
+        self._comprimido = None
+        self._texto = None
+        self._arrow = None
+        self._esquema = None
+
+    def _abrir(self):
+        if self._binario is None:
+            if isinstance(self.destino, (str, os.PathLike)):
+                self._binario = open(self.destino, "wb")
+                self._propio = True
+            else:
+                self._binario = self.destino
+        return self._binario
+
+    def _escribir_arrow(self, df):
+        import pyarrow as pa
+
+        tabla = pa.Table.from_pandas(df, preserve_index=False)
+        if self._arrow is None:
+            self._esquema = tabla.schema
+            if self.formato == "parquet":
+                import pyarrow.parquet as pq
+
+                self._arrow = pq.ParquetWriter(self._abrir(), self._esquema, compression="zstd")
+            else:
+                self._arrow = pa.ipc.new_file(self._abrir(), self._esquema)
+        self._arrow.write_table(tabla.cast(self._esquema))
+
+    def _escribir_texto(self, df):
+        if self._texto is None:
+            binario = self._abrir()
+            if self.formato == "csv.gz":
+                binario = self._comprimido = gzip.GzipFile(fileobj=binario, mode="wb")
+            self._texto = io.TextIOWrapper(binario, encoding="utf-8", newline="")
+        if self.formato == "jsonl":
+            texto = df.to_json(orient="records", lines=True, date_format="iso", force_ascii=False)
+            self._texto.write(texto if texto.endswith("\n") else texto + "\n")
+        else:
+            df.to_csv(self._texto, index=False, header=self.filas == 0)
+
+    def escribir(self, df):
+        if self.formato in ("parquet", "arrow"):
+            self._escribir_arrow(df)
+        else:
+            self._escribir_texto(df)
+        self.filas += len(df)
+
+    def cerrar(self):
+        if self._arrow is not None:
+            self._arrow.close()
+        if self._texto is not None:
+            self._texto.flush()
+            self._texto.detach()
+        if self._comprimido is not None:
+            self._comprimido.close()
+        if self._propio:
+            self._binario.close()
+
+
+def exportar_archivo(bloques, formato):
+    """Bytes del archivo con los bloques (DataFrames) escritos en `formato`."""
+    buffer = io.BytesIO()
+    escritor = EscritorDatos(buffer, formato)
+    with tramo("exportar_datos", formato=formato):
+        try:
+            for bloque in bloques:
+                escritor.escribir(bloque)
+        finally:
+            escritor.cerrar()
+    return buffer.getvalue()
@@ -0,0 +1,253 @@
+"""
+Fuentes de tasas de cambio.
+
+Cada fuente implementa `obtener()` y devuelve (dolar, euro) o lanza ErrorTasas.
+Las fuentes HTTP comparten una sesión de `requests` con conexiones persistentes,
+tiempos de espera explícitos y reintentos acotados, para que un BCV lento no deje
+colgados los hilos del servidor.
+"""
+import abc
+import csv
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests  # Para hacer peticiones HTTP
+from bs4 import BeautifulSoup  # Para parsear HTML
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+URL_BCV = "https://www.bcv.org.ve/glosario/cambio-oficial"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
+}
+
+# Tiempos de espera (conexión, lectura) en segundos
+TIMEOUT = (
+    float(os.environ.get("CALCULADORA_TIMEOUT_CONEXION", "3")),
+    float(os.environ.get("CALCULADORA_TIMEOUT_LECTURA", "10")),
+)
+REINTENTOS = int(os.environ.get("CALCULADORA_REINTENTOS", "2"))
+TAMANO_POOL = int(os.environ.get("CALCULADORA_TAMANO_POOL", "4"))
+
+
+def opcion_verificar_ssl(valor):
+    """
+    Valor de `verify` para requests: "1" o vacío verifica con las CA del sistema
+    (o las de REQUESTS_CA_BUNDLE), "0" desactiva la verificación y cualquier otro
+    valor es la ruta de un archivo o carpeta de CA. El BCV suele enviar la cadena
+    incompleta; en ese caso conviene indicar un archivo que incluya su CA intermedia.
+    """
+    if valor in ("", "1"):
+        return True
+    if valor == "0":
+        return False
+    return valor
+
+
+VERIFICAR_SSL = opcion_verificar_ssl(os.environ.get("CALCULADORA_BCV_VERIFICAR_SSL", "1"))
+
+
+class ErrorTasas(Exception):
+    """Error al obtener o interpretar las tasas de cambio."""
+
+
+def crear_sesion(reintentos=REINTENTOS, tamano_pool=TAMANO_POOL, backoff=0.5):
+    """Crea una sesión HTTP con pool de conexiones y reintentos con espera exponencial."""
+    retry = Retry(
+        total=reintentos,
+        connect=reintentos,
+        read=reintentos,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    )
+    # Sin pool_block: si todas las conexiones están ocupadas se abre una temporal en vez de
+    # esperar sin límite a que se libere una (pool_maxsize acota las que se conservan)
+    adaptador = HTTPAdapter(pool_connections=tamano_pool, pool_maxsize=tamano_pool, max_retries=retry)
+    sesion = requests.Session()
+    sesion.headers.update(HEADERS)
+    sesion.mount("http://", adaptador)
+    sesion.mount("https://", adaptador)
+    return sesion
+
+
+_sesion = None
+_sesion_lock = threading.Lock()
+
+
+def sesion_compartida():
+    """Sesión HTTP única del proceso."""
+    global _sesion
+    with _sesion_lock:
+        if _sesion is None:
+            _sesion = crear_sesion()
+        return _sesion
+
+
+def parsear_html_bcv(contenido):
+    """Extrae (dolar, euro) del HTML de la página de cambio oficial del BCV."""
+    try:
+        soup = BeautifulSoup(contenido, 'html.parser')
+        # Si la estructura cambia, este selector debe ser ajustado
+        dolar_text = soup.find('div', id='dolar').find('strong').text.strip().replace(',', '.')
+        euro_text = soup.find('div', id='euro').find('strong').text.strip().replace(',', '.')
+        return float(dolar_text), float(euro_text)
+    except AttributeError as e:
+        raise ErrorTasas("Error al encontrar las tasas en la página del BCV. La estructura HTML puede haber cambiado.") from e
+    except ValueError as e:
+        raise ErrorTasas("Error al convertir la tasa de cambio. El formato en la página no es el esperado.") from e
+
+
+class FuenteTasas(abc.ABC):
+    """Interfaz común de las fuentes de tasas."""
+
+    nombre = "fuente"
+
+    @abc.abstractmethod
+    def obtener(self):
+        """Devuelve (dolar, euro) o lanza ErrorTasas."""
+
+    def __call__(self):
+        return self.obtener()
+
+
+class FuenteBCV(FuenteTasas):
+    """Página HTML de cambio oficial del BCV (o cualquier servidor con el mismo formato)."""
+
+    nombre = "bcv"
+
+    def __init__(self, url=URL_BCV, sesion=None, timeout=TIMEOUT, verificar_ssl=VERIFICAR_SSL):
+        self.url = url
+        self.sesion = sesion
+        self.timeout = timeout
+        self.verificar_ssl = verificar_ssl
+
+    def obtener(self):
+        sesion = self.sesion or sesion_compartida()
+        try:
+            response = sesion.get(self.url, timeout=self.timeout, verify=self.verificar_ssl)
+            response.raise_for_status()  # Lanza un error si la solicitud no fue exitosa
+        except requests.exceptions.RequestException as e:
+            raise ErrorTasas(f"Error al conectar con la página del BCV: {e}") from e
+        return parsear_html_bcv(response.content)
+
+
+class FuenteArchivo(FuenteTasas):
+    """
+    Archivo local con las tasas.
+    JSON: {"dolar": 36.5, "euro": 39.8}. CSV: columnas 'dolar' y 'euro'; se usa la última fila.
+    """
+
+    nombre = "archivo"
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+
+    def obtener(self):
+        try:
+            if self.ruta.lower().endswith(".csv"):
+                with open(self.ruta, newline="", encoding="utf-8") as f:
+                    filas = list(csv.DictReader(f))
+                if not filas:
+                    raise ErrorTasas(f"El archivo de tasas '{self.ruta}' está vacío.")
+                datos = filas[-1]
+            else:
+                with open(self.ruta, encoding="utf-8") as f:
+                    datos = json.load(f)
+            return float(datos["dolar"]), float(datos["euro"])
+        except OSError as e:
+            raise ErrorTasas(f"No se pudo leer el archivo de tasas '{self.ruta}': {e}") from e
+        except (KeyError, TypeError, ValueError) as e:
+            raise ErrorTasas(f"El archivo de tasas '{self.ruta}' debe contener 'dolar' y 'euro' numéricos.") from e
+
+
+def fuente_desde_entorno():
+    """
+    Fuente configurada en CALCULADORA_FUENTE_TASAS: vacío o 'bcv' para el BCV,
+    una URL para un servidor con el formato del BCV, o la ruta de un archivo JSON/CSV.
+    """
+    valor = os.environ.get("CALCULADORA_FUENTE_TASAS", "").strip()
+    if not valor or valor.lower() == "bcv":
+        return FuenteBCV()
+    if valor.startswith(("http://", "https://")):
+        return FuenteBCV(url=valor)
+    return FuenteArchivo(valor)
+
+
+# --- Servidor de prueba ---
+
+PLANTILLA_BCV = """<html><body>
+<div id="euro"><strong> {euro} </strong></div>
+<div id="dolar"><strong> {dolar} </strong></div>
+</body></html>"""
+
+
+class ServidorBCVPrueba:
+    """
+    Servidor HTTP local que imita la página del BCV, para pruebas sin red.
+
+        with ServidorBCVPrueba(dolar=36.5, euro=39.8) as servidor:
+            FuenteBCV(url=servidor.url).obtener()
+
+    `estado` y `retraso` permiten simular errores y respuestas lentas; con
+    `fallos` las próximas N peticiones responden 503 y las siguientes, `estado`.
+    """
+
+    def __init__(self, dolar=36.5, euro=39.8, puerto=0):
+        self.dolar = dolar
+        self.euro = euro
+        self.estado = 200
+        self.retraso = 0.0
+        self.fallos = 0
+        self.peticiones = 0
+        servidor = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                servidor.peticiones += 1
+                estado = servidor.estado
+                if servidor.fallos > 0:
+                    servidor.fallos -= 1
+                    estado = 503
+                if servidor.retraso:
+                    threading.Event().wait(servidor.retraso)
+                cuerpo = PLANTILLA_BCV.format(
+                    dolar=f"{servidor.dolar:.8f}".replace('.', ','),
+                    euro=f"{servidor.euro:.8f}".replace('.', ','),
+                ).encode("utf-8")
+                self.send_response(estado)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", puerto), Manejador)
+        self._httpd.daemon_threads = True
+        self._hilo = None
+
+    @property
+    def url(self):
+        host, puerto = self._httpd.server_address[:2]
+        return f"http://{host}:{puerto}/glosario/cambio-oficial"
+
+    def iniciar(self):
+        self._hilo = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.detener()
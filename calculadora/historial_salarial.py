@@ -0,0 +1,158 @@
+"""
+Índice del historial de aumentos por empleado.
+
+Un archivo de aumentos puede traer varias filas por empleado. El índice ordena
+las filas una sola vez por (empleado, fecha) y guarda dónde empieza cada
+empleado, así que las consultas son búsquedas binarias sobre arreglos:
+
+- salario de X en la fecha D,
+- aumento acumulado de X desde D,
+- aumentos de X dentro de un rango de fechas.
+
+Las consultas aceptan también arreglos de empleados y fechas: se combinan
+empleado y fecha en una sola clave int64 y se resuelven con un solo
+`np.searchsorted`. El gráfico de evolución sale del índice ya ordenado.
+
+La clave debe identificar el salario de una sola persona (por ejemplo,
+Empleado): el índice encadena las filas de cada clave como aumentos sucesivos,
+así que agrupar por Departamento mezclaría salarios de personas distintas. Si
+una clave tiene varias filas en la misma fecha se combinan en un solo aumento,
+desde el Salario_Actual de la primera fila hasta el Nuevo Salario de la última
+(en el orden del archivo).
+"""
+import numpy as np
+import pandas as pd
+
+
+# La clave combinada es código_empleado * _ESCALA + días desde 1970 (desplazados para ser positivos)
+_DESPLAZAMIENTO = 1 << 31
+_ESCALA = 1 << 32
+
+
+def _dias(fechas):
+    return np.asarray(pd.to_datetime(fechas), dtype="datetime64[D]").astype("int64")
+
+
+class HistorialSalarial:
+    """Aumentos ordenados por (empleado, fecha), una fila por par, con el inicio de cada empleado."""
+
+    def __init__(self, empleados, fechas, antes, despues, clave="Empleado"):
+        empleados = np.asarray(empleados, dtype=object)
+        fechas = np.asarray(pd.to_datetime(fechas), dtype="datetime64[D]")
+        antes = np.asarray(antes, dtype="float64")
+        despues = np.asarray(despues, dtype="float64")
+        # Se descartan las filas sin empleado, fecha o montos
+        validas = ~pd.isna(empleados) & ~np.isnat(fechas) & ~np.isnan(antes) & ~np.isnan(despues)
+        if not validas.all():
+            empleados, fechas, antes, despues = empleados[validas], fechas[validas], antes[validas], despues[validas]
+        codigos, self.nombres = pd.factorize(empleados, sort=False)
+        dias = fechas.astype("int64")
+        # lexsort es estable: las filas de un mismo (empleado, fecha) quedan en el orden del archivo
+        orden = np.lexsort((dias, codigos))
+        codigos, dias = codigos[orden].astype("int64"), dias[orden]
+
+        # Varias filas del mismo (empleado, fecha) se combinan en una: el salario
+        # previo de la primera y el nuevo de la última
+        nuevo_par = np.ones(len(dias), dtype=bool)
+        nuevo_par[1:] = (codigos[1:] != codigos[:-1]) | (dias[1:] != dias[:-1])
+        primeras = np.flatnonzero(nuevo_par)
+        ultimas = np.append(primeras[1:], len(dias))[:len(primeras)] - 1
+
+        self.clave = clave
+        self.codigos = codigos[primeras]
+        self.dias = dias[primeras]
+        self.antes = antes[orden][primeras]
+        self.despues = despues[orden][ultimas]
+        self.combinadas = len(dias) - len(primeras)
+        # inicios[c]:inicios[c + 1] son las filas del empleado c
+        self.inicios = np.concatenate([[0], np.cumsum(np.bincount(self.codigos, minlength=len(self.nombres)))])
+        self._claves = self.codigos * _ESCALA + self.dias + _DESPLAZAMIENTO
+        self._posicion = {nombre: i for i, nombre in enumerate(self.nombres)}
+
+    @classmethod
+    def desde_dataframe(cls, df, clave="Empleado"):
+        """
+        Índice a partir de un DataFrame enriquecido (Salario_Actual, Nuevo Salario,
+        Fecha_Aumento). `clave` debe identificar a una persona; las filas repetidas
+        de una misma clave y fecha se combinan (ver `combinadas`).
+        """
+        return cls(df[clave], df["Fecha_Aumento"], df["Salario_Actual"], df["Nuevo Salario"], clave)
+
+    def __len__(self):
+        return len(self.dias)
+
+    def _codigos(self, empleados):
+        codigos = np.array([self._posicion.get(e, -1) for e in np.atleast_1d(empleados)], dtype="int64")
+        if (codigos < 0).any():
+            faltantes = np.atleast_1d(empleados)[codigos < 0]
+            raise KeyError(f"Empleados sin historial: {list(faltantes[:5])}")
+        return codigos
+
+    def salario_en(self, empleados, fechas):
+        """
+        Salario de cada empleado en cada fecha: el Nuevo Salario del último aumento
+        hasta esa fecha, o el Salario_Actual del primero si la fecha es anterior.
+        Acepta valores sueltos (devuelve un float) o arreglos de igual largo.
+        """
+        escalar = np.ndim(empleados) == 0
+        codigos = self._codigos(empleados)
+        dias = np.atleast_1d(_dias(np.atleast_1d(fechas)))
+        # Posición del último aumento del empleado con fecha <= D
+        ultimo = np.searchsorted(self._claves, codigos * _ESCALA + dias + _DESPLAZAMIENTO, side="right") - 1
+        inicio = self.inicios[codigos]
+        salario = np.where(ultimo >= inicio, self.despues[np.maximum(ultimo, 0)], self.antes[inicio])
+        return float(salario[0]) if escalar else salario
+
+    def aumento_acumulado(self, empleados, desde, hasta=None):
+        """Aumento acumulado (%) entre `desde` y `hasta` (por defecto, el último aumento registrado)."""
+        if hasta is None:
+            hasta = np.datetime64(int(self.dias.max()), "D")
+        inicial = self.salario_en(empleados, desde)
+        final = self.salario_en(empleados, hasta)
+        return (final / inicial - 1) * 100
+
+    def aumentos_entre(self, empleado, desde, hasta):
+        """Aumentos de un empleado con fecha entre `desde` y `hasta` (inclusive), como DataFrame."""
+        codigo = self._codigos(empleado)[0]
+        base = codigo * _ESCALA + _DESPLAZAMIENTO
+        inicio = np.searchsorted(self._claves, base + _dias([desde])[0], side="left")
+        fin = np.searchsorted(self._claves, base + _dias([hasta])[0], side="right")
+        return pd.DataFrame({
+            "Fecha_Aumento": self.dias[inicio:fin].astype("datetime64[D]"),
+            "Salario_Actual": self.antes[inicio:fin],
+            "Nuevo Salario": self.despues[inicio:fin],
+            "Aumento_(%)": (self.despues[inicio:fin] / self.antes[inicio:fin] - 1) * 100,
+        })
+
+    def evolucion(self, hoy=None):
+        """
+        Serie escalonada por empleado para graficar: el salario previo en la fecha
+        del primer aumento, el nuevo salario en cada aumento y, si se indica `hoy`,
+        el último salario en esa fecha. Sale ya ordenada, sin volver a ordenar.
+        """
+        # Todos los empleados tienen al menos una fila y están en orden, así que cada
+        # fila se corre tantas posiciones como filas agregadas haya antes que ella
+        por_empleado = 2 if hoy is not None else 1
+        filas = np.arange(len(self)) + self.codigos * por_empleado + 1
+        primeros, ultimos = self.inicios[:-1], self.inicios[1:] - 1
+        total = len(self) + len(self.nombres) * por_empleado
+
+        codigos = np.empty(total, dtype="int64")
+        dias = np.empty(total, dtype="int64")
+        salarios = np.empty(total, dtype="float64")
+        codigos[filas], dias[filas], salarios[filas] = self.codigos, self.dias, self.despues
+
+        previas = filas[primeros] - 1
+        codigos[previas], dias[previas], salarios[previas] = self.codigos[primeros], self.dias[primeros], self.antes[primeros]
+
+        if hoy is not None:
+            finales = filas[ultimos] + 1
+            codigos[finales] = self.codigos[ultimos]
+            dias[finales] = np.maximum(self.dias[ultimos], _dias([hoy])[0])
+            salarios[finales] = self.despues[ultimos]
+
+        return pd.DataFrame({
+            self.clave: np.asarray(self.nombres, dtype=object)[codigos],
+            "Fecha": dias.astype("datetime64[D]"),
+            "Salario": salarios,
+        })
@@ -0,0 +1,153 @@
+"""
+Historial local de tasas de cambio indexado por fecha.
+
+Las tasas se guardan en SQLite, una fila por día, y nunca se sobrescriben: el
+proveedor de tasas registra cada consulta exitosa y también se pueden importar
+series completas desde un archivo. La conversión de un DataFrame se hace con un
+solo `merge_asof` contra el historial, sin buscar fila por fila.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+
+
+RUTA_HISTORIAL = os.environ.get(
+    "CALCULADORA_HISTORIAL_TASAS",
+    os.path.join(os.path.expanduser("~"), ".calculadora_salarial", "historial_tasas.sqlite"),
+)
+
+
+class HistorialTasas:
+    """Almacén de tasas (fecha, dolar, euro) de solo inserción."""
+
+    def __init__(self, ruta=RUTA_HISTORIAL):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._df = None  # copia en memoria, se invalida al insertar
+        if ruta != ":memory:":
+            os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        self._memoria = sqlite3.connect(ruta, check_same_thread=False) if ruta == ":memory:" else None
+        with self._conexion() as con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS tasas ("
+                "fecha TEXT PRIMARY KEY, dolar REAL NOT NULL, euro REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _conexion(self):
+        con = self._memoria or sqlite3.connect(self.ruta, timeout=5)
+        try:
+            with con:  # confirma la transacción al salir
+                yield con
+        finally:
+            if con is not self._memoria:
+                con.close()
+
+    def registrar(self, dolar, euro, fecha=None):
+        """Guarda la tasa del día si todavía no existe. Devuelve True si se insertó."""
+        fecha = (fecha or date.today()).isoformat()
+        with self._lock, self._conexion() as con:
+            cursor = con.execute(
+                "INSERT OR IGNORE INTO tasas (fecha, dolar, euro) VALUES (?, ?, ?)",
+                (fecha, float(dolar), float(euro)),
+            )
+            if cursor.rowcount:
+                self._df = None
+            return bool(cursor.rowcount)
+
+    def importar(self, origen):
+        """
+        Importa tasas desde un CSV/JSON (ruta o archivo abierto) o un DataFrame
+        con columnas 'fecha', 'dolar' y 'euro'. Las fechas ya registradas se conservan.
+        Devuelve el número de filas nuevas.
+        """
+        import pandas as pd
+
+        if isinstance(origen, pd.DataFrame):
+            df = origen
+        elif str(getattr(origen, "name", origen)).lower().endswith(".json"):
+            df = pd.read_json(origen)
+        else:
+            df = pd.read_csv(origen)
+
+        faltantes = {"fecha", "dolar", "euro"} - set(df.columns)
+        if faltantes:
+            raise ValueError(f"Faltan las columnas {sorted(faltantes)} en el archivo de tasas.")
+
+        df = df[["fecha", "dolar", "euro"]].copy()
+        df["fecha"] = pd.to_datetime(df["fecha"]).dt.strftime("%Y-%m-%d")
+        df = df.dropna().drop_duplicates("fecha", keep="first")
+
+        with self._lock, self._conexion() as con:
+            antes = con.total_changes
+            con.executemany(
+                "INSERT OR IGNORE INTO tasas (fecha, dolar, euro) VALUES (?, ?, ?)",
+                df.itertuples(index=False, name=None),
+            )
+            nuevas = con.total_changes - antes
+            if nuevas:
+                self._df = None
+        return nuevas
+
+    def como_dataframe(self):
+        """Historial completo ordenado por fecha, con 'fecha' como datetime64."""
+        import pandas as pd
+
+        with self._lock:
+            if self._df is None:
+                with self._conexion() as con:
+                    df = pd.read_sql_query("SELECT fecha, dolar, euro FROM tasas ORDER BY fecha", con)
+                df["fecha"] = pd.to_datetime(df["fecha"])
+                self._df = df
+            return self._df
+
+    def __len__(self):
+        return len(self.como_dataframe())
+
+
+def tasas_por_fecha(fechas, historial, dolar_actual=None, euro_actual=None):
+    """
+    Tasa vigente (la última publicada en o antes de la fecha) para cada elemento de `fechas`.
+
+    Devuelve un DataFrame con columnas 'dolar' y 'euro' alineado con el índice de
+    `fechas`. Las fechas sin tasa previa en el historial, o vacías, usan las tasas
+    actuales si se indican.
+    """
+    import pandas as pd
+
+    fechas = pd.Series(pd.to_datetime(fechas))
+    izquierda = pd.DataFrame({"fecha": fechas.to_numpy().astype("datetime64[ns]"), "_orden": range(len(fechas))})
+    tabla = historial.como_dataframe() if historial is not None else pd.DataFrame(columns=["fecha", "dolar", "euro"])
+
+    validas = izquierda["fecha"].notna()
+    resultado = pd.DataFrame({"dolar": float("nan"), "euro": float("nan")}, index=izquierda.index)
+    if validas.any() and len(tabla):
+        unidas = pd.merge_asof(
+            izquierda[validas].sort_values("fecha"),
+            tabla.astype({"fecha": "datetime64[ns]", "dolar": "float64", "euro": "float64"}),
+            on="fecha",
+            direction="backward",
+        )
+        resultado.loc[unidas["_orden"].to_numpy(), ["dolar", "euro"]] = unidas[["dolar", "euro"]].to_numpy()
+
+    if dolar_actual:
+        resultado["dolar"] = resultado["dolar"].fillna(dolar_actual)
+    if euro_actual:
+        resultado["euro"] = resultado["euro"].fillna(euro_actual)
+    resultado.index = fechas.index
+    return resultado
+
+
+_historial = None
+_historial_lock = threading.Lock()
+
+
+def historial_global():
+    """Historial único del proceso."""
+    global _historial
+    with _historial_lock:
+        if _historial is None:
+            _historial = HistorialTasas()
+        return _historial
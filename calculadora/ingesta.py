@@ -0,0 +1,193 @@
+"""
+Lectura de archivos de aumentos y cálculo de las columnas derivadas.
+
+`enriquecer` agrega el nuevo salario y las conversiones a USD/EUR a un DataFrame.
+`ingerir_csv` lee archivos grandes por bloques: cada bloque se enriquece, se
+acumula en agregados por empleado y por mes, y se descarta, de modo que en memoria
+solo quedan los agregados y una vista previa de las primeras filas.
+
+Antes de enriquecer, cada bloque pasa por `calculadora.esquema.validar`: las
+filas con valores inválidos se apartan en un reporte de rechazos en vez de
+detener la lectura del archivo.
+"""
+import time
+
+import pandas as pd
+
+from calculadora.esquema import validar
+from calculadora.historial_tasas import tasas_por_fecha
+
+
+COLUMNAS_MONTO = ['Salario_Actual', 'Aumento_(%)', 'Monto_Aumento']
+TAMANO_BLOQUE = 200_000
+FILAS_VISTA = 1_000
+
+
+def columnas_validas(columnas):
+    """Indica si el archivo tiene las columnas mínimas para calcular el aumento."""
+    return ('Empleado' in columnas and 'Salario_Actual' in columnas
+            and ('Aumento_(%)' in columnas or 'Monto_Aumento' in columnas))
+
+
+def tipos_columnas(columnas):
+    """
+    Tipos explícitos para `read_csv`, limitados a las columnas presentes. Los
+    montos no se fuerzan a float: un valor no numérico haría fallar el bloque
+    entero, así que se convierten después en `validar`.
+    """
+    return {'Empleado': 'category'} if 'Empleado' in columnas else {}
+
+
+def enriquecer(df, dolar_rate, euro_rate, historial=None):
+    """
+    Agrega 'Nuevo Salario' y las columnas en USD/EUR.
+    Si hay 'Fecha_Aumento' cada fila se convierte con la tasa vigente en su fecha.
+    """
+    # Convertir la columna de fechas a formato datetime si existe
+    if 'Fecha_Aumento' in df.columns:
+        df['Fecha_Aumento'] = pd.to_datetime(df['Fecha_Aumento'])
+        # Tasa vigente en la fecha de cada aumento; sin historial para esa fecha se usa la de hoy
+        tasas_fila = tasas_por_fecha(df['Fecha_Aumento'], historial, dolar_rate, euro_rate)
+        dolar_fila, euro_fila = tasas_fila['dolar'], tasas_fila['euro']
+    else:
+        dolar_fila, euro_fila = dolar_rate, euro_rate
+
+    # Calcular el nuevo salario
+    if 'Monto_Aumento' in df.columns:
+        df['Nuevo Salario'] = df['Salario_Actual'] + df['Monto_Aumento']
+        df['Monto_Aumento_USD'] = df['Monto_Aumento'] / dolar_fila
+        df['Monto_Aumento_EUR'] = df['Monto_Aumento'] / euro_fila
+    else:
+        df['Nuevo Salario'] = df['Salario_Actual'] * (1 + df['Aumento_(%)'] / 100)
+
+    # Calcular las conversiones de salario
+    df['Salario_Actual_USD'] = df['Salario_Actual'] / dolar_fila
+    df['Salario_Actual_EUR'] = df['Salario_Actual'] / euro_fila
+    df['Nuevo_Salario_USD'] = df['Nuevo Salario'] / dolar_fila
+    df['Nuevo_Salario_EUR'] = df['Nuevo Salario'] / euro_fila
+    return df
+
+
+class ResultadoIngesta:
+    """Agregados y vista previa de un archivo leído por bloques."""
+
+    def __init__(self, vista, por_empleado, por_mes, filas, segundos, rechazados=None, filas_rechazadas=0):
+        self.vista = vista                # primeras filas ya enriquecidas
+        self.por_empleado = por_empleado  # registros y promedios por empleado
+        self.por_mes = por_mes            # promedio del nuevo salario por empleado y mes
+        self.filas = filas                # filas válidas procesadas
+        self.segundos = segundos
+        self.rechazados = rechazados      # primeras filas rechazadas, con su Fila y Motivo
+        self.filas_rechazadas = filas_rechazadas
+
+    @property
+    def filas_por_segundo(self):
+        return self.filas / self.segundos if self.segundos else float('inf')
+
+
+def _acumular(acumulado, parcial):
+    """Suma agregados parciales (con las mismas claves de índice)."""
+    if acumulado is None:
+        return parcial
+    return acumulado.add(parcial, fill_value=0)
+
+
+def bloques_validados(archivo, float32=False, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Lee `archivo` por bloques y devuelve el ResultadoValidacion de cada uno.
+    Lanza ValueError si faltan las columnas necesarias.
+    """
+    columnas = pd.read_csv(archivo, nrows=0).columns
+    if hasattr(archivo, 'seek'):
+        archivo.seek(0)
+    if not columnas_validas(columnas):
+        raise ValueError("El archivo CSV no contiene las columnas necesarias.")
+
+    for bloque in pd.read_csv(archivo, dtype=tipos_columnas(columnas), chunksize=tamano_bloque):
+        yield validar(bloque, float32)
+
+
+def bloques_enriquecidos(archivo, dolar_rate, euro_rate, historial=None, float32=False,
+                         tamano_bloque=TAMANO_BLOQUE, rechazados=None):
+    """
+    Lee `archivo` por bloques y devuelve cada bloque válido ya enriquecido (Nuevo
+    Salario, USD/EUR). Si se pasa la lista `rechazados`, se le agregan las filas
+    rechazadas de cada bloque. Lanza ValueError si faltan las columnas necesarias.
+    """
+    for validos, rechazos in bloques_validados(archivo, float32, tamano_bloque):
+        if rechazados is not None and len(rechazos):
+            rechazados.append(rechazos)
+        yield enriquecer(validos, dolar_rate, euro_rate, historial)
+
+
+def bloques_rechazados(archivo, tamano_bloque=TAMANO_BLOQUE):
+    """Filas rechazadas de cada bloque de `archivo`, para el reporte de rechazos."""
+    for _, rechazos in bloques_validados(archivo, tamano_bloque=tamano_bloque):
+        yield rechazos
+
+
+def ingerir_csv(archivo, dolar_rate, euro_rate, historial=None, float32=False,
+                tamano_bloque=TAMANO_BLOQUE, filas_vista=FILAS_VISTA):
+    """
+    Lee `archivo` (ruta o archivo abierto) por bloques de `tamano_bloque` filas.
+    Lanza ValueError si faltan las columnas necesarias.
+    """
+    inicio = time.perf_counter()
+    columnas = pd.read_csv(archivo, nrows=0).columns
+    if hasattr(archivo, 'seek'):
+        archivo.seek(0)
+    fechas = 'Fecha_Aumento' in columnas
+
+    vistas = []
+    en_vista = 0
+    por_empleado = None
+    por_mes = None
+    filas = 0
+    rechazados = []
+    en_rechazos = 0
+    filas_rechazadas = 0
+    nuevos = []
+    for bloque in bloques_enriquecidos(archivo, dolar_rate, euro_rate, historial, float32, tamano_bloque, nuevos):
+        filas += len(bloque)
+
+        # De los rechazos solo se guardan las primeras filas; del resto basta la cuenta
+        for rechazos in nuevos:
+            filas_rechazadas += len(rechazos)
+            if en_rechazos < filas_vista:
+                rechazados.append(rechazos.head(filas_vista - en_rechazos))
+                en_rechazos += len(rechazados[-1])
+        nuevos.clear()
+
+        if en_vista < filas_vista:
+            vistas.append(bloque.head(filas_vista - en_vista))
+            en_vista += len(vistas[-1])
+
+        grupos = bloque.groupby('Empleado', observed=True)
+        parcial = grupos[['Salario_Actual', 'Nuevo Salario']].sum().astype('float64')
+        parcial['Registros'] = grupos.size()
+        # Las categorías cambian entre bloques, así que los agregados se indexan por texto
+        parcial.index = parcial.index.astype(str)
+        por_empleado = _acumular(por_empleado, parcial)
+
+        if fechas:
+            mes = bloque['Fecha_Aumento'].dt.to_period('M').dt.to_timestamp()
+            grupos_mes = bloque.groupby([bloque['Empleado'], mes.rename('Fecha')], observed=True)
+            parcial_mes = grupos_mes['Nuevo Salario'].agg(['sum', 'count']).astype('float64')
+            parcial_mes.index = parcial_mes.index.set_levels(parcial_mes.index.levels[0].astype(str), level=0)
+            por_mes = _acumular(por_mes, parcial_mes)
+
+    vista = pd.concat(vistas, ignore_index=True) if vistas else pd.DataFrame(columns=columnas)
+
+    if por_empleado is not None:
+        por_empleado['Salario_Actual'] /= por_empleado['Registros']
+        por_empleado['Nuevo Salario'] /= por_empleado['Registros']
+        por_empleado['Registros'] = por_empleado['Registros'].astype('int64')
+        por_empleado = por_empleado.rename_axis('Empleado').reset_index()
+
+    if por_mes is not None:
+        por_mes = (por_mes['sum'] / por_mes['count']).rename('Salario').reset_index()
+        por_mes = por_mes.rename(columns={por_mes.columns[0]: 'Empleado'}).sort_values(['Empleado', 'Fecha'])
+
+    rechazados = pd.concat(rechazados, ignore_index=True) if rechazados else None
+    return ResultadoIngesta(vista, por_empleado, por_mes, filas, time.perf_counter() - inicio,
+                            rechazados, filas_rechazadas)
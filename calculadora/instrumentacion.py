@@ -0,0 +1,228 @@
+"""
+Medición de tiempos de las partes lentas de la aplicación.
+
+`tramo("nombre")` mide un bloque de código (consulta de tasas, lectura del CSV,
+cálculos, gráficos, exportación) y lo acumula en un registro del proceso con
+un histograma por tramo. Los tramos anidados se nombran con el tramo que los
+contiene ("Visualización/ingesta"). Si la ejecución tiene una sesión activa
+(`sesion(lista)`), cada tramo también se agrega a esa lista para mostrar los
+últimos tramos de la sesión en el panel de depuración.
+
+Salidas:
+- `prometheus()`: texto en formato Prometheus (también servido en /metrics si
+  se define CALCULADORA_METRICAS_PUERTO),
+- CALCULADORA_LOG_TRAMOS: archivo (o "-" para stderr) con una línea JSON por tramo,
+- CALCULADORA_PERFIL: "cprofile" y/o "tracemalloc" para perfilar cada página
+  completa; los .prof se guardan en CALCULADORA_PERFIL_DIR.
+
+Solo usa la biblioteca estándar, así que no agrega tiempo de carga a las páginas.
+"""
+import contextvars
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Límites (segundos) de los intervalos del histograma
+LIMITES = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+MAX_TRAMOS_SESION = int(os.environ.get("CALCULADORA_MAX_TRAMOS_SESION", "50"))
+PERFIL = {p.strip() for p in os.environ.get("CALCULADORA_PERFIL", "").split(",") if p.strip()}
+PERFIL_DIR = os.environ.get("CALCULADORA_PERFIL_DIR", os.path.join(tempfile.gettempdir(), "calculadora_perfiles"))
+LOG_TRAMOS = os.environ.get("CALCULADORA_LOG_TRAMOS", "")
+METRICAS_PUERTO = int(os.environ.get("CALCULADORA_METRICAS_PUERTO", "0"))
+
+_tramo_actual = contextvars.ContextVar("tramo_actual", default=None)
+_destino_sesion = contextvars.ContextVar("destino_sesion", default=None)
+
+logger = logging.getLogger("calculadora.tramos")
+if LOG_TRAMOS:
+    _manejador = logging.StreamHandler() if LOG_TRAMOS == "-" else logging.FileHandler(LOG_TRAMOS, encoding="utf-8")
+    _manejador.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_manejador)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class RegistroTramos:
+    """Histograma de duraciones por nombre de tramo, compartido por todo el proceso."""
+
+    def __init__(self, limites=LIMITES):
+        self.limites = limites
+        self._candado = threading.Lock()
+        self._tramos = {}   # nombre -> [cuenta, suma, máximo, conteos por intervalo]
+
+    def agregar(self, nombre, segundos):
+        with self._candado:
+            datos = self._tramos.get(nombre)
+            if datos is None:
+                datos = self._tramos[nombre] = [0, 0.0, 0.0, [0] * len(self.limites)]
+            datos[0] += 1
+            datos[1] += segundos
+            datos[2] = max(datos[2], segundos)
+            for i, limite in enumerate(self.limites):
+                if segundos <= limite:
+                    datos[3][i] += 1
+                    break
+
+    def resumen(self):
+        """{nombre: {"cuenta", "total", "promedio", "maximo"}} de todos los tramos medidos."""
+        with self._candado:
+            return {
+                nombre: {"cuenta": c, "total": s, "promedio": s / c if c else 0.0, "maximo": m}
+                for nombre, (c, s, m, _) in sorted(self._tramos.items())
+            }
+
+    def prometheus(self, extra=None):
+        """Texto en formato de exposición de Prometheus; `extra` agrega indicadores {nombre: valor}."""
+        lineas = [
+            "# HELP calculadora_tramo_segundos Duración de los tramos instrumentados.",
+            "# TYPE calculadora_tramo_segundos histogram",
+        ]
+        with self._candado:
+            for nombre, (cuenta, suma, _, conteos) in sorted(self._tramos.items()):
+                etiqueta = nombre.replace("\\", "\\\\").replace('"', '\\"')
+                acumulado = 0
+                for limite, conteo in zip(self.limites, conteos):
+                    acumulado += conteo
+                    lineas.append(f'calculadora_tramo_segundos_bucket{{tramo="{etiqueta}",le="{limite}"}} {acumulado}')
+                lineas.append(f'calculadora_tramo_segundos_bucket{{tramo="{etiqueta}",le="+Inf"}} {cuenta}')
+                lineas.append(f'calculadora_tramo_segundos_sum{{tramo="{etiqueta}"}} {suma}')
+                lineas.append(f'calculadora_tramo_segundos_count{{tramo="{etiqueta}"}} {cuenta}')
+        for nombre, valor in (extra or {}).items():
+            if isinstance(valor, bool):
+                valor = int(valor)
+            if isinstance(valor, (int, float)):
+                lineas.append(f"# TYPE calculadora_{nombre} gauge")
+                lineas.append(f"calculadora_{nombre} {valor}")
+        return "\n".join(lineas) + "\n"
+
+    def limpiar(self):
+        with self._candado:
+            self._tramos.clear()
+
+
+registro = RegistroTramos()
+
+
+@contextmanager
+def sesion(destino):
+    """Durante el bloque, los tramos terminados también se agregan a `destino` (lista o deque)."""
+    token = _destino_sesion.set(destino)
+    try:
+        yield destino
+    finally:
+        _destino_sesion.reset(token)
+
+
+@contextmanager
+def tramo(nombre, **atributos):
+    """Mide el bloque y lo registra con el nombre del tramo que lo contiene como prefijo."""
+    padre = _tramo_actual.get()
+    completo = f"{padre}/{nombre}" if padre else nombre
+    token = _tramo_actual.set(completo)
+    inicio_reloj = time.time()
+    inicio = time.perf_counter()
+    try:
+        yield atributos
+    finally:
+        segundos = time.perf_counter() - inicio
+        _tramo_actual.reset(token)
+        registro.agregar(completo, segundos)
+        datos = {"tramo": completo, "inicio": inicio_reloj, "segundos": segundos, **atributos}
+        destino = _destino_sesion.get()
+        if destino is not None:
+            destino.append(datos)
+        if LOG_TRAMOS:
+            logger.info(json.dumps(datos, ensure_ascii=False, default=str))
+
+
+def tramos_sesion(maximo=MAX_TRAMOS_SESION):
+    """Contenedor para los últimos `maximo` tramos de una sesión."""
+    return deque(maxlen=max(int(maximo), 1))
+
+
+@contextmanager
+def perfilar(nombre):
+    """
+    Perfila el bloque según CALCULADORA_PERFIL: con "cprofile" guarda un .prof
+    en CALCULADORA_PERFIL_DIR; con "tracemalloc" agrega el pico de memoria (MB)
+    a los atributos del tramo. Sin la variable solo mide el tiempo.
+    """
+    perfil = None
+    if "cprofile" in PERFIL:
+        import cProfile
+
+        perfil = cProfile.Profile()
+    medir_memoria = False
+    if "tracemalloc" in PERFIL:
+        import tracemalloc
+
+        # tracemalloc es global al proceso: solo lo detiene quien lo arrancó
+        medir_memoria = not tracemalloc.is_tracing()
+        if medir_memoria:
+            tracemalloc.start()
+
+    with tramo(nombre) as atributos:
+        if perfil is not None:
+            perfil.enable()
+        try:
+            yield atributos
+        finally:
+            if perfil is not None:
+                perfil.disable()
+                os.makedirs(PERFIL_DIR, exist_ok=True)
+                limpio = "".join(c if c.isalnum() else "_" for c in nombre)
+                ruta = os.path.join(PERFIL_DIR, f"{limpio}_{time.strftime('%Y%m%d_%H%M%S')}_{threading.get_ident()}.prof")
+                perfil.dump_stats(ruta)
+                atributos["perfil"] = ruta
+            if medir_memoria:
+                atributos["memoria_pico_mb"] = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+                tracemalloc.stop()
+
+
+class _ManejadorMetricas(BaseHTTPRequestHandler):
+    extra = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        cuerpo = registro.prometheus(self.extra() if self.extra else None).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        pass
+
+
+_servidor = None
+_servidor_lock = threading.Lock()
+
+
+def iniciar_servidor_metricas(puerto=METRICAS_PUERTO, extra=None):
+    """
+    Sirve /metrics en `puerto` desde un hilo (una sola vez por proceso). Con
+    puerto 0 no hace nada. `extra` es una función que devuelve indicadores adicionales.
+    """
+    global _servidor
+    if not puerto:
+        return None
+    with _servidor_lock:
+        if _servidor is None:
+            manejador = type("ManejadorMetricas", (_ManejadorMetricas,), {"extra": staticmethod(extra) if extra else None})
+            try:
+                _servidor = ThreadingHTTPServer(("0.0.0.0", puerto), manejador)
+            except OSError:
+                # Otro proceso ya sirve las métricas en ese puerto
+                return None
+            threading.Thread(target=_servidor.serve_forever, name="metricas", daemon=True).start()
+        return _servidor
@@ -0,0 +1,192 @@
+"""
+Motor de cálculo de vacaciones y liquidación.
+
+Cada cálculo tiene una versión escalar, que usan las páginas para un empleado,
+y una versión por lotes que recibe arreglos (o columnas de un DataFrame) y
+calcula toda la nómina de una vez con NumPy. Ambas toman la antigüedad y los
+días de beneficio de `calculadora.antiguedad`, así que aplican la misma fórmula.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from calculadora.antiguedad import (
+    DIAS_ANO_COMERCIAL, DIAS_BONO_VACACIONAL, antiguedad, dias as _dias,
+    dias_bono_vacacional, dias_prestaciones, dias_vacaciones, salario_diario, salario_integral,
+)
+
+CONCEPTOS_LIQUIDACION = [
+    "salario_ultimo_mes",
+    "prestaciones_sociales",
+    "vacaciones_fraccionadas",
+    "bono_vacacional_fraccionado",
+    "total_bruto",
+    "adelanto_prestaciones",
+    "total_neto",
+]
+# Etiquetas de cada concepto en las tablas y reportes, en el mismo orden
+ETIQUETAS_LIQUIDACION = [
+    "Salario Último Mes", "Prestaciones Sociales", "Vacaciones Fraccionadas",
+    "Bono Vacacional Fraccionado", "TOTAL BRUTO", "Adelantos/Deducciones", "TOTAL NETO",
+]
+
+
+# --- Vacaciones ---
+
+def calcular_vacaciones_pago(salario_mensual, fecha_ingreso, hoy=None):
+    """
+    Calcula el pago de vacaciones y el bono vacacional.
+    Regla: 15 días base + 1 día por cada año de antigüedad completo.
+    Bono Vacacional: 15 días de salario.
+    """
+    hoy = hoy or date.today()
+    # Años calendario completos desde el ingreso
+    antiguedad_anos = int(antiguedad(fecha_ingreso, hoy)[0])
+
+    # Días de vacaciones y de bono según la antigüedad (tablas precalculadas)
+    dias_vacaciones_legales = int(dias_vacaciones(antiguedad_anos))
+    diario = float(salario_diario(salario_mensual))
+
+    # Monto de las vacaciones
+    monto_vacaciones = diario * dias_vacaciones_legales
+
+    # Monto del bono vacacional (15 días)
+    monto_bono = diario * int(dias_bono_vacacional(antiguedad_anos))
+
+    # Pago total por vacaciones
+    pago_total_vacaciones = monto_vacaciones + monto_bono
+
+    return antiguedad_anos, dias_vacaciones_legales, monto_bono, pago_total_vacaciones
+
+
+def calcular_vacaciones_lote(salarios_mensuales, fechas_ingreso, hoy=None):
+    """
+    Versión vectorizada de `calcular_vacaciones_pago` para toda una nómina.
+    Devuelve un DataFrame con antiguedad_anos, dias_vacaciones, monto_vacaciones,
+    monto_bono y pago_total, en el mismo orden de la entrada.
+    """
+    hoy = np.datetime64(hoy or date.today(), "D")
+    antiguedad_anos, _ = antiguedad(fechas_ingreso, hoy)
+    dias = dias_vacaciones(antiguedad_anos)
+
+    diario = salario_diario(salarios_mensuales)
+    monto_vacaciones = diario * dias
+    monto_bono = diario * dias_bono_vacacional(antiguedad_anos)
+
+    return pd.DataFrame({
+        "antiguedad_anos": antiguedad_anos,
+        "dias_vacaciones": dias,
+        "monto_vacaciones": monto_vacaciones,
+        "monto_bono": monto_bono,
+        "pago_total": monto_vacaciones + monto_bono,
+    })
+
+
+# --- Liquidación ---
+
+def calcular_liquidacion(fecha_ingreso, fecha_egreso, salario_base_mensual, bono_promedio_mensual=0.0,
+                         dias_vacaciones_pendientes=0, adelanto_prestaciones=0.0):
+    """
+    Calcula la liquidación de un empleado de acuerdo con la Ley Orgánica del Trabajo.
+    Devuelve un dict con la antigüedad, el salario integral y cada concepto de CONCEPTOS_LIQUIDACION.
+    """
+    if fecha_egreso < fecha_ingreso:
+        raise ValueError("La fecha de egreso no puede ser anterior a la fecha de ingreso.")
+
+    # Calcular la antigüedad en años calendario completos y días desde el último aniversario
+    diferencia_dias = (fecha_egreso - fecha_ingreso).days
+    anos, restantes = antiguedad(fecha_ingreso, fecha_egreso)
+    antiguedad_anos, dias_restantes = int(anos), int(restantes)
+
+    # Cálculo del salario integral
+    integral = float(salario_integral(salario_base_mensual, bono_promedio_mensual))
+    diario = float(salario_diario(salario_base_mensual))
+
+    # Componentes de la liquidación
+    # Prestaciones sociales (30 días por año de servicio, más fracción)
+    prestaciones_sociales = float(salario_diario(integral)) * int(dias_prestaciones(antiguedad_anos, dias_restantes))
+
+    # Vacaciones fraccionadas (15 días por año)
+    vacaciones_fraccionadas = diario * dias_vacaciones_pendientes
+
+    # Bono Vacacional Fraccionado (15 días por año)
+    bono_vacacional_fraccionado = (salario_base_mensual / DIAS_ANO_COMERCIAL) * diferencia_dias * DIAS_BONO_VACACIONAL
+
+    # Salario del último mes
+    dias_ultimo_mes = fecha_egreso.day
+    salario_ultimo_mes = diario * dias_ultimo_mes
+
+    # Total de la liquidación
+    total_bruto = prestaciones_sociales + vacaciones_fraccionadas + bono_vacacional_fraccionado + salario_ultimo_mes
+    total_neto = total_bruto - adelanto_prestaciones
+
+    return {
+        "antiguedad_anos": antiguedad_anos,
+        "dias_restantes": dias_restantes,
+        "salario_integral": integral,
+        "salario_ultimo_mes": salario_ultimo_mes,
+        "prestaciones_sociales": prestaciones_sociales,
+        "vacaciones_fraccionadas": vacaciones_fraccionadas,
+        "bono_vacacional_fraccionado": bono_vacacional_fraccionado,
+        "total_bruto": total_bruto,
+        "adelanto_prestaciones": adelanto_prestaciones,
+        "total_neto": total_neto,
+    }
+
+
+def calcular_liquidacion_lote(fechas_ingreso, fechas_egreso, salarios_base, bonos_promedio=0.0,
+                              dias_vacaciones_pendientes=0, adelantos=0.0):
+    """
+    Versión vectorizada de `calcular_liquidacion` para toda una nómina.
+    Los argumentos numéricos pueden ser arreglos o escalares (se aplican a todos).
+    Las filas con egreso anterior al ingreso quedan con valido=False y montos NaN.
+    """
+    ingreso = _dias(fechas_ingreso)
+    egreso = _dias(fechas_egreso)
+    n = max(ingreso.size, egreso.size)
+    base = np.broadcast_to(np.asarray(salarios_base, dtype="float64"), n)
+    bono = np.broadcast_to(np.asarray(bonos_promedio, dtype="float64"), n)
+    pendientes = np.broadcast_to(np.asarray(dias_vacaciones_pendientes, dtype="float64"), n)
+    adelanto = np.broadcast_to(np.asarray(adelantos, dtype="float64"), n)
+
+    diferencia_dias = np.broadcast_to((egreso - ingreso).astype("int64"), n)
+    valido = diferencia_dias >= 0
+    antiguedad_anos, dias_restantes = (np.broadcast_to(a, n) for a in antiguedad(ingreso, egreso))
+
+    integral = salario_integral(base, bono)
+    prestaciones_sociales = salario_diario(integral) * dias_prestaciones(antiguedad_anos, dias_restantes)
+    vacaciones_fraccionadas = salario_diario(base) * pendientes
+    bono_vacacional_fraccionado = (base / DIAS_ANO_COMERCIAL) * diferencia_dias * DIAS_BONO_VACACIONAL
+
+    # Día del mes de la fecha de egreso
+    dias_ultimo_mes = np.broadcast_to((egreso - egreso.astype("datetime64[M]")).astype("int64") + 1, n)
+    salario_ultimo_mes = salario_diario(base) * dias_ultimo_mes
+
+    total_bruto = prestaciones_sociales + vacaciones_fraccionadas + bono_vacacional_fraccionado + salario_ultimo_mes
+    total_neto = total_bruto - adelanto
+
+    resultado = pd.DataFrame({
+        "valido": valido,
+        "antiguedad_anos": antiguedad_anos,
+        "dias_restantes": dias_restantes,
+        "salario_integral": integral,
+        "salario_ultimo_mes": salario_ultimo_mes,
+        "prestaciones_sociales": prestaciones_sociales,
+        "vacaciones_fraccionadas": vacaciones_fraccionadas,
+        "bono_vacacional_fraccionado": bono_vacacional_fraccionado,
+        "total_bruto": total_bruto,
+        "adelanto_prestaciones": adelanto,
+        "total_neto": total_neto,
+    })
+    montos = ["salario_integral"] + CONCEPTOS_LIQUIDACION
+    resultado.loc[~valido, montos] = np.nan
+    return resultado
+
+
+def tabla_liquidacion(liquidacion):
+    """Desglose de una liquidación (dict de `calcular_liquidacion`) como tabla para mostrar."""
+    return pd.DataFrame({
+        "Concepto": ETIQUETAS_LIQUIDACION,
+        "Monto (VES)": [liquidacion[c] for c in CONCEPTOS_LIQUIDACION],
+    }).round(2)
@@ -0,0 +1,148 @@
+"""
+Registros de salario ingresados a mano durante una sesión.
+
+Antes, cada envío del formulario reconstruía el DataFrame completo a partir de
+una lista de diccionarios y recalculaba las columnas derivadas de todas las
+filas. Aquí los registros viven en arreglos por columna con capacidad
+reservada (se duplica al llenarse), y al agregar un registro solo se calculan
+las columnas derivadas de esa fila. Las columnas en USD/EUR se recalculan
+completas solo cuando cambian las tasas.
+
+Streamlit guarda estos registros en la memoria del servidor por cada sesión,
+así que la representación es compacta: los nombres de empleado se guardan una
+sola vez (internados) y cada fila solo lleva su código int32, y las fechas son
+números de día int32. Cada sesión tiene un máximo de registros.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+CAPACIDAD_INICIAL = 64
+MAX_REGISTROS_SESION = int(os.environ.get("CALCULADORA_MAX_REGISTROS_SESION", "10000"))
+
+# Columnas de entrada y derivadas, en el orden en que se muestran: (nombre, dtype)
+# Empleado y Fecha_Aumento se guardan como códigos int32 y se decodifican al leerlas.
+COLUMNAS = (
+    ("Empleado", "int32"),
+    ("Salario_Actual", "float64"),
+    ("Bono", "float64"),
+    ("Aumento_(%)", "float64"),
+    ("Fecha_Aumento", "int32"),
+    ("Nuevo Salario", "float64"),
+    ("Salario_Actual_USD", "float64"),
+    ("Salario_Actual_EUR", "float64"),
+    ("Bono_USD", "float64"),
+    ("Bono_EUR", "float64"),
+)
+
+
+class LimiteRegistros(Exception):
+    """Se alcanzó el máximo de registros permitidos en una sesión."""
+
+
+class RegistrosSesion:
+    """Tabla de registros de una sesión que crece sin recalcular lo ya guardado."""
+
+    __slots__ = ("n", "tasas", "maximo", "_columnas", "_nombres", "_codigos", "_df")
+
+    def __init__(self, capacidad=CAPACIDAD_INICIAL, maximo=MAX_REGISTROS_SESION):
+        self.n = 0
+        self.tasas = (1.0, 1.0)
+        self.maximo = maximo
+        self._columnas = {nombre: np.empty(capacidad, dtype=dtype) for nombre, dtype in COLUMNAS}
+        self._nombres = []
+        self._codigos = {}
+        self._df = None
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def capacidad(self):
+        return len(self._columnas["Salario_Actual"])
+
+    def _reservar(self, n):
+        if n <= self.capacidad:
+            return
+        nueva = min(max(n, self.capacidad * 2), max(self.maximo, n))
+        for nombre, arreglo in self._columnas.items():
+            ampliado = np.empty(nueva, dtype=arreglo.dtype)
+            ampliado[:self.n] = arreglo[:self.n]
+            self._columnas[nombre] = ampliado
+
+    def _convertir(self, tramo):
+        """Columnas en USD/EUR de las filas de `tramo` con las tasas actuales."""
+        dolar, euro = self.tasas
+        c = self._columnas
+        c["Salario_Actual_USD"][tramo] = c["Salario_Actual"][tramo] / dolar
+        c["Salario_Actual_EUR"][tramo] = c["Salario_Actual"][tramo] / euro
+        c["Bono_USD"][tramo] = c["Bono"][tramo] / dolar
+        c["Bono_EUR"][tramo] = c["Bono"][tramo] / euro
+
+    def actualizar_tasas(self, dolar, euro):
+        """Cambia las tasas; solo si son distintas se recalculan las columnas en USD/EUR."""
+        if (dolar, euro) == self.tasas:
+            return False
+        self.tasas = (dolar, euro)
+        self._convertir(slice(0, self.n))
+        self._df = None
+        return True
+
+    def agregar(self, empleado, salario, bono, aumento, fecha):
+        """
+        Agrega un registro y calcula solo sus columnas derivadas. Devuelve su
+        posición; lanza LimiteRegistros si la sesión ya tiene el máximo.
+        """
+        if self.n >= self.maximo:
+            raise LimiteRegistros(f"Se alcanzó el máximo de {self.maximo:,} registros por sesión.")
+        self._reservar(self.n + 1)
+        i = self.n
+        c = self._columnas
+        c["Empleado"][i] = self._codigo(empleado)
+        c["Salario_Actual"][i] = salario
+        c["Bono"][i] = bono
+        c["Aumento_(%)"][i] = aumento
+        c["Fecha_Aumento"][i] = np.datetime64(fecha, "D").astype("int64")
+        c["Nuevo Salario"][i] = salario * (1 + aumento / 100)
+        self._convertir(slice(i, i + 1))
+        self.n += 1
+        self._df = None
+        return i
+
+    def _codigo(self, empleado):
+        """Código int32 del empleado; cada nombre distinto se guarda una sola vez."""
+        nombre = sys.intern(str(empleado))
+        codigo = self._codigos.get(nombre)
+        if codigo is None:
+            codigo = self._codigos[nombre] = len(self._nombres)
+            self._nombres.append(nombre)
+        return codigo
+
+    def columna(self, nombre, desde=0):
+        """Valores de una columna desde la fila `desde` hasta la última guardada."""
+        valores = self._columnas[nombre][desde:self.n]
+        if nombre == "Empleado":
+            return np.array(self._nombres, dtype=object)[valores] if self._nombres else valores.astype(object)
+        if nombre == "Fecha_Aumento":
+            return valores.astype("datetime64[D]")
+        return valores
+
+    def memoria_bytes(self):
+        """Bytes ocupados por los arreglos reservados y los nombres de empleado."""
+        return (sum(arreglo.nbytes for arreglo in self._columnas.values())
+                + sum(sys.getsizeof(nombre) for nombre in self._nombres))
+
+    def como_dataframe(self):
+        """DataFrame con todas las filas; se arma de nuevo solo si hubo cambios."""
+        if self._df is None:
+            self._df = pd.DataFrame({nombre: self.columna(nombre) for nombre, _ in COLUMNAS})
+        return self._df
+
+    def limpiar(self):
+        self.n = 0
+        self._nombres = []
+        self._codigos = {}
+        self._df = None
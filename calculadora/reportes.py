@@ -0,0 +1,197 @@
+"""
+Reportes HTML de vacaciones y liquidación.
+
+Las plantillas se compilan una sola vez al importar el módulo (string.Template)
+y el CSS es el mismo para todos los reportes, así que armar un reporte es unir
+unas pocas cadenas. Las páginas solo llaman a estas funciones cuando el usuario
+pide la descarga. Para una nómina completa, `escribir_zip` recibe los reportes
+de uno en uno y los va agregando al ZIP, sin tener todos en memoria.
+"""
+import math
+import re
+import zipfile
+from html import escape
+from string import Template
+
+from calculadora.motor import CONCEPTOS_LIQUIDACION, DIAS_BONO_VACACIONAL, ETIQUETAS_LIQUIDACION
+
+
+CSS = """
+        body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; line-height: 1.6; padding: 20px; color: #333; }
+        .container { max-width: 800px; margin: auto; background: #fff; padding: 30px; border-radius: 8px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); }
+        h1, h2, h3 { color: #004d99; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th, td { border: 1px solid #ddd; padding: 12px; text-align: center; }
+        th { background-color: #f2f2f2; }
+        .detalle th, .detalle td { text-align: left; }
+        .vacation-day { font-weight: bold; background-color: #e6f7ff; color: #004d99; }
+        .metric { border-left: 5px solid #004d99; padding-left: 10px; margin-top: 15px; }
+        .metric-value { font-size: 1.5em; font-weight: bold; }
+"""
+
+# El CSS se inserta una sola vez; quedan pendientes solo los campos de cada reporte
+_DOCUMENTO = Template(Template("""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$titulo</title>
+    <style>$css    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>$encabezado</h1>
+        <p>$introduccion</p>
+        <hr>
+$cuerpo
+    </div>
+</body>
+</html>
+""").safe_substitute(css=CSS))
+
+_METRICA = Template("""        <div class="metric">
+            <h3>$titulo</h3>
+            <p class="metric-value">$valor</p>
+        </div>
+""")
+
+_DATO = Template("        <p><strong>$etiqueta:</strong> $valor</p>\n")
+
+
+def _hay_tasas(dolar, euro):
+    return bool(dolar and euro) and not (math.isnan(dolar) or math.isnan(euro))
+
+
+def _metricas(titulo, monto, dolar, euro):
+    """Monto en VES y, si hay tasas, también en USD y EUR."""
+    partes = [_METRICA.substitute(titulo=f"{titulo} (VES)", valor=f"Bs. {monto:,.2f}")]
+    if _hay_tasas(dolar, euro):
+        partes.append(_METRICA.substitute(titulo=f"{titulo} (USD)", valor=f"$ {monto / dolar:,.2f}"))
+        partes.append(_METRICA.substitute(titulo=f"{titulo} (EUR)", valor=f"€ {monto / euro:,.2f}"))
+    return partes
+
+
+def _datos(pares):
+    return [_DATO.substitute(etiqueta=etiqueta, valor=valor) for etiqueta, valor in pares]
+
+
+def _tabla(columnas, filas, clase=None):
+    """Tabla HTML a partir de listas de celdas (ya formateadas como texto)."""
+    atributo = f' class="{clase}"' if clase else ""
+    encabezado = "".join(f"<th>{escape(str(c))}</th>" for c in columnas)
+    cuerpo = "".join("<tr>" + "".join(f"<td>{escape(str(v))}</td>" for v in fila) + "</tr>" for fila in filas)
+    return f"        <table{atributo}><thead><tr>{encabezado}</tr></thead><tbody>{cuerpo}</tbody></table>\n"
+
+
+def _celda_calendario(valor):
+    # Los días de vacaciones vienen en negritas de Markdown ("**5**")
+    if valor.startswith("**"):
+        return f'<td class="vacation-day">{valor.strip("*")}</td>'
+    return f"<td>{valor}</td>"
+
+
+def _tabla_calendario(df):
+    encabezado = "".join(f"<th>{c}</th>" for c in df.columns)
+    cuerpo = "".join(
+        "<tr>" + "".join(_celda_calendario(v) for v in fila) + "</tr>"
+        for fila in df.to_numpy().tolist()
+    )
+    return f"        <table><thead><tr>{encabezado}</tr></thead><tbody>{cuerpo}</tbody></table>\n"
+
+
+def _fecha(valor):
+    """AAAA-MM-DD de un date, datetime, Timestamp o datetime64."""
+    return str(valor)[:10]
+
+
+def reporte_vacaciones(antiguedad_anos, dias_vacaciones, pago_total, dolar=None, euro=None,
+                       calendarios=None, empleado=None):
+    """HTML del reporte de vacaciones; `calendarios` es la salida de construir_calendarios."""
+    partes = ["        <h2>Resumen del Cálculo</h2>\n"]
+    if empleado is not None:
+        partes += _datos([("Empleado", escape(str(empleado)))])
+    partes += _datos([
+        ("Antigüedad", f"{antiguedad_anos} años"),
+        ("Días de Vacaciones", f"{dias_vacaciones} días"),
+        ("Bono Vacacional", f"{DIAS_BONO_VACACIONAL} días"),
+    ])
+    partes += _metricas("Monto Total a Pagar", pago_total, dolar, euro)
+    if calendarios:
+        partes.append("        <hr>\n        <h2>Calendario de Vacaciones</h2>\n")
+        for nombre_mes, df in calendarios:
+            partes.append(f"        <h3>{nombre_mes}</h3>\n")
+            partes.append(_tabla_calendario(df))
+    return _DOCUMENTO.substitute(
+        titulo="Reporte de Vacaciones",
+        encabezado="Reporte de Cálculo de Vacaciones",
+        introduccion="Este reporte detalla el cálculo de tu pago de vacaciones y el calendario correspondiente.",
+        cuerpo="".join(partes),
+    )
+
+
+def reporte_liquidacion(liquidacion, fecha_ingreso, fecha_egreso, salario_base, dolar=None, euro=None,
+                        empleado=None):
+    """HTML del reporte de liquidación a partir del dict de calcular_liquidacion (o una fila del lote)."""
+    partes = ["        <h2>Resumen de Datos</h2>\n"]
+    if empleado is not None:
+        partes += _datos([("Empleado", escape(str(empleado)))])
+    partes += _datos([
+        ("Fecha de Ingreso", _fecha(fecha_ingreso)),
+        ("Fecha de Egreso", _fecha(fecha_egreso)),
+        ("Antigüedad", f"{int(liquidacion['antiguedad_anos'])} años y {int(liquidacion['dias_restantes'])} días"),
+        ("Salario Base Mensual", f"Bs. {salario_base:,.2f}"),
+        ("Salario Integral", f"Bs. {liquidacion['salario_integral']:,.2f}"),
+    ])
+    partes.append("        <hr>\n        <h2>Cálculo Detallado</h2>\n")
+    filas = [(etiqueta, f"{round(liquidacion[c], 2):.2f}") for etiqueta, c in zip(ETIQUETAS_LIQUIDACION, CONCEPTOS_LIQUIDACION)]
+    partes.append(_tabla(["Concepto", "Monto (VES)"], filas, clase="detalle"))
+    partes += _metricas("Monto Neto a Pagar", liquidacion["total_neto"], dolar, euro)
+    return _DOCUMENTO.substitute(
+        titulo="Reporte de Liquidación",
+        encabezado="Reporte de Liquidación",
+        introduccion="Este reporte detalla el cálculo de tu liquidación de acuerdo con la información suministrada.",
+        cuerpo="".join(partes),
+    )
+
+
+def nombre_archivo(posicion, empleado, prefijo):
+    """Nombre único y seguro para el reporte de un empleado dentro del ZIP."""
+    limpio = re.sub(r"[^\w-]+", "_", str(empleado)).strip("_") or "empleado"
+    return f"{prefijo}_{posicion:06d}_{limpio}.html"
+
+
+def reportes_vacaciones_lote(bloques, dolar=None, euro=None):
+    """(nombre, html) por empleado a partir de los bloques de `calcular_vacaciones_lote` unidos a la nómina."""
+    posicion = 0
+    for bloque in bloques:
+        for fila in bloque.to_dict("records"):
+            posicion += 1
+            yield nombre_archivo(posicion, fila["Empleado"], "vacaciones"), reporte_vacaciones(
+                fila["antiguedad_anos"], fila["dias_vacaciones"], fila["pago_total"], dolar, euro,
+                empleado=fila["Empleado"])
+
+
+def reportes_liquidacion_lote(bloques, dolar=None, euro=None):
+    """(nombre, html) por empleado a partir de los bloques de `calcular_liquidacion_lote`; omite las filas inválidas."""
+    posicion = 0
+    for bloque in bloques:
+        for fila in bloque.to_dict("records"):
+            posicion += 1
+            if not fila.get("valido", True):
+                continue
+            yield nombre_archivo(posicion, fila["Empleado"], "liquidacion"), reporte_liquidacion(
+                fila, fila["Fecha_Ingreso"], fila["Fecha_Egreso"], fila["Salario_Base"], dolar, euro,
+                empleado=fila["Empleado"])
+
+
+def escribir_zip(documentos, destino):
+    """
+    Escribe los (nombre, html) de `documentos` en un ZIP (ruta o archivo abierto)
+    a medida que se generan. Devuelve la cantidad de reportes escritos.
+    """
+    cantidad = 0
+    with zipfile.ZipFile(destino, "w", compression=zipfile.ZIP_DEFLATED) as archivo_zip:
+        for nombre, html in documentos:
+            archivo_zip.writestr(nombre, html.encode("utf-8"))
+            cantidad += 1
+    return cantidad
@@ -0,0 +1,97 @@
+"""
+Simulación de escenarios de aumentos frente a inflación y devaluación.
+
+Cada escenario es una trayectoria mensual de tres porcentajes: aumento de
+salario, inflación (en dólares) y devaluación del bolívar frente al dólar. El
+salario de cada mes usa la misma fórmula de la calculadora,
+Salario * (1 + Aumento / 100), aplicada mes a mes:
+
+    salario[s, m, e] = salario_inicial[e] * Π (1 + aumento[s, ≤m] / 100)
+    real[s, m, e]    = salario[s, m, e] / (tasa[s, m] * precios[s, m])
+
+Todo se calcula con broadcasting de NumPy sobre (escenario, mes, empleado).
+Para acotar la memoria los escenarios se procesan por bloques: de cada bloque
+solo se guardan los totales por (escenario, mes), y al final se calculan las
+bandas de percentiles entre escenarios.
+"""
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+PERCENTILES = (5, 25, 50, 75, 95)
+MEMORIA_BLOQUE = int(os.environ.get("CALCULADORA_SIMULACION_MB", "16")) * 1024 * 1024
+
+# Trayectorias en % mensual; cada una de forma (escenarios, meses) o (escenarios, meses, empleados)
+Trayectorias = namedtuple("Trayectorias", ["aumentos", "inflacion", "devaluacion"])
+
+
+def generar_trayectorias(escenarios=50, meses=12, aumento=(2.0, 1.0), inflacion=(0.5, 0.3),
+                         devaluacion=(3.0, 2.0), semilla=None):
+    """
+    Trayectorias aleatorias (distribución normal) a partir de (media, desviación)
+    mensuales en % para el aumento, la inflación y la devaluación.
+    """
+    rng = np.random.default_rng(semilla)
+
+    def normal(parametros):
+        media, desviacion = parametros
+        return rng.normal(media, desviacion, (escenarios, meses))
+
+    return Trayectorias(normal(aumento), normal(inflacion), normal(devaluacion))
+
+
+def _factor(porcentajes):
+    """Factor acumulado mes a mes de una trayectoria en %, sobre el eje de meses."""
+    return np.cumprod(1 + np.asarray(porcentajes, dtype="float64") / 100, axis=1)
+
+
+def escenarios_por_bloque(meses, empleados, memoria=MEMORIA_BLOQUE):
+    """Cuántos escenarios caben en un bloque sin superar `memoria` bytes por arreglo."""
+    return max(1, memoria // max(meses * empleados * 8, 1))
+
+
+def simular(salarios, tasa_dolar, trayectorias, memoria=MEMORIA_BLOQUE):
+    """
+    Salario real (equivalente en USD a precios de hoy) de toda la nómina en cada
+    escenario. Devuelve un arreglo (escenarios, meses) con la nómina real total;
+    los cálculos por empleado se hacen por bloques de escenarios.
+    """
+    salarios = np.asarray(salarios, dtype="float64")
+    aumentos = np.asarray(trayectorias.aumentos, dtype="float64")
+    n_escenarios, meses = aumentos.shape[:2]
+    # La tasa y los precios no dependen del empleado: (escenarios, meses, 1)
+    divisor = (tasa_dolar * _factor(trayectorias.devaluacion) * _factor(trayectorias.inflacion))[:, :, None]
+
+    totales = np.empty((n_escenarios, meses))
+    paso = escenarios_por_bloque(meses, len(salarios), memoria)
+    for inicio in range(0, n_escenarios, paso):
+        bloque = slice(inicio, inicio + paso)
+        crecimiento = _factor(aumentos[bloque])
+        if crecimiento.ndim == 2:
+            crecimiento = crecimiento[:, :, None]
+        real = salarios[None, None, :] * crecimiento / divisor[bloque]
+        totales[bloque] = real.sum(axis=2)
+    return totales
+
+
+def bandas(totales, empleados=None, percentiles=PERCENTILES):
+    """
+    Percentiles entre escenarios para cada mes. Con `empleados` se expresan como
+    salario real promedio por empleado en vez de nómina total.
+    """
+    valores = totales / empleados if empleados else totales
+    resultado = pd.DataFrame(
+        np.percentile(valores, percentiles, axis=0).T,
+        columns=[f"p{p}" for p in percentiles],
+    )
+    resultado.insert(0, "Mes", np.arange(1, totales.shape[1] + 1))
+    return resultado
+
+
+def simular_bandas(salarios, tasa_dolar, trayectorias, memoria=MEMORIA_BLOQUE, percentiles=PERCENTILES):
+    """Bandas del salario real promedio por empleado (USD de hoy) para cada mes."""
+    totales = simular(salarios, tasa_dolar, trayectorias, memoria)
+    return bandas(totales, len(salarios), percentiles)
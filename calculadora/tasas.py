@@ -0,0 +1,285 @@
+"""
+Proveedor de tasas de cambio del BCV con caché compartida por proceso.
+
+Streamlit vuelve a ejecutar el script en cada interacción, así que las tasas se
+guardan en una caché con TTL que comparten todas las sesiones del proceso. Cuando
+el valor vence se sigue sirviendo mientras un hilo lo actualiza en segundo plano,
+y si el BCV no responde se usa el último valor bueno guardado en disco.
+
+Las páginas no consultan al BCV: leen una instantánea (`instantanea()`) que un
+hilo dedicado mantiene al día según el TTL, junto con la antigüedad del valor.
+Solo la primera página del proceso, sin ningún valor ni respaldo, espera unos
+segundos a la primera consulta. `estadisticas()` expone la latencia de las
+consultas y los fallos.
+
+Con un backend compartido (CALCULADORA_COMPARTIDO) las réplicas del servidor
+toman la tasa que ya consultó otra en vez de ir cada una al BCV.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+
+from calculadora.compartido import FuenteCompartida, compartido_global
+from calculadora.fuentes import ErrorTasas, fuente_desde_entorno
+from calculadora.historial_tasas import historial_global
+
+
+# Segundos que una tasa se considera fresca
+TTL_TASAS = int(os.environ.get("CALCULADORA_TTL_TASAS", "1800"))
+# Segundos de espera antes de reintentar tras un fallo
+ESPERA_REINTENTO = int(os.environ.get("CALCULADORA_ESPERA_REINTENTO", "60"))
+# Archivo con el último valor bueno conocido
+RUTA_RESPALDO = os.environ.get(
+    "CALCULADORA_RESPALDO_TASAS",
+    os.path.join(os.path.expanduser("~"), ".calculadora_salarial", "tasas.json"),
+)
+
+# Segundos que una página espera la primera tasa cuando todavía no hay ninguna
+ESPERA_PRIMERA_TASA = float(os.environ.get("CALCULADORA_ESPERA_PRIMERA_TASA", "5"))
+
+# Tasas publicadas para las páginas; `obtenida` es la hora (time.time) en que se consultaron
+Instantanea = namedtuple("Instantanea", ["dolar", "euro", "obtenida", "desde_respaldo", "error"])
+
+
+def edad(instantanea):
+    """Segundos transcurridos desde que se obtuvo la tasa de la instantánea (None si no hay)."""
+    if instantanea.obtenida is None:
+        return None
+    return max(time.time() - instantanea.obtenida, 0.0)
+
+
+class ProveedorTasas:
+    """
+    Caché de tasas con TTL, refresco en segundo plano y respaldo en disco.
+
+    Solo una petición al BCV está en curso a la vez: si varias sesiones piden
+    las tasas con la caché vacía, la primera consulta y las demás esperan su
+    resultado.
+    """
+
+    def __init__(self, obtener=None, ttl=TTL_TASAS, espera_reintento=ESPERA_REINTENTO,
+                 ruta_respaldo=RUTA_RESPALDO, historial=None):
+        # Cualquier FuenteTasas o función sin argumentos que devuelva (dolar, euro)
+        # o (dolar, euro, obtenida) si la tasa se consultó antes (por ejemplo en otra réplica)
+        self._obtener = obtener or fuente_desde_entorno()
+        self.ttl = ttl
+        self.espera_reintento = espera_reintento
+        self.ruta_respaldo = ruta_respaldo
+        # HistorialTasas opcional donde se registra cada tasa obtenida
+        self.historial = historial
+
+        self._cond = threading.Condition()
+        self._valor = None        # (dolar, euro)
+        self._vence = 0.0         # instante (monotonic) en que el valor deja de ser fresco
+        self._reintentar = 0.0    # sin valor: no se reintenta antes de este instante
+        self._refrescando = False
+        self._obtenida = None     # hora (time.time) en que se obtuvo el valor actual
+        self._hilo = None
+        self._detener = threading.Event()
+
+        self.latencias = deque(maxlen=100)
+        self.errores_seguidos = 0
+        self.ultimo_error = None
+        self.desde_respaldo = False
+        self.aciertos = 0
+        self.fallos = 0
+        self.obsoletos = 0
+        self.consultas = 0
+        self.errores = 0
+
+    def obtener(self):
+        """Devuelve (dolar, euro), o (None, None) si no hay ninguna tasa disponible."""
+        with self._cond:
+            ahora = time.monotonic()
+            if self._valor is not None:
+                if ahora < self._vence:
+                    self.aciertos += 1
+                else:
+                    # Valor vencido: se sirve igual y se refresca en segundo plano
+                    self.obsoletos += 1
+                    if not self._refrescando:
+                        self._refrescando = True
+                        threading.Thread(target=self._refrescar, daemon=True).start()
+                return self._valor
+
+            self.fallos += 1
+            if self._refrescando:
+                while self._refrescando:
+                    self._cond.wait()
+                return self._valor or (None, None)
+            if ahora < self._reintentar:
+                return (None, None)
+            self._refrescando = True
+
+        self._refrescar()
+        with self._cond:
+            return self._valor or (None, None)
+
+    def instantanea(self, espera=0.0):
+        """
+        Última tasa publicada, sin consultar al BCV. Arranca el hilo de refresco
+        si no está corriendo; si todavía no hay ningún valor espera hasta
+        `espera` segundos a la primera consulta.
+        """
+        self.iniciar_refresco()
+        limite = time.monotonic() + espera
+        with self._cond:
+            while self._valor is None and self.consultas == 0 and time.monotonic() < limite:
+                self._cond.wait(limite - time.monotonic())
+            dolar, euro = self._valor or (None, None)
+            return Instantanea(dolar, euro, self._obtenida, self.desde_respaldo, self.ultimo_error)
+
+    def iniciar_refresco(self):
+        """Arranca el hilo que mantiene la tasa al día (una sola vez por proveedor)."""
+        with self._cond:
+            if self._hilo is not None and self._hilo.is_alive():
+                return
+            self._detener.clear()
+            self._hilo = threading.Thread(target=self._ciclo_refresco, name="refresco-tasas", daemon=True)
+            self._hilo.start()
+
+    def detener_refresco(self):
+        """Detiene el hilo de refresco (espera hasta un segundo a que termine)."""
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout=1)
+
+    def _ciclo_refresco(self):
+        while not self._detener.is_set():
+            with self._cond:
+                ocupado = self._refrescando
+                self._refrescando = True
+            if not ocupado:
+                self._refrescar()
+            # Se vuelve a consultar cuando vence el valor o, sin valor, cuando toca reintentar
+            with self._cond:
+                proximo = self._vence if self._valor is not None else self._reintentar
+            self._detener.wait(max(proximo - time.monotonic(), 1.0))
+
+    def estadisticas(self):
+        """Contadores de uso de la caché, latencia de las consultas y fallos."""
+        with self._cond:
+            latencias = sorted(self.latencias)
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "obsoletos": self.obsoletos,
+                "consultas": self.consultas,
+                "errores": self.errores,
+                "errores_seguidos": self.errores_seguidos,
+                "latencia_ultima": self.latencias[-1] if self.latencias else None,
+                "latencia_p50": latencias[len(latencias) // 2] if latencias else None,
+                "latencia_max": latencias[-1] if latencias else None,
+                "edad_segundos": max(time.time() - self._obtenida, 0.0) if self._obtenida else None,
+                "desde_respaldo": self.desde_respaldo,
+                "ultimo_error": self.ultimo_error,
+            }
+
+    def invalidar(self):
+        """Marca el valor actual como vencido."""
+        with self._cond:
+            self._vence = 0.0
+
+    def _refrescar(self):
+        inicio = time.perf_counter()
+        try:
+            valor = self._obtener()
+            obtenida = time.time()
+            if len(valor) == 3:
+                *valor, obtenida = valor
+            valor = tuple(valor)
+        except ErrorTasas as e:
+            self._registrar_fallo(str(e), time.perf_counter() - inicio)
+        except Exception as e:  # el refresco nunca debe tumbar la página
+            self._registrar_fallo(f"Error inesperado al obtener las tasas: {e}", time.perf_counter() - inicio)
+        else:
+            with self._cond:
+                self.latencias.append(time.perf_counter() - inicio)
+                self.consultas += 1
+                self.errores_seguidos = 0
+                self._valor = valor
+                self._obtenida = obtenida
+                # Una tasa consultada antes vence antes; se espera al menos un segundo para no girar en vacío
+                self._vence = time.monotonic() + max(self.ttl - (time.time() - obtenida), 1.0)
+                self.ultimo_error = None
+                self.desde_respaldo = False
+                self._refrescando = False
+                self._cond.notify_all()
+            self._guardar_respaldo(valor, obtenida)
+            self._registrar_historial(valor)
+
+    def _registrar_fallo(self, mensaje, latencia):
+        respaldo = None
+        if self._valor is None:
+            respaldo = self._leer_respaldo()
+        with self._cond:
+            self.latencias.append(latencia)
+            self.consultas += 1
+            self.errores += 1
+            self.errores_seguidos += 1
+            self.ultimo_error = mensaje
+            if respaldo is not None:
+                self._valor, self._obtenida = respaldo
+                self.desde_respaldo = True
+            # Se espera antes de volver a intentar para no martillar al BCV caído
+            if self._valor is not None:
+                self._vence = time.monotonic() + self.espera_reintento
+            else:
+                self._reintentar = time.monotonic() + self.espera_reintento
+            self._refrescando = False
+            self._cond.notify_all()
+
+    def _guardar_respaldo(self, valor, obtenida):
+        # Se guarda la hora en que se obtuvo la tasa (que puede venir de otra réplica), no la de guardado
+        if not self.ruta_respaldo:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.ruta_respaldo) or ".", exist_ok=True)
+            temporal = f"{self.ruta_respaldo}.tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                json.dump({"dolar": valor[0], "euro": valor[1], "fecha": obtenida}, f)
+            os.replace(temporal, self.ruta_respaldo)
+        except OSError:
+            pass
+
+    def _registrar_historial(self, valor):
+        if self.historial is None:
+            return
+        try:
+            self.historial.registrar(*valor)
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _leer_respaldo(self):
+        if not self.ruta_respaldo or not os.path.exists(self.ruta_respaldo):
+            return None
+        try:
+            with open(self.ruta_respaldo, encoding="utf-8") as f:
+                datos = json.load(f)
+            return (float(datos["dolar"]), float(datos["euro"])), datos.get("fecha")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+_proveedor = None
+_proveedor_lock = threading.Lock()
+
+
+def proveedor_global():
+    """Proveedor único del proceso, compartido por todas las sesiones."""
+    global _proveedor
+    with _proveedor_lock:
+        if _proveedor is None:
+            try:
+                historial = historial_global()
+            except (sqlite3.Error, OSError):
+                historial = None
+            fuente = fuente_desde_entorno()
+            compartido = compartido_global()
+            if compartido.backend.compartido:
+                fuente = FuenteCompartida(fuente, compartido, TTL_TASAS)
+            _proveedor = ProveedorTasas(obtener=fuente, historial=historial)
+        return _proveedor
@@ -1,38 +1,59 @@
 #crcastro 2025-08-29
+import argparse
 import pandas as pd
 import numpy as np
 
-# Definimos el número de empleados para los datos de prueba
-num_empleados = 10
 
-# Nombres ficticios para los empleados
-empleados = [f'Empleado_{i+1}' for i in range(num_empleados)]
+def generar_aumentos(num_filas=10, num_empleados=None, fecha_inicio='2024-03-01', fecha_fin='2025-08-29', semilla=None):
+    """
+    Genera un DataFrame de aumentos de prueba.
+    Con num_empleados menor que num_filas cada empleado aparece en varias filas (varios aumentos).
+    """
+    rng = np.random.default_rng(semilla)
+    num_empleados = num_empleados or num_filas
 
-# Generamos salarios aleatorios con decimales entre 30000.00 y 120000.00
-salarios_actuales = np.random.uniform(30000.00, 120000.00, size=num_empleados).round(2)
+    # Nombres ficticios para los empleados
+    empleados = pd.Categorical.from_codes(
+        rng.integers(0, num_empleados, size=num_filas) if num_empleados < num_filas else np.arange(num_filas),
+        categories=[f'Empleado_{i+1}' for i in range(num_empleados)],
+    )
 
-# Generamos un porcentaje de aumento aleatorio con decimales entre 2% y 50%
-aumento_porcentaje = np.random.uniform(2, 50, size=num_empleados).round(2)
+    # Generamos salarios aleatorios con decimales entre 30000.00 y 120000.00
+    salarios_actuales = rng.uniform(30000.00, 120000.00, size=num_filas).round(2)
 
-# Calculamos el monto de aumento
-monto_aumento = salarios_actuales * (aumento_porcentaje / 100)
+    # Generamos un porcentaje de aumento aleatorio con decimales entre 2% y 50%
+    aumento_porcentaje = rng.uniform(2, 50, size=num_filas).round(2)
 
-# Generamos fechas de aumento aleatorias en el período especificado
-fechas_aumento = pd.to_datetime(np.random.choice(pd.date_range('2024-03-01', '2025-08-29'), size=num_empleados))
+    # Calculamos el monto de aumento
+    monto_aumento = salarios_actuales * (aumento_porcentaje / 100)
 
-# Creamos el diccionario de datos
-data = {
-    'Empleado': empleados,
-    'Salario_Actual': salarios_actuales,
-    'Aumento_(%)': aumento_porcentaje,
-    'Monto_Aumento': monto_aumento.round(2),
-    'Fecha_Aumento': fechas_aumento
-}
+    # Generamos fechas de aumento aleatorias en el período especificado
+    dias = pd.date_range(fecha_inicio, fecha_fin)
+    fechas_aumento = dias[rng.integers(0, len(dias), size=num_filas)]
 
-# Creamos el DataFrame de prueba
-df_aumento = pd.DataFrame(data)
+    # Creamos el DataFrame de prueba
+    return pd.DataFrame({
+        'Empleado': empleados,
+        'Salario_Actual': salarios_actuales,
+        'Aumento_(%)': aumento_porcentaje,
+        'Monto_Aumento': monto_aumento.round(2),
+        'Fecha_Aumento': fechas_aumento
+    })
 
-# Guardamos el DataFrame en un archivo CSV
-df_aumento.to_csv('aumentos.csv', index=False)
 
-print("Archivo 'aumentos.csv' generado con éxito. Puedes usarlo para probar tu aplicación.")
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera un archivo CSV de aumentos de prueba.")
+    parser.add_argument("--filas", type=int, default=10, help="Número de filas.")
+    parser.add_argument("--empleados", type=int, help="Número de empleados distintos (por defecto, uno por fila).")
+    parser.add_argument("--desde", default='2024-03-01', help="Primera fecha de aumento.")
+    parser.add_argument("--hasta", default='2025-08-29', help="Última fecha de aumento.")
+    parser.add_argument("--semilla", type=int, help="Semilla para obtener siempre los mismos datos.")
+    parser.add_argument("-o", "--salida", default='aumentos.csv', help="Archivo CSV a generar.")
+    args = parser.parse_args()
+
+    df_aumento = generar_aumentos(args.filas, args.empleados, args.desde, args.hasta, args.semilla)
+
+    # Guardamos el DataFrame en un archivo CSV
+    df_aumento.to_csv(args.salida, index=False)
+
+    print(f"Archivo '{args.salida}' generado con éxito. Puedes usarlo para probar tu aplicación.")
@@ -0,0 +1,15 @@
+"""
+Páginas de la aplicación.
+
+Cada página vive en su propio módulo y se importa solo al seleccionarla, así la
+página principal no paga la carga de pandas, plotly ni del scraper.
+"""
+
+# Nombre en el menú -> (módulo, función de la página)
+PAGINAS = {
+    "Principal": ("paginas.principal", "principal"),
+    "Visualización": ("paginas.visualizacion", "Visualizacion"),
+    "Gráficos Interactivos": ("paginas.graficos_interactivos", "Graficos_Interactivos"),
+    "Vacaciones": ("paginas.vacaciones", "Vacaciones"),
+    "Liquidacion": ("paginas.liquidacion", "Liquidacion"),
+}
@@ -0,0 +1,165 @@
+"""
+Funciones compartidas por las páginas.
+
+El proveedor de tasas (requests, BeautifulSoup) se importa al primer uso y no al
+cargar la página, para que los formularios aparezcan sin esperar esas librerías.
+"""
+import io
+import os
+import streamlit as st
+
+RUTA_EJEMPLO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data_example", "aumentos.csv")
+
+
+def proveedor_global():
+    """Caché compartida de tasas de cambio del proceso."""
+    from calculadora.tasas import proveedor_global as _proveedor_global
+    return _proveedor_global()
+
+
+# Función para obtener las tasas de cambio
+def get_exchange_rates():
+    """
+    Devuelve las tasas de cambio del Dólar y el Euro del BCV.
+    Las tasas salen de la instantánea que un hilo del proceso mantiene al día, así que la página no espera al BCV.
+    """
+    from calculadora.instrumentacion import tramo
+    from calculadora.tasas import ESPERA_PRIMERA_TASA, edad
+
+    with tramo("tasas"):
+        instantanea = proveedor_global().instantanea(espera=ESPERA_PRIMERA_TASA)
+    if not instantanea.dolar or not instantanea.euro:
+        st.error(instantanea.error or "No se pudieron obtener las tasas de cambio del BCV.")
+        return None, None
+    if instantanea.desde_respaldo:
+        st.warning("No se pudo contactar al BCV. Se usan las últimas tasas conocidas.")
+    st.caption(f"Tasas del BCV: Dólar {instantanea.dolar:,.2f} · Euro {instantanea.euro:,.2f} · "
+               f"{antiguedad_legible(edad(instantanea))}")
+    return instantanea.dolar, instantanea.euro
+
+
+def antiguedad_legible(segundos):
+    """Texto corto con la antigüedad de un valor ("actualizadas hace 5 min")."""
+    if segundos is None:
+        return "sin fecha de actualización"
+    if segundos < 60:
+        return "actualizadas hace menos de un minuto"
+    if segundos < 3600:
+        return f"actualizadas hace {segundos // 60:.0f} min"
+    if segundos < 86400:
+        return f"actualizadas hace {segundos // 3600:.0f} h"
+    return f"actualizadas hace {segundos // 86400:.0f} días"
+
+
+class ArchivoEjemplo(io.BytesIO):
+    """Archivo de ejemplo con los mismos atributos que un archivo subido (name, size)."""
+
+    def __init__(self, contenido, nombre):
+        super().__init__(contenido)
+        self.name = nombre
+        self.size = len(contenido)
+
+
+@st.cache_resource(show_spinner=False)
+def _contenido_ejemplo(ruta):
+    with open(ruta, "rb") as f:
+        return f.read()
+
+
+def archivo_ejemplo(ruta=RUTA_EJEMPLO):
+    """
+    CSV de ejemplo del repositorio. El contenido se lee una vez por proceso; cada
+    sesión recibe su propio archivo en memoria para leerlo sin interferir con otras.
+    Como la caché de cargas se indexa por contenido, el archivo también se procesa
+    una sola vez para todas las sesiones.
+    """
+    return ArchivoEjemplo(_contenido_ejemplo(ruta), os.path.basename(ruta))
+
+
+def historial_tasas():
+    """Historial de tasas del proceso, o None si no se pudo abrir."""
+    return proveedor_global().historial
+
+
+def botones_descarga_grafico(fig, etiqueta, nombre_archivo, clave=None):
+    """
+    Botones para descargar el gráfico en HTML y sus datos (Parquet o JSON).
+    Los archivos se generan solo cuando el usuario hace clic, no en cada ejecución de la página.
+    `clave` identifica los datos de la figura para la caché del HTML (ver `html_figura`).
+    """
+    from calculadora.exportacion import MIME, datos_figura, exportar_datos, formato_datos, html_figura
+
+    st.download_button(
+        label=etiqueta,
+        data=lambda: html_figura(fig, clave),
+        file_name=f"{nombre_archivo}.html",
+        mime="text/html",
+        on_click="ignore"
+    )
+    formato = formato_datos()
+    st.download_button(
+        label=f"{etiqueta} (solo datos, {formato.upper()})",
+        data=lambda: exportar_datos(datos_figura(fig), formato),
+        file_name=f"{nombre_archivo}.{formato}",
+        mime=MIME[formato],
+        on_click="ignore"
+    )
+
+
+def boton_descarga_datos(bloques, nombre_archivo, etiqueta="Descargar Datos", clave=None):
+    """
+    Selector de formato y botón para descargar datos completos. `bloques` es una
+    función sin argumentos que devuelve los DataFrames a exportar; el archivo se
+    genera solo cuando el usuario hace clic.
+    """
+    from calculadora.exportacion import FORMATOS_DATOS, MIME, exportar_archivo, formato_datos
+
+    formatos = [f for f in FORMATOS_DATOS if formato_datos() == "parquet" or f not in ("parquet", "arrow")]
+    formato = st.selectbox("Formato de descarga", formatos, format_func=lambda f: FORMATOS_DATOS[f][0],
+                           key=clave)
+    st.download_button(
+        label=etiqueta,
+        data=lambda: exportar_archivo(bloques(), formato),
+        file_name=f"{nombre_archivo}.{FORMATOS_DATOS[formato][1]}",
+        mime=MIME[formato],
+        on_click="ignore"
+    )
+
+
+def metricas_tasas():
+    """Estadísticas del proveedor de tasas para /metrics (vacías si aún no se usó)."""
+    import sys
+
+    # No se importa el proveedor (requests, BeautifulSoup) solo para exponer métricas
+    if "calculadora.tasas" not in sys.modules:
+        return {}
+    return {f"tasas_{nombre}": valor for nombre, valor in proveedor_global().estadisticas().items()}
+
+
+def panel_depuracion():
+    """Panel lateral con los últimos tramos medidos en la sesión y el resumen del proceso."""
+    import json
+
+    import pandas as pd
+    from calculadora import instrumentacion
+
+    with st.sidebar.expander("Depuración"):
+        tramos = list(st.session_state.get('tramos', ()))
+        if tramos:
+            df = pd.DataFrame(tramos[::-1])
+            df["ms"] = df.pop("segundos") * 1000
+            df["inicio"] = pd.to_datetime(df["inicio"], unit="s")
+            st.dataframe(df.round({"ms": 1}), hide_index=True)
+        else:
+            st.caption("Todavía no hay tramos medidos en esta sesión.")
+
+        resumen = instrumentacion.registro.resumen()
+        if resumen:
+            st.write("Proceso (todas las sesiones):")
+            st.dataframe(pd.DataFrame(resumen).T.round(4))
+        st.download_button("Métricas (Prometheus)",
+                           data=lambda: instrumentacion.registro.prometheus(metricas_tasas()),
+                           file_name="metricas.txt", mime="text/plain", on_click="ignore")
+        st.download_button("Tramos de la sesión (JSON)",
+                           data=json.dumps(tramos, ensure_ascii=False, default=str),
+                           file_name="tramos.json", mime="application/json", on_click="ignore")
@@ -0,0 +1,158 @@
+from datetime import date
+from uuid import uuid4
+import streamlit as st
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from calculadora.instrumentacion import tramo
+from calculadora.registros import LimiteRegistros, RegistrosSesion
+from paginas.comun import boton_descarga_datos, botones_descarga_grafico, get_exchange_rates
+
+
+SERIES = ['Salario_Actual', 'Nuevo Salario']
+
+
+def graficos_registros(registros):
+    """
+    Gráficos de barras y de línea de los registros de la sesión. Se crean con el
+    primer registro y después solo se les agregan los puntos de las filas nuevas.
+    Devuelve también una clave que cambia con los puntos, para la caché del HTML.
+    """
+    graficos = st.session_state.get('graficos_registros')
+    if graficos is None:
+        df = registros.como_dataframe()
+        graficos = {
+            "id": uuid4().hex,
+            "filas": len(registros),
+            "barras": px.bar(df, x='Empleado', y=SERIES, barmode='group',
+                             title="Comparación de Salarios (Interactivos)"),
+            "lineas": px.line(df, x='Fecha_Aumento', y=SERIES,
+                              title="Evolución de Salarios (Interactivos)"),
+        }
+        st.session_state.graficos_registros = graficos
+    elif graficos["filas"] < len(registros):
+        desde = graficos["filas"]
+        for fig, eje in ((graficos["barras"], 'Empleado'), (graficos["lineas"], 'Fecha_Aumento')):
+            nuevas_x = registros.columna(eje, desde)
+            for traza in fig.data:
+                traza.x = np.concatenate([traza.x, nuevas_x])
+                traza.y = np.concatenate([traza.y, registros.columna(traza.name, desde)])
+        graficos["filas"] = len(registros)
+    return graficos["barras"], graficos["lineas"], f"registros:{graficos['id']}:{graficos['filas']}"
+
+
+def simulacion_escenarios(registros, dolar_rate):
+    """
+    Bandas del salario real en USD de los empleados ingresados bajo escenarios
+    aleatorios. Sin tasa del dólar (`dolar_rate` None) no se simula.
+    """
+    with st.expander("Simular escenarios de aumentos, inflación y devaluación"):
+        if not dolar_rate:
+            st.warning("No hay tasa del dólar disponible: la simulación en USD no se puede calcular. "
+                       "Inténtalo de nuevo cuando se obtengan las tasas de cambio.")
+            return
+        col1, col2 = st.columns(2)
+        with col1:
+            meses = st.number_input("Meses", min_value=1, max_value=60, value=12, key="sim_meses")
+            aumento = st.number_input("Aumento mensual promedio (%)", value=2.0, key="sim_aumento")
+            inflacion = st.number_input("Inflación mensual en USD (%)", value=0.5, key="sim_inflacion")
+        with col2:
+            escenarios = st.number_input("Escenarios", min_value=2, max_value=1000, value=50, key="sim_escenarios")
+            devaluacion = st.number_input("Devaluación mensual promedio (%)", value=3.0, key="sim_devaluacion")
+            volatilidad = st.number_input("Desviación de aumento y devaluación (%)", min_value=0.0, value=1.5,
+                                          key="sim_volatilidad")
+        if not st.button("Simular", key="sim_boton"):
+            return
+
+        from calculadora.simulacion import generar_trayectorias, simular_bandas
+
+        trayectorias = generar_trayectorias(int(escenarios), int(meses), (aumento, volatilidad),
+                                            (inflacion, volatilidad / 3), (devaluacion, volatilidad))
+        with tramo("simulacion", escenarios=int(escenarios), meses=int(meses)):
+            resultado = simular_bandas(registros.columna('Nuevo Salario'), dolar_rate, trayectorias)
+
+        fig = go.Figure()
+        fig.add_scatter(x=resultado['Mes'], y=resultado['p95'], line_width=0, showlegend=False)
+        fig.add_scatter(x=resultado['Mes'], y=resultado['p5'], fill='tonexty', line_width=0, name="p5 - p95")
+        fig.add_scatter(x=resultado['Mes'], y=resultado['p75'], line_width=0, showlegend=False)
+        fig.add_scatter(x=resultado['Mes'], y=resultado['p25'], fill='tonexty', line_width=0, name="p25 - p75")
+        fig.add_scatter(x=resultado['Mes'], y=resultado['p50'], name="Mediana")
+        fig.update_layout(title="Salario Real Promedio (USD de hoy) por Escenario",
+                          xaxis_title="Mes", yaxis_title="USD")
+        st.plotly_chart(fig)
+        st.dataframe(resultado.round(2), hide_index=True)
+
+
+def limpiar_registros():
+    st.session_state.registros.limpiar()
+    st.session_state.pop('graficos_registros', None)
+
+
+def Graficos_Interactivos():
+    """Página para ingresar datos manualmente y generar gráficos."""
+    st.title("Carga tu Sueldo y Bonos sin llorar")
+    st.write("Ingresa tus datos de salario y aumento. Los datos de la tabla y los gráficos se actualizarán a continuación.")
+
+    # Inicializar el almacén de registros de la sesión si aún no existe
+    if 'registros' not in st.session_state:
+        st.session_state.registros = RegistrosSesion()
+    registros = st.session_state.registros
+
+    # Crear un formulario para recolectar los datos.
+    with st.form(key='salary_form'):
+        st.subheader("Ingresar nuevo registro de salario")
+        nombre = st.text_input("Nombre del Empleado", key="form_nombre")
+        salario = st.number_input("Salario Anual", min_value=0.0, format="%f", key="form_salario")
+        bono = st.number_input("Bono Actual", min_value=0.0, format="%f", key="form_bono")
+        aumento_porcentaje = st.number_input("% de Aumento", min_value=0.0, format="%f", key="form_aumento")
+        fecha_aumento = st.date_input("Fecha de Aumento", date.today(), key="form_fecha")
+        
+        # Botón para enviar el formulario
+        submit_button = st.form_submit_button(label='Guardar Datos')
+
+    # Si el formulario fue enviado
+    if submit_button:
+        # Agrega el registro; solo se calculan las columnas derivadas de esta fila
+        try:
+            registros.agregar(nombre, salario, bono, aumento_porcentaje, fecha_aumento)
+            st.success("¡Datos guardados con éxito!")
+        except LimiteRegistros as e:
+            st.error(f"{e} Descarga los datos y limpia la tabla para seguir agregando.")
+    
+    # Mostrar la tabla de datos y los gráficos solo si hay registros
+    if len(registros):
+        st.subheader("Datos Ingresados")
+
+        # Obtener las tasas de cambio (las columnas USD/EUR se recalculan solo si cambian)
+        dolar_rate, euro_rate = get_exchange_rates()
+        dolar_real = dolar_rate
+        if not dolar_rate or not euro_rate:
+            st.error("No se pudieron obtener las tasas de cambio. Los valores en USD/EUR no se mostrarán.")
+            dolar_rate = 1
+            euro_rate = 1
+        registros.actualizar_tasas(dolar_rate, euro_rate)
+        df = registros.como_dataframe()
+
+        # Mostrar la tabla
+        st.dataframe(df.round(dict.fromkeys(df.select_dtypes("number").columns, 2))) # Redondeamos para mejor visualización
+        st.caption(f"{len(registros):,} de {registros.maximo:,} registros · "
+                   f"{registros.memoria_bytes() / 1024:,.1f} KB en memoria")
+
+        with tramo("graficos", filas=len(registros)):
+            fig_bar, fig_line, clave_graficos = graficos_registros(registros)
+        st.plotly_chart(fig_bar)
+        st.plotly_chart(fig_line)
+
+        # La simulación necesita la tasa real: con la de reemplazo (1) graficaría bolívares como dólares
+        simulacion_escenarios(registros, dolar_real)
+
+        # Botón para limpiar los datos
+        st.button("Limpiar Datos", on_click=limpiar_registros)
+        
+        # Botón de descarga de la información (CSV, Parquet o Arrow)
+        boton_descarga_datos(lambda: [df], "datos_salarios", clave="formato_datos_interactivos")
+        # Boton de descarga de Graficos (los archivos se generan al hacer clic)
+        botones_descarga_grafico(fig_bar, "Descargar Gráfico de Barras", "Grafico_barras_salarios",
+                                 clave=f"{clave_graficos}:barras")
+        botones_descarga_grafico(fig_line, "Descargar Gráfico de Líneas", "Grafico_lineas_salarios",
+                                 clave=f"{clave_graficos}:lineas")
@@ -0,0 +1,73 @@
+from datetime import date
+import streamlit as st
+from calculadora.instrumentacion import tramo
+from paginas.comun import get_exchange_rates
+
+
+def Liquidacion():
+    """Página para calculo de Liquidacion."""
+    st.title("Calculadora de Liquidación")
+    st.markdown("Ingresa los datos para calcular tu liquidación de acuerdo con la Ley Orgánica del Trabajo.")
+    
+    with st.form(key='liquidacion_form'):
+        st.subheader("Datos del Empleado")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            fecha_ingreso = st.date_input("Fecha de Ingreso", date.today(), key="liq_fecha_ingreso")
+        with col2:
+            fecha_egreso = st.date_input("Fecha de Egreso", date.today(), key="liq_fecha_egreso")
+
+        st.markdown("---")
+        st.subheader("Información Salarial")
+        salario_base_mensual = st.number_input("Salario Base Mensual (VES)", min_value=0.0, format="%f", key="liq_salario_base")
+        bono_promedio_mensual = st.number_input("Promedio de Bonos/Comisiones Mensuales (VES)", min_value=0.0, format="%f", key="liq_bono_promedio")
+        
+        st.markdown("---")
+        st.subheader("Beneficios Pendientes y Deducciones")
+        dias_vacaciones_pendientes = st.number_input("Días de vacaciones pendientes", min_value=0, key="liq_vacaciones_pendientes")
+        adelanto_prestaciones = st.number_input("Adelanto de Prestaciones Sociales (VES)", min_value=0.0, format="%f", key="liq_adelanto")
+        
+        calcular_button = st.form_submit_button(label="Calcular Liquidación")
+
+    if calcular_button:
+        if fecha_egreso < fecha_ingreso:
+            st.error("La fecha de egreso no puede ser anterior a la fecha de ingreso.")
+        else:
+            # Las librerías de cálculo se cargan solo cuando se envía el formulario
+            from calculadora.motor import calcular_liquidacion, tabla_liquidacion
+            from calculadora.reportes import reporte_liquidacion
+
+            # Calcular la liquidación con el motor de cálculo
+            with tramo("calculo"):
+                liquidacion = calcular_liquidacion(fecha_ingreso, fecha_egreso, salario_base_mensual, bono_promedio_mensual,
+                                                   dias_vacaciones_pendientes, adelanto_prestaciones)
+            total_neto = liquidacion["total_neto"]
+
+            # Obtener las tasas de cambio para la conversión
+            dolar_rate, euro_rate = get_exchange_rates()
+
+            # Mostrar los resultados
+            st.subheader("Resultados del Cálculo de Liquidación")
+            
+            # Tabla de desglose
+            df_resumen = tabla_liquidacion(liquidacion)
+            st.dataframe(df_resumen, hide_index=True)
+            
+            # Metricas finales
+            st.metric(label="Monto Neto a Pagar (VES)", value=f"Bs. {total_neto:,.2f}")
+            if dolar_rate and euro_rate:
+                total_neto_usd = total_neto / dolar_rate
+                total_neto_eur = total_neto / euro_rate
+                st.metric(label="Monto Neto a Pagar (USD)", value=f"$ {total_neto_usd:,.2f}")
+                st.metric(label="Monto Neto a Pagar (EUR)", value=f"€ {total_neto_eur:,.2f}")
+            
+            # Botón de descarga del reporte HTML (se arma solo al hacer clic)
+            st.download_button(
+                label="Descargar Reporte de Liquidación",
+                data=lambda: reporte_liquidacion(liquidacion, fecha_ingreso, fecha_egreso, salario_base_mensual,
+                                                 dolar_rate, euro_rate).encode('utf-8'),
+                file_name="reporte_liquidacion.html",
+                mime="text/html",
+                on_click="ignore"
+            )
@@ -0,0 +1,57 @@
+import os # Importa el módulo 'os' para verificar la existencia del archivo
+import streamlit as st
+
+RUTA_IMAGEN = "./assets/imagen1.jpg"
+
+
+@st.cache_resource(show_spinner=False)
+def imagen_principal(ruta=RUTA_IMAGEN):
+    """Bytes de la imagen de la portada, leídos una sola vez por proceso (None si no existe)."""
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta, "rb") as f:
+        return f.read()
+
+
+def principal():
+    """Página principal de la aplicación."""
+    
+    # Creamos dos columnas con una relación de 0.5:4 para forzar la imagen a la izquierda
+    col1, col2 = st.columns([1.0, 4]) 
+    
+    # La imagen se lee del disco una vez y la comparten todas las sesiones
+    imagen = imagen_principal()
+    
+    with col1:
+        # Verifica si el archivo de imagen existe antes de intentar mostrarlo
+        if imagen is not None:
+            st.image(imagen)
+        else:
+            st.warning(f"Advertencia: No se encontró la imagen en la ruta '{RUTA_IMAGEN}'. Asegúrate de que el archivo exista.")
+    
+    with col2:
+        st.title("Te gusto el Aumento ? 😢")
+
+    st.markdown("""
+    ¡Bienvenido a tu herramienta para visualizar tus ingresos!
+    
+    Esta aplicación te permite de manera sencilla:
+    
+    * Calcular tus nuevos salarios después de un aumento.
+    * Visualizar el impacto de tus aumentos con gráficos interactivos.
+    * Analizar tu historial salarial de forma clara.
+    """)
+    
+    st.header("¿Cómo empezar?")
+    st.markdown("""
+    Simplemente sigue estos 3 pasos:
+    
+    1.  **Navega a la página de "Gráficos Interactivos"** usando el menú de la izquierda.
+    2.  **Ingresa tu información** de salario y aumento en el formulario. Los gráficos se actualizarán automáticamente.
+    3.  **Opcional: Si tienes muchos datos,** ve a la página de "Visualización" y carga un archivo CSV para un análisis más completo.
+    
+    ¡Y listo! Podrás ver cómo tus aumentos afectan tus ingresos de manera visual e interactiva.
+
+    """)
+    st.warning("No olvides que puedes usar el menú lateral en cualquier momento para ir a las diferentes secciones.")
+    st.warning("No olvides darles las gracias a tu VP por este maravilloso aumento. 😂", icon="⚠️")
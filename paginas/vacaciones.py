@@ -0,0 +1,91 @@
+from datetime import date
+import streamlit as st
+from calculadora.instrumentacion import tramo
+from paginas.comun import get_exchange_rates
+
+
+def Vacaciones():
+    """Página para calculo de Vacaciones."""
+    st.title("Cálculo de Vacaciones")
+    st.markdown("""
+    Aquí puedes calcular el monto de tu pago de vacaciones y bono vacacional.
+    
+    Ingresa los siguientes datos:
+    """)
+
+    with st.form(key='vacaciones_form'):
+        col1, col2 = st.columns(2)
+        with col1:
+            fecha_ingreso = st.date_input("Fecha de Ingreso", date.today(), key="fecha_ingreso")
+        with col2:
+            salario_mensual = st.number_input("Salario Mensual (VES)", min_value=0.0, format="%f", key="salario_mensual")
+
+        st.markdown("---")
+        st.subheader("Fechas de Disfrute (Opcional)")
+        st.markdown("Estas fechas se usan para el calendario y el conteo de días hábiles; el monto se calcula con los días que corresponden por antigüedad.")
+        col3, col4 = st.columns(2)
+        with col3:
+            fecha_inicio = st.date_input("Fecha de Inicio de Vacaciones", date.today(), key="fecha_inicio_vacaciones")
+        with col4:
+            fecha_fin = st.date_input("Fecha de Fin de Vacaciones", date.today(), key="fecha_fin_vacaciones")
+
+        calcular_button = st.form_submit_button(label="Calcular Vacaciones")
+
+    if calcular_button and salario_mensual > 0:
+        # Las librerías de cálculo se cargan solo cuando se envía el formulario
+        from calculadora.motor import calcular_vacaciones_pago
+        from calculadora.calendario import construir_calendarios, dias_habiles
+        from calculadora.reportes import reporte_vacaciones
+
+        # Realizar los cálculos
+        with tramo("calculo"):
+            antiguedad_anos, dias_vacaciones, monto_bono, pago_total_ves = calcular_vacaciones_pago(salario_mensual, fecha_ingreso)
+
+        # Obtener las tasas de cambio para la conversión
+        dolar_rate, euro_rate = get_exchange_rates()
+        
+        # Mostrar el resultado del cálculo en VES
+        st.subheader("Resultados del Cálculo")
+        st.markdown(f"**Antigüedad:** {antiguedad_anos} años")
+        st.markdown(f"**Días de Vacaciones:** {dias_vacaciones} días")
+        st.markdown(f"**Días de Bono Vacacional:** 15 días")
+        st.metric(label="Monto Total a Pagar (VES)", value=f"Bs. {pago_total_ves:,.2f}")
+
+        # Si las tasas de cambio se obtuvieron correctamente, mostrar las conversiones
+        if dolar_rate and euro_rate:
+            pago_total_usd = pago_total_ves / dolar_rate
+            pago_total_eur = pago_total_ves / euro_rate
+            
+            # Mostrar los montos con el nuevo formato
+            st.metric(label="Monto Total a Pagar (USD)", value=f"$ {pago_total_usd:,.2f}")
+            st.metric(label="Monto Total a Pagar (EUR)", value=f"€ {pago_total_eur:,.2f}")
+        else:
+            st.error("No se pudieron obtener las tasas de cambio. Por favor, inténtalo de nuevo más tarde.")
+
+        # --- Nuevo Calendario Visual de Vacaciones ---
+        st.subheader("Calendario de Vacaciones")
+        calendarios_df = None
+        if fecha_fin < fecha_inicio:
+            st.error("La fecha de fin de vacaciones no puede ser anterior a la fecha de inicio.")
+        else:
+            with tramo("calendario"):
+                calendarios_df = construir_calendarios(fecha_inicio, fecha_fin)
+
+            # Mostrar cada calendario
+            for month_name, df in calendarios_df:
+                st.subheader(f"Calendario de Vacaciones - {month_name}")
+                st.dataframe(df, hide_index=True)
+
+            st.markdown(f"**Número de Días de Vacaciones:** {(fecha_fin - fecha_inicio).days + 1} días.")
+            st.markdown(f"**Días Hábiles (sin fines de semana ni feriados):** {dias_habiles(fecha_inicio, fecha_fin)} días.")
+        
+        # --- Botón de descarga para el reporte de vacaciones en formato HTML ---
+        # El reporte se arma solo cuando el usuario hace clic en el botón
+        st.download_button(
+            label="Descargar Reporte de Vacaciones",
+            data=lambda: reporte_vacaciones(antiguedad_anos, dias_vacaciones, pago_total_ves,
+                                            dolar_rate, euro_rate, calendarios_df).encode('utf-8'),
+            file_name="reporte_vacaciones.html",
+            mime="text/html",
+            on_click="ignore"
+        )
@@ -0,0 +1,281 @@
+import io
+import os
+import sqlite3
+from datetime import date
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from calculadora.esquema import validar
+from calculadora.ingesta import bloques_enriquecidos, bloques_rechazados, columnas_validas, enriquecer, ingerir_csv
+from calculadora.cache_cargas import cache_global, clave_carga
+from calculadora.historial_salarial import HistorialSalarial
+from calculadora.instrumentacion import tramo
+from calculadora.agregacion import MAX_BARRAS, por_bandas, reducir_series, top_n_con_otros
+from paginas.comun import archivo_ejemplo, boton_descarga_datos, botones_descarga_grafico, get_exchange_rates, historial_tasas
+
+# Tamaño a partir del cual el CSV de Visualización se procesa por bloques
+UMBRAL_BYTES_BLOQUES = int(os.environ.get("CALCULADORA_UMBRAL_BLOQUES_MB", "20")) * 1024 * 1024
+BANDA_SALARIAL = "Banda salarial"
+
+
+def Visualizacion():
+    """Página para cargar y visualizar datos desde un archivo CSV."""
+    st.title("Visualización de Datos")
+    st.write("Carga un archivo CSV para la visualización de tu Aumento.")
+    st.warning("El archivo CSV debe contener las columnas 'Empleado', 'Salario_Actual', 'Aumento_(%)' o 'Monto_Aumento' y 'Fecha_Aumento', separadas por coma.")
+    file_csv = st.file_uploader("Carga tu archivo CSV", type=["csv"])
+    if file_csv is None and st.checkbox("Usar el archivo de ejemplo"):
+        file_csv = archivo_ejemplo()
+
+    with st.expander("Historial de tasas de cambio"):
+        st.write("Las conversiones a USD/EUR usan la tasa vigente en la fecha de cada aumento. "
+                 "Puedes importar tasas pasadas desde un CSV con las columnas 'fecha', 'dolar' y 'euro'.")
+        file_tasas = st.file_uploader("Carga un historial de tasas", type=["csv", "json"], key="file_tasas")
+        if file_tasas is not None and historial_tasas() is None:
+            st.error("No se pudo abrir el historial de tasas local.")
+        elif file_tasas is not None and st.button("Importar tasas"):
+            try:
+                nuevas = historial_tasas().importar(file_tasas)
+                st.success(f"Se importaron {nuevas} tasas nuevas.")
+            except (ValueError, sqlite3.Error) as e:
+                st.error(f"No se pudo importar el historial de tasas: {e}")
+
+    if file_csv is not None and file_csv.size > UMBRAL_BYTES_BLOQUES:
+        # Archivos grandes: se leen por bloques y solo se guardan agregados y una vista previa
+        Visualizacion_por_bloques(file_csv)
+    elif file_csv is not None:
+        # Obtener las tasas de cambio
+        dolar_rate, euro_rate = get_exchange_rates()
+        tasas_ok = bool(dolar_rate and euro_rate)
+        if not tasas_ok:
+            dolar_rate = 1
+            euro_rate = 1
+
+        # El archivo ya procesado con las mismas tasas se toma de la caché compartida
+        historial = historial_tasas()
+        clave = clave_carga(file_csv.getvalue(), dolar_rate, euro_rate, date.today(),
+                            len(historial) if historial is not None else 0)
+        cache = cache_global()
+
+        def cargar():
+            with tramo("ingesta", bytes=file_csv.size):
+                df_cargado = pd.read_csv(file_csv)
+                entrada = {"cargado": df_cargado}
+                if columnas_validas(df_cargado.columns):
+                    # Las filas con valores inválidos se apartan; el resto sigue al cálculo
+                    validos, entrada["rechazados"] = validar(df_cargado)
+                    # Calcular el nuevo salario y las conversiones a USD/EUR
+                    entrada["datos"] = enriquecer(validos, dolar_rate, euro_rate, historial)
+            return entrada
+
+        # Si otras sesiones cargan el mismo archivo a la vez, solo una lo procesa
+        entrada = cache.obtener_o_calcular(clave, cargar)
+
+        st.write("Datos Cargados:")
+        st.dataframe(entrada["cargado"])
+
+        # Validar columnas necesarias
+        if "datos" in entrada:
+            if not tasas_ok:
+                st.error("No se pudieron obtener las tasas de cambio. Los valores en USD/EUR no se mostrarán.")
+            df = entrada["datos"]
+            filas_rechazadas(entrada["rechazados"], len(entrada["rechazados"]),
+                             lambda: [entrada["rechazados"]], "formato_rechazados_visualizacion")
+
+            st.write("Datos con Nuevo Salario Calculado:")
+            st.dataframe(df.round(dict.fromkeys(df.select_dtypes("number").columns, 2))) # Redondeamos para mejor visualización
+            boton_descarga_datos(lambda: [df], "datos_calculados", "Descargar Datos Calculados",
+                                 clave="formato_datos_visualizacion")
+            st.write("Resumen Estadístico:")
+
+            opciones = ['Empleado', BANDA_SALARIAL] + (['Departamento'] if 'Departamento' in df.columns else [])
+            agrupar_por = st.selectbox("Agrupar comparación por", opciones, key="agrupar_graficos")
+
+            # Los gráficos se construyen una vez por archivo y agrupación, y se guardan junto a los datos
+            clave_graficos = f"graficos_{agrupar_por}"
+            if clave_graficos not in entrada:
+                with tramo("graficos", filas=len(df)):
+                    entrada[clave_graficos] = graficos_visualizacion(df, agrupar_por)
+                cache.guardar(clave, entrada)
+            fig, fig2, puntos_graficados = entrada[clave_graficos]
+            st.caption(puntos_graficados)
+
+            # GRÁFICO 1: Comparación de salarios
+            st.plotly_chart(fig)
+
+            # GRÁFICO 2: Evolución de salarios en el tiempo
+            if fig2 is not None:
+                st.plotly_chart(fig2)
+            else:
+                st.error("Para el gráfico de evolución, el archivo debe contener la columna 'Fecha_Aumento'.")
+
+            # Botones de descarga (los archivos se generan al hacer clic)
+            # La clave del archivo ya identifica los datos de los gráficos; no hace falta serializarlos
+            botones_descarga_grafico(fig, "Descargar Gráficos Comparación",
+                                     "Grafico_comparacion_salarios_Antes_Despues",
+                                     clave=f"{clave}:comparacion:{agrupar_por}")
+            if fig2 is not None:
+                botones_descarga_grafico(fig2, "Descargar Gráficos Evolución de Salario",
+                                         "Grafico_evolucion_salarios", clave=f"{clave}:evolucion")
+
+                # El índice del historial se arma una vez por archivo y se guarda con los datos
+                if "indice_salarial" not in entrada:
+                    with tramo("indice_salarial"):
+                        entrada["indice_salarial"] = HistorialSalarial.desde_dataframe(df)
+                    cache.guardar(clave, entrada)
+                consulta_historial(entrada["indice_salarial"])
+        else:
+            st.error("El archivo CSV no contiene las columnas necesarias.")
+            st.write("Asegúrate de que tu archivo CSV tenga las siguientes columnas:")
+            st.write("- Empleado")
+            st.write("- Salario_Actual")
+            st.write("- Aumento_(%) o Monto_Aumento")
+            st.write("- Fecha_Aumento")
+
+def filas_rechazadas(rechazados, cantidad, bloques, clave):
+    """Aviso con las filas apartadas por valores inválidos y la descarga del reporte de rechazos."""
+    if not cantidad:
+        return
+    st.warning(f"{cantidad:,} filas tienen valores inválidos y no se incluyeron en los cálculos.")
+    with st.expander("Filas rechazadas"):
+        if cantidad > len(rechazados):
+            st.caption(f"Se muestran las primeras {len(rechazados):,} filas; el reporte descargado las incluye todas.")
+        st.dataframe(rechazados, hide_index=True)
+        boton_descarga_datos(bloques, "filas_rechazadas", "Descargar Reporte de Filas Rechazadas", clave=clave)
+
+
+def graficos_visualizacion(df, agrupar_por='Empleado'):
+    """
+    Construye los gráficos de comparación y de evolución (None si no hay fechas).
+    `agrupar_por` solo cambia el de comparación; la evolución es por empleado.
+    Con muchos empleados los datos se reducen antes de graficar; devuelve también
+    un texto con los puntos graficados frente a las filas del archivo.
+    """
+    valores = ['Salario_Actual', 'Nuevo Salario']
+    if agrupar_por == BANDA_SALARIAL:
+        datos_barras = por_bandas(df, 'Salario_Actual', valores)
+        eje_barras = datos_barras.columns[0]
+    elif df[agrupar_por].nunique() > MAX_BARRAS:
+        datos_barras = top_n_con_otros(df, agrupar_por, valores, orden='Nuevo Salario')
+        eje_barras = agrupar_por
+    else:
+        datos_barras = df
+        eje_barras = agrupar_por
+    fig = px.bar(datos_barras, x=eje_barras, y=valores, barmode='group',
+                 title="Comparación de Salarios Antes y Después del Aumento")
+    puntos = len(datos_barras) * len(valores)
+
+    fig2 = None
+    if 'Fecha_Aumento' in df.columns:
+        # La evolución es siempre por empleado: las filas de un departamento o banda son
+        # de personas distintas y encadenarlas como una sola serie no tiene sentido
+        serie = 'Empleado'
+
+        # El índice del historial ordena los aumentos una sola vez y arma la serie escalonada
+        df_evolucion = HistorialSalarial.desde_dataframe(df, serie).evolucion(hoy=date.today())
+        reduccion = reducir_series(df_evolucion, 'Fecha', 'Salario', serie, ordenado=True)
+        puntos += reduccion.puntos
+
+        # Generar el gráfico de línea (WebGL si hay muchos puntos)
+        fig2 = px.line(reduccion.datos, x='Fecha', y='Salario', color=serie,
+                       title="Evolución del Salario en el Tiempo", line_shape='hv',
+                       render_mode='webgl' if reduccion.webgl else 'auto')
+    return fig, fig2, f"Se graficaron {puntos:,} puntos a partir de {len(df):,} filas."
+
+
+def consulta_historial(indice):
+    """Consultas sobre el historial de aumentos de un empleado."""
+    with st.expander("Consultar historial de un empleado"):
+        empleado = st.selectbox("Empleado", list(indice.nombres), key="historial_empleado")
+        col1, col2 = st.columns(2)
+        with col1:
+            desde = st.date_input("Desde", date.today().replace(year=date.today().year - 1), key="historial_desde")
+        with col2:
+            hasta = st.date_input("Hasta", date.today(), key="historial_hasta")
+        if hasta < desde:
+            st.error("La fecha final no puede ser anterior a la inicial.")
+            return
+
+        st.metric(label=f"Salario al {hasta}", value=f"Bs. {indice.salario_en(empleado, hasta):,.2f}")
+        st.metric(label=f"Aumento acumulado desde {desde}", value=f"{indice.aumento_acumulado(empleado, desde, hasta):,.2f} %")
+        st.write("Aumentos en el rango:")
+        aumentos = indice.aumentos_entre(empleado, desde, hasta)
+        if indice.combinadas:
+            st.caption(f"{indice.combinadas:,} filas del archivo repetían empleado y fecha y se combinaron "
+                       "en un solo aumento (del salario previo de la primera al nuevo de la última).")
+        st.dataframe(aumentos.round(dict.fromkeys(aumentos.select_dtypes("number").columns, 2)), hide_index=True)
+
+
+def Visualizacion_por_bloques(file_csv):
+    """Visualización de archivos grandes a partir de agregados calculados por bloques."""
+    st.info("El archivo es grande: se procesará por bloques y se mostrará un resumen por empleado.")
+    float32 = st.checkbox("Usar precisión simple (float32) para reducir memoria", value=False)
+
+    dolar_rate, euro_rate = get_exchange_rates()
+    if not dolar_rate or not euro_rate:
+        st.error("No se pudieron obtener las tasas de cambio. Los valores en USD/EUR no se mostrarán.")
+        dolar_rate = 1
+        euro_rate = 1
+
+    # El resultado se guarda en la caché compartida por el hash del contenido: cambiar de página
+    # en la vista previa o de opción no vuelve a leer el archivo
+    historial = historial_tasas()
+    contenido = file_csv.getvalue()
+    clave = clave_carga(contenido, "bloques", dolar_rate, euro_rate, float32, date.today(),
+                        len(historial) if historial is not None else 0)
+
+    def cargar():
+        with st.spinner("Procesando archivo..."), tramo("ingesta_bloques", bytes=file_csv.size):
+            return {"resultado": ingerir_csv(io.BytesIO(contenido), dolar_rate, euro_rate, historial, float32=float32)}
+
+    try:
+        resultado = cache_global().obtener_o_calcular(clave, cargar)["resultado"]
+    except ValueError:
+        st.error("El archivo CSV no contiene las columnas necesarias.")
+        st.write("Asegúrate de que tu archivo CSV tenga las siguientes columnas:")
+        st.write("- Empleado")
+        st.write("- Salario_Actual")
+        st.write("- Aumento_(%) o Monto_Aumento")
+        st.write("- Fecha_Aumento")
+        return
+
+    st.caption(f"{resultado.filas:,} filas procesadas en {resultado.segundos:.1f} s "
+               f"({resultado.filas_por_segundo:,.0f} filas/s).")
+    # El reporte completo de rechazos vuelve a leer el archivo; en pantalla solo se muestran los primeros
+    filas_rechazadas(resultado.rechazados, resultado.filas_rechazadas,
+                     lambda: bloques_rechazados(io.BytesIO(contenido)), "formato_rechazados_bloques")
+
+    # Vista previa paginada de las primeras filas
+    st.write("Vista previa de los datos con Nuevo Salario Calculado:")
+    filas_pagina = 50
+    paginas = max(1, -(-len(resultado.vista) // filas_pagina))
+    pagina = st.number_input("Página", min_value=1, max_value=paginas, value=1, step=1)
+    inicio = (pagina - 1) * filas_pagina
+    vista = resultado.vista.iloc[inicio:inicio + filas_pagina]
+    st.dataframe(vista.round(dict.fromkeys(vista.select_dtypes("number").columns, 2)))
+
+    # La descarga vuelve a leer el archivo por bloques y los escribe directo al archivo exportado
+    boton_descarga_datos(
+        lambda: bloques_enriquecidos(io.BytesIO(contenido), dolar_rate, euro_rate, historial, float32=float32),
+        "datos_calculados", "Descargar Datos Calculados", clave="formato_datos_bloques")
+
+    st.write("Resumen por Empleado:")
+    st.dataframe(resultado.por_empleado.round(2), hide_index=True)
+
+    # GRÁFICO 1: Comparación de salarios promedio por empleado
+    por_empleado = top_n_con_otros(resultado.por_empleado, 'Empleado', ['Salario_Actual', 'Nuevo Salario'],
+                                   orden='Nuevo Salario')
+    fig = px.bar(por_empleado, x='Empleado', y=['Salario_Actual', 'Nuevo Salario'], barmode='group',
+                 title="Comparación de Salarios Promedio Antes y Después del Aumento")
+    st.plotly_chart(fig)
+
+    # GRÁFICO 2: Evolución mensual del salario promedio
+    if resultado.por_mes is not None:
+        reduccion = reducir_series(resultado.por_mes, 'Fecha', 'Salario', 'Empleado')
+        fig2 = px.line(reduccion.datos, x='Fecha', y='Salario', color='Empleado',
+                       title="Evolución del Salario en el Tiempo (promedio mensual)",
+                       render_mode='webgl' if reduccion.webgl else 'auto')
+        st.caption(reduccion.descripcion())
+        st.plotly_chart(fig2)
+    else:
+        st.error("Para el gráfico de evolución, el archivo debe contener la columna 'Fecha_Aumento'.")
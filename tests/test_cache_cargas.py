@@ -0,0 +1,44 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import pytest
+
+from calculadora.cache_cargas import CacheCargas, _tamano_valor
+
+
+def grande(filas=10_000):
+    return pd.DataFrame({"Salario": np.arange(filas, dtype="float64")})
+
+
+def test_desborde_a_disco_y_lectura(tmp_path):
+    pytest.importorskip("pyarrow")
+    cache = CacheCargas(max_bytes=100_000, directorio=str(tmp_path))
+    cache.guardar("a", {"datos": grande()})
+    cache.guardar("b", {"datos": grande()})
+    assert cache.estadisticas()["desalojos"] == 1
+    pd.testing.assert_frame_equal(cache.obtener("a")["datos"], grande())
+    assert cache.estadisticas()["aciertos_disco"] == 1
+
+
+def test_columnas_mezcladas_no_se_bajan_a_disco(tmp_path):
+    pytest.importorskip("pyarrow")
+    cache = CacheCargas(max_bytes=100_000, directorio=str(tmp_path))
+    # Fechas y texto en la misma columna: pyarrow lanza ArrowTypeError
+    mezclada = grande().assign(Fecha=[date(2024, 1, 1), "sin fecha"] * 5_000)
+    cache.guardar("a", {"datos": mezclada})
+    cache.guardar("b", {"datos": grande()})
+    assert cache.obtener("a") is None
+    assert list(tmp_path.iterdir()) == []
+    assert cache.obtener("b") is not None
+
+
+def test_figuras_se_miden_sin_serializar():
+    df = pd.DataFrame({"x": np.arange(50_000), "y": np.random.default_rng(0).random(50_000),
+                       "serie": np.repeat(["Ana", "Luis"], 25_000)})
+    fig = px.line(df, x="x", y="y", color="serie")
+    fig.to_json = lambda *a, **k: pytest.fail("serializó la figura")
+    tamano = _tamano_valor({"grafico": fig})
+    # Los arreglos x e y de las dos trazas
+    assert 800_000 <= tamano < 1_000_000
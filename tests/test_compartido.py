@@ -0,0 +1,50 @@
+import pytest
+
+from calculadora.compartido import BackendRedis, CacheCompartida, ServidorRedisPrueba, backend_desde_entorno
+
+
+@pytest.fixture
+def servidor():
+    with ServidorRedisPrueba() as servidor:
+        yield servidor
+
+
+def test_redis_guarda_y_obtiene(servidor):
+    cache = CacheCompartida(BackendRedis(servidor.url))
+    llamadas = []
+
+    def calcular():
+        llamadas.append(1)
+        return {"dolar": 36.5}
+
+    assert cache.obtener_o_calcular("tasas", calcular, ttl=60) == {"dolar": 36.5}
+    assert cache.obtener_o_calcular("tasas", calcular, ttl=60) == {"dolar": 36.5}
+    assert len(llamadas) == 1
+
+
+def test_rediss_no_envia_en_claro_a_un_servidor_sin_tls(servidor):
+    # El servidor de prueba no habla TLS: el cliente falla en el saludo y no manda el comando
+    cifrado = BackendRedis(servidor.url.replace("redis://", "rediss://", 1))
+    cifrado.guardar("clave", b"secreto", ttl=60)
+    assert cifrado.obtener("clave") is None
+    assert cifrado.errores == 2
+    assert BackendRedis(servidor.url).obtener("clave") is None
+
+
+def test_url_desconocida():
+    with pytest.raises(ValueError):
+        backend_desde_entorno("memcached://localhost")
+    with pytest.raises(ValueError):
+        BackendRedis("http://localhost:6379")
+
+
+def test_error_al_calcular_no_deja_la_clave_en_curso():
+    cache = CacheCompartida(backend_desde_entorno("memoria"))
+
+    def falla():
+        raise ConnectionError("BCV caído")
+
+    with pytest.raises(ConnectionError):
+        cache.obtener_o_calcular("tasas", falla)
+    assert cache._en_curso == {}
+    assert cache.obtener_o_calcular("tasas", lambda: [36.5, 39.8]) == [36.5, 39.8]
@@ -0,0 +1,74 @@
+from datetime import date
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from calculadora import escenarios as modulo
+from calculadora.escenarios import Escenario, proyectar_liquidaciones
+from calculadora.motor import calcular_liquidacion_lote
+
+ESCENARIOS = [
+    Escenario("fin_de_ano", date(2025, 12, 31)),
+    Escenario("bisiesto", date(2024, 2, 29), 1.2),
+    Escenario("antiguo", date(2010, 6, 30), 0.5),
+]
+
+
+def nomina(filas=103, semilla=0):
+    azar = np.random.default_rng(semilla)
+    ingresos = pd.Timestamp("2000-01-01") + pd.to_timedelta(azar.integers(0, 9_500, filas), unit="D")
+    return pd.DataFrame({
+        "Empleado": [f"Empleado_{i}" for i in range(filas)],
+        "Fecha_Ingreso": ingresos,
+        "Salario_Base": azar.uniform(100, 50_000, filas).round(2),
+        "Bono_Promedio": azar.uniform(0, 5_000, filas).round(2),
+        "Dias_Vacaciones_Pendientes": azar.integers(0, 30, filas),
+        "Adelanto": azar.uniform(0, 1_000, filas).round(2),
+    })
+
+
+def test_serie_igual_a_pool():
+    datos = nomina()
+    serie = proyectar_liquidaciones(datos, ESCENARIOS, procesos=1, tamano_particion=10)
+    pool = proyectar_liquidaciones(datos, ESCENARIOS, procesos=3, tamano_particion=10)
+    assert_frame_equal(serie, pool)
+    assert serie["escenario"].tolist() == [e.nombre for e in ESCENARIOS for _ in range(len(datos))]
+    assert serie["Empleado"].tolist() == datos["Empleado"].tolist() * len(ESCENARIOS)
+
+
+def test_egresos_anteriores_al_ingreso():
+    datos = nomina()
+    resultado = proyectar_liquidaciones(datos, ESCENARIOS, procesos=2, tamano_particion=10)
+    antiguo = resultado[resultado["escenario"] == "antiguo"].reset_index(drop=True)
+    invalidos = datos["Fecha_Ingreso"] > pd.Timestamp("2010-06-30")
+    assert invalidos.any() and not invalidos.all()
+    assert antiguo.loc[invalidos, "total_neto"].isna().all()
+
+    esperado = calcular_liquidacion_lote(datos["Fecha_Ingreso"], date(2010, 6, 30), datos["Salario_Base"],
+                                         datos["Bono_Promedio"] * 0.5, datos["Dias_Vacaciones_Pendientes"],
+                                         datos["Adelanto"])
+    assert np.allclose(antiguo["total_neto"], esperado["total_neto"], equal_nan=True)
+
+
+class MemoriaRegistrada(shared_memory.SharedMemory):
+    creadas = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        MemoriaRegistrada.creadas.append(self.name)
+
+
+def test_memoria_compartida_liberada_tras_error(monkeypatch):
+    monkeypatch.setattr(modulo.shared_memory, "SharedMemory", MemoriaRegistrada)
+    MemoriaRegistrada.creadas = []
+    # La fecha inválida hace fallar a un trabajador después de crear los bloques
+    escenarios = ESCENARIOS + [Escenario("roto", "no es una fecha")]
+    with pytest.raises(ValueError):
+        proyectar_liquidaciones(nomina(), escenarios, procesos=2, tamano_particion=50)
+    assert len(MemoriaRegistrada.creadas) == len(modulo.COLUMNAS) + 1
+    for nombre in MemoriaRegistrada.creadas:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=nombre)
@@ -0,0 +1,108 @@
+import gzip
+import io
+
+import pandas as pd
+import plotly.express as px
+import pytest
+
+from calculadora import exportacion
+from calculadora.exportacion import EscritorDatos, FORMATOS_DATOS, exportar_archivo, exportar_datos, html_figura
+
+
+def datos():
+    return pd.DataFrame({"Empleado": ["Ana", "Luis"], "Salario_Actual": [100.0, 250.5]})
+
+
+def bloques():
+    """Tres bloques con texto, enteros, decimales y fechas, como los del CLI."""
+    return [
+        pd.DataFrame({
+            "Empleado": [f"Empleado_{i}" for i in range(inicio, inicio + 4)],
+            "Dias": range(inicio, inicio + 4),
+            "Salario": [1_000.5 + i for i in range(inicio, inicio + 4)],
+            "Fecha": pd.to_datetime(["2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30"]) + pd.Timedelta(days=inicio),
+        })
+        for inicio in (0, 4, 8)
+    ]
+
+
+def leer(contenido, formato):
+    if formato == "parquet":
+        return pd.read_parquet(io.BytesIO(contenido))
+    if formato == "arrow":
+        import pyarrow as pa
+
+        return pa.ipc.open_file(pa.BufferReader(contenido)).read_pandas()
+    if formato == "csv.gz":
+        contenido, formato = gzip.decompress(contenido), "csv"
+    if formato == "csv":
+        return pd.read_csv(io.BytesIO(contenido), parse_dates=["Fecha"])
+    df = pd.read_json(io.BytesIO(contenido), lines=True)
+    df["Fecha"] = pd.to_datetime(df["Fecha"]).dt.tz_localize(None)
+    return df
+
+
+@pytest.mark.parametrize("formato", list(FORMATOS_DATOS))
+def test_escritor_datos_ida_y_vuelta(formato, tmp_path):
+    if formato in ("parquet", "arrow"):
+        pytest.importorskip("pyarrow")
+    esperado = pd.concat(bloques(), ignore_index=True)
+
+    # A un archivo abierto (que no se cierra) y a una ruta
+    buffer = io.BytesIO()
+    escritor = EscritorDatos(buffer, formato)
+    for bloque in bloques():
+        escritor.escribir(bloque)
+    escritor.cerrar()
+    assert not buffer.closed and escritor.filas == len(esperado)
+
+    ruta = tmp_path / f"datos.{FORMATOS_DATOS[formato][1]}"
+    escritor = EscritorDatos(str(ruta), formato)
+    for bloque in bloques():
+        escritor.escribir(bloque)
+    escritor.cerrar()
+
+    for contenido in (buffer.getvalue(), ruta.read_bytes(), exportar_archivo(bloques(), formato)):
+        pd.testing.assert_frame_equal(leer(contenido, formato), esperado, check_dtype=False,
+                                      check_index_type=False)
+
+
+def test_formato_desconocido():
+    with pytest.raises(ValueError, match="xlsx"):
+        EscritorDatos(io.BytesIO(), "xlsx")
+
+
+@pytest.mark.parametrize("formato", ["json", "parquet"])
+def test_exportar_datos_ida_y_vuelta(formato):
+    if formato == "parquet":
+        pytest.importorskip("pyarrow")
+        leido = pd.read_parquet(io.BytesIO(exportar_datos(datos(), formato)))
+    else:
+        leido = pd.read_json(io.BytesIO(exportar_datos(datos(), formato)))
+    pd.testing.assert_frame_equal(leido, datos())
+
+
+@pytest.mark.parametrize("formato", list(FORMATOS_DATOS))
+def test_exportar_archivo_devuelve_bytes(formato):
+    if formato in ("parquet", "arrow"):
+        pytest.importorskip("pyarrow")
+    assert isinstance(exportar_archivo([datos()], formato), bytes)
+
+
+def test_html_figura_incluye_plotlyjs_por_defecto(monkeypatch):
+    monkeypatch.setattr(exportacion, "_exportaciones", exportacion.OrderedDict())
+    fig = px.bar(datos(), x="Empleado", y="Salario_Actual")
+    incluido = html_figura(fig, "datos")
+    assert b'src="https://cdn.plot.ly' not in incluido
+    cdn = html_figura(fig, "datos", plotlyjs="cdn")
+    assert b'src="https://cdn.plot.ly' in cdn
+    assert len(cdn) < len(incluido) - 1_000_000
+
+
+def test_html_figura_con_clave_no_serializa_la_figura(monkeypatch):
+    monkeypatch.setattr(exportacion, "_exportaciones", exportacion.OrderedDict())
+    monkeypatch.setattr(exportacion, "huella_figura", lambda fig: pytest.fail("serializó la figura"))
+    fig = px.bar(datos(), x="Empleado", y="Salario_Actual")
+    primero = html_figura(fig, "archivo:comparacion", plotlyjs="cdn")
+    fig.to_html = lambda **_: pytest.fail("volvió a exportar")
+    assert html_figura(fig, "archivo:comparacion", plotlyjs="cdn") is primero
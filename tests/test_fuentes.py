@@ -0,0 +1,64 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from calculadora.fuentes import (
+    ErrorTasas, FuenteBCV, FuenteTasas, ServidorBCVPrueba, crear_sesion, opcion_verificar_ssl, parsear_html_bcv,
+)
+
+
+@pytest.fixture
+def servidor():
+    with ServidorBCVPrueba(dolar=36.5, euro=39.8) as s:
+        yield s
+
+
+def fuente(servidor, reintentos=2):
+    return FuenteBCV(url=servidor.url, sesion=crear_sesion(reintentos=reintentos, backoff=0), timeout=(1, 2))
+
+
+def test_fuente_tasas_es_abstracta():
+    with pytest.raises(TypeError):
+        FuenteTasas()
+
+
+def test_bcv_lee_las_tasas_con_coma_decimal(servidor):
+    assert fuente(servidor).obtener() == (36.5, 39.8)
+    assert servidor.peticiones == 1
+
+
+def test_bcv_reintenta_errores_del_servidor(servidor):
+    servidor.fallos = 2
+    assert fuente(servidor, reintentos=2).obtener() == (36.5, 39.8)
+    assert servidor.peticiones == 3
+
+
+def test_bcv_sin_respuesta_valida_lanza_error_tasas(servidor):
+    servidor.estado = 503
+    with pytest.raises(ErrorTasas):
+        fuente(servidor, reintentos=2).obtener()
+    assert servidor.peticiones == 3
+
+
+def test_html_sin_tasas_lanza_error_tasas():
+    with pytest.raises(ErrorTasas, match="estructura HTML"):
+        parsear_html_bcv(b"<html><body><div id='dolar'></div></body></html>")
+    with pytest.raises(ErrorTasas, match="formato"):
+        parsear_html_bcv(b"<div id='dolar'><strong>n/d</strong></div><div id='euro'><strong>1,0</strong></div>")
+
+
+@pytest.mark.parametrize("valor, esperado", [("1", True), ("", True), ("0", False), ("/etc/bcv-ca.pem", "/etc/bcv-ca.pem")])
+def test_opcion_verificar_ssl(valor, esperado):
+    assert opcion_verificar_ssl(valor) == esperado
+
+
+def test_pool_lleno_no_bloquea(servidor):
+    # Con una sola conexión en el pool, la segunda petición no espera a que termine la primera
+    servidor.retraso = 0.5
+    bcv = FuenteBCV(url=servidor.url, sesion=crear_sesion(tamano_pool=1), timeout=(1, 2))
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(2) as hilos:
+        resultados = list(hilos.map(lambda _: bcv.obtener(), range(2)))
+    assert resultados == [(36.5, 39.8)] * 2
+    assert time.perf_counter() - inicio < 0.9
@@ -0,0 +1,32 @@
+import pytest
+from streamlit.testing.v1 import AppTest
+
+
+def pagina_simulacion(dolar_rate):
+    from datetime import date
+
+    from calculadora.registros import RegistrosSesion
+    from paginas.graficos_interactivos import simulacion_escenarios
+
+    registros = RegistrosSesion()
+    registros.agregar("Ana", 3_000.0, 0.0, 10.0, date(2025, 1, 1))
+    simulacion_escenarios(registros, dolar_rate)
+
+
+def simulacion(dolar_rate):
+    return AppTest.from_function(pagina_simulacion, args=(dolar_rate,)).run()
+
+
+@pytest.mark.parametrize("dolar_rate", [None, 0])
+def test_sin_tasa_no_se_simula(dolar_rate):
+    at = simulacion(dolar_rate)
+    assert not at.exception
+    assert "tasa del dólar" in at.warning[0].value
+    assert not at.button
+
+
+def test_con_tasa_se_simula():
+    at = simulacion(36.5)
+    at.button(key="sim_boton").click().run()
+    assert not at.exception and not at.warning
+    assert len(at.dataframe) == 1
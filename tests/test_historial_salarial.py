@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from calculadora.historial_salarial import HistorialSalarial
+
+
+def historial():
+    # Ana tiene dos filas el 2024-06-01: se combinan de 1.100 (primera) a 1.300 (última)
+    return HistorialSalarial.desde_dataframe(pd.DataFrame({
+        "Empleado": ["Ana", "Ana", "Luis", "Ana", "Ana"],
+        "Fecha_Aumento": pd.to_datetime(["2024-06-01", "2024-01-01", "2024-03-01", "2024-06-01", "2025-01-01"]),
+        "Salario_Actual": [1_100.0, 1_000.0, 2_000.0, 1_200.0, 1_300.0],
+        "Nuevo Salario": [1_200.0, 1_100.0, 2_200.0, 1_300.0, 1_500.0],
+    }))
+
+
+def test_una_fila_por_empleado_y_fecha():
+    indice = historial()
+    assert len(indice) == 4
+    assert indice.combinadas == 1
+    claves = list(zip(indice.codigos, indice.dias))
+    assert len(set(claves)) == len(claves)
+
+    aumentos = indice.aumentos_entre("Ana", "2024-06-01", "2024-06-01")
+    assert aumentos[["Salario_Actual", "Nuevo Salario"]].values.tolist() == [[1_100.0, 1_300.0]]
+    assert indice.salario_en("Ana", "2024-06-01") == 1_300.0
+    assert indice.aumento_acumulado("Ana", "2024-05-31", "2024-06-01") == pytest.approx(1_300 / 1_100 * 100 - 100)
+
+
+def test_evolucion_sin_escalones_repetidos():
+    evolucion = historial().evolucion(hoy="2025-06-01")
+    ana = evolucion[evolucion["Empleado"] == "Ana"]
+    assert ana["Fecha"].astype(str).tolist() == ["2024-01-01", "2024-01-01", "2024-06-01", "2025-01-01", "2025-06-01"]
+    assert ana["Salario"].tolist() == [1_000.0, 1_100.0, 1_300.0, 1_500.0, 1_500.0]
+
+
+def test_historial_vacio():
+    indice = HistorialSalarial([], np.array([], dtype="datetime64[D]"), [], [])
+    assert len(indice) == 0 and indice.combinadas == 0
@@ -0,0 +1,65 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from calculadora.historial_tasas import HistorialTasas, tasas_por_fecha
+
+
+@pytest.fixture
+def historial():
+    h = HistorialTasas(":memory:")
+    h.importar(pd.DataFrame({
+        "fecha": ["2024-01-10", "2024-02-01", "2024-03-01"],
+        "dolar": [36.0, 36.2, 36.5],
+        "euro": [39.0, 39.3, 39.8],
+    }))
+    return h
+
+
+def test_fecha_exacta_y_ultima_anterior(historial):
+    fechas = pd.Series(pd.to_datetime(["2024-02-01", "2024-02-15", "2024-03-01", "2025-01-01"]))
+    tasas = tasas_por_fecha(fechas, historial, 40.0, 44.0)
+    assert tasas["dolar"].tolist() == [36.2, 36.2, 36.5, 36.5]
+    assert tasas["euro"].tolist() == [39.3, 39.3, 39.8, 39.8]
+
+
+def test_fechas_anteriores_al_historial_o_vacias_usan_la_tasa_actual(historial):
+    fechas = pd.Series(pd.to_datetime(["2023-12-31", None, "2024-01-10"]), index=[7, 3, 5])
+    tasas = tasas_por_fecha(fechas, historial, 40.0, 44.0)
+    assert tasas.index.tolist() == [7, 3, 5]
+    assert tasas["dolar"].tolist() == [40.0, 40.0, 36.0]
+    assert tasas["euro"].tolist() == [44.0, 44.0, 39.0]
+
+    # Sin tasa actual quedan vacías
+    sin_actual = tasas_por_fecha(fechas, historial)
+    assert np.isnan(sin_actual.loc[[7, 3], "dolar"]).all()
+
+
+def test_sin_historial_todas_usan_la_tasa_actual():
+    tasas = tasas_por_fecha(pd.to_datetime(["2024-05-01", "2020-01-01"]), None, 40.0, 44.0)
+    assert tasas["dolar"].tolist() == [40.0, 40.0]
+
+
+def test_importar_ignora_fechas_repetidas(historial, tmp_path):
+    ruta = tmp_path / "tasas.csv"
+    pd.DataFrame({
+        "fecha": ["2024-03-01", "2024-04-01", "2024-04-01"],
+        "dolar": [99.0, 37.0, 98.0],
+        "euro": [99.0, 40.0, 98.0],
+    }).to_csv(ruta, index=False)
+
+    assert historial.importar(str(ruta)) == 1
+    assert historial.importar(str(ruta)) == 0
+    df = historial.como_dataframe()
+    assert len(df) == 4
+    # Las fechas ya registradas conservan su tasa; dentro del archivo gana la primera fila
+    assert df.set_index("fecha").loc["2024-03-01", "dolar"] == 36.5
+    assert df.set_index("fecha").loc["2024-04-01", "dolar"] == 37.0
+    assert not historial.registrar(50.0, 55.0, fecha=date(2024, 4, 1))
+
+
+def test_importar_sin_columnas():
+    with pytest.raises(ValueError, match="euro"):
+        HistorialTasas(":memory:").importar(pd.DataFrame({"fecha": ["2024-01-01"], "dolar": [36.0]}))
@@ -0,0 +1,80 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from calculadora.motor import (
+    calcular_liquidacion, calcular_liquidacion_lote, calcular_vacaciones_lote, calcular_vacaciones_pago,
+)
+
+# Ingresos en 29 de febrero y en fin de mes, que son los que cambian de fecha en el aniversario
+INGRESOS_BORDE = [date(2020, 2, 29), date(2016, 2, 29), date(2021, 1, 31), date(2019, 12, 31),
+                  date(2023, 4, 30), date(2022, 8, 31)]
+EGRESOS_BORDE = [date(2021, 2, 28), date(2021, 3, 1), date(2024, 2, 29), date(2025, 2, 28),
+                 date(2023, 3, 31), date(2025, 12, 31)]
+
+
+def nomina(filas=500, semilla=0):
+    """Ingresos, egresos y montos aleatorios más todas las combinaciones de fechas borde."""
+    azar = np.random.default_rng(semilla)
+    inicio = date(2000, 1, 1)
+    ingresos = [inicio + timedelta(days=int(d)) for d in azar.integers(0, 9_000, filas)]
+    egresos = [i + timedelta(days=int(d)) for i, d in zip(ingresos, azar.integers(-400, 7_000, filas))]
+    for ingreso in INGRESOS_BORDE:
+        for egreso in EGRESOS_BORDE:
+            ingresos.append(ingreso)
+            egresos.append(egreso)
+    n = len(ingresos)
+    return {
+        "ingreso": ingresos,
+        "egreso": egresos,
+        "base": azar.uniform(100, 50_000, n).round(2),
+        "bono": azar.uniform(0, 5_000, n).round(2),
+        "pendientes": azar.integers(0, 30, n),
+        "adelanto": azar.uniform(0, 1_000, n).round(2),
+    }
+
+
+def test_liquidacion_escalar_igual_a_lote():
+    datos = nomina()
+    lote = calcular_liquidacion_lote(datos["ingreso"], datos["egreso"], datos["base"], datos["bono"],
+                                     datos["pendientes"], datos["adelanto"])
+    assert any(e < i for i, e in zip(datos["ingreso"], datos["egreso"]))
+
+    for fila, (ingreso, egreso) in enumerate(zip(datos["ingreso"], datos["egreso"])):
+        argumentos = (ingreso, egreso, datos["base"][fila], datos["bono"][fila],
+                      int(datos["pendientes"][fila]), datos["adelanto"][fila])
+        if egreso < ingreso:
+            with pytest.raises(ValueError):
+                calcular_liquidacion(*argumentos)
+            assert not lote.at[fila, "valido"]
+            assert np.isnan(lote.at[fila, "total_neto"])
+            continue
+        escalar = calcular_liquidacion(*argumentos)
+        assert lote.at[fila, "valido"]
+        for concepto, valor in escalar.items():
+            assert lote.at[fila, concepto] == pytest.approx(valor), (ingreso, egreso, concepto)
+
+
+@pytest.mark.parametrize("hoy", [date(2025, 2, 28), date(2025, 3, 1), date(2024, 2, 29), date(2026, 1, 31)])
+def test_vacaciones_escalar_igual_a_lote(hoy):
+    datos = nomina(semilla=1)
+    # Solo ingresos anteriores a `hoy`, como en la página
+    filas = [f for f, ingreso in enumerate(datos["ingreso"]) if ingreso <= hoy]
+    ingresos = [datos["ingreso"][f] for f in filas]
+    salarios = datos["base"][filas]
+    lote = calcular_vacaciones_lote(salarios, ingresos, hoy=hoy)
+
+    for fila, (salario, ingreso) in enumerate(zip(salarios, ingresos)):
+        anos, dias, bono, total = calcular_vacaciones_pago(salario, ingreso, hoy=hoy)
+        assert lote.at[fila, "antiguedad_anos"] == anos
+        assert lote.at[fila, "dias_vacaciones"] == dias
+        assert lote.at[fila, "monto_bono"] == pytest.approx(bono)
+        assert lote.at[fila, "pago_total"] == pytest.approx(total)
+
+
+def test_aniversario_de_29_de_febrero():
+    # En años no bisiestos el año se cumple el 1 de marzo
+    assert calcular_vacaciones_pago(3_000, date(2020, 2, 29), hoy=date(2021, 2, 28))[0] == 0
+    assert calcular_vacaciones_pago(3_000, date(2020, 2, 29), hoy=date(2021, 3, 1))[0] == 1
+    assert calcular_vacaciones_pago(3_000, date(2020, 2, 29), hoy=date(2024, 2, 29))[0] == 4
@@ -0,0 +1,28 @@
+import json
+import time
+
+import pytest
+
+from calculadora.fuentes import ErrorTasas
+from calculadora.tasas import ProveedorTasas, edad
+
+
+def bcv_caido():
+    raise ErrorTasas("BCV caído")
+
+
+def test_respaldo_conserva_la_hora_de_obtencion(tmp_path):
+    ruta = str(tmp_path / "tasas.json")
+    # Tasa consultada hace dos horas por otra réplica
+    obtenida = time.time() - 7_200
+    ProveedorTasas(obtener=lambda: (36.5, 39.8, obtenida), ruta_respaldo=ruta).obtener()
+    with open(ruta, encoding="utf-8") as f:
+        assert json.load(f) == {"dolar": 36.5, "euro": 39.8, "fecha": obtenida}
+
+    proveedor = ProveedorTasas(obtener=bcv_caido, ruta_respaldo=ruta)
+    assert proveedor.obtener() == (36.5, 39.8)
+    instantanea = proveedor.instantanea()
+    proveedor.detener_refresco()
+    assert instantanea.desde_respaldo
+    assert instantanea.obtenida == obtenida
+    assert edad(instantanea) == pytest.approx(7_200, abs=60)
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from calculadora.ingesta import enriquecer
+from paginas.visualizacion import BANDA_SALARIAL, graficos_visualizacion
+
+
+def aumentos():
+    return enriquecer(pd.DataFrame({
+        "Empleado": ["Ana", "Luis", "Ana", "Marta"],
+        "Departamento": ["Ventas", "Ventas", "Ventas", "Compras"],
+        "Salario_Actual": [1_000.0, 3_000.0, 1_100.0, 2_000.0],
+        "Aumento_(%)": [10.0, 5.0, 10.0, 20.0],
+        "Fecha_Aumento": pd.to_datetime(["2024-03-01", "2024-06-01", "2025-01-15", "2024-09-01"]),
+    }), 36.5, 39.8)
+
+
+def test_evolucion_siempre_por_empleado():
+    for agrupar_por in ("Empleado", BANDA_SALARIAL, "Departamento"):
+        _, evolucion, _ = graficos_visualizacion(aumentos(), agrupar_por)
+        assert sorted(traza.name for traza in evolucion.data) == ["Ana", "Luis", "Marta"]
+        ana = next(traza for traza in evolucion.data if traza.name == "Ana")
+        assert list(ana.y[:3]) == [1_000.0, 1_100.0, 1_210.0]